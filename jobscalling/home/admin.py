@@ -1,6 +1,56 @@
 from django.contrib import admin
+from django.db.models import Q
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html
 from .models import CandidateProfile, CompanyProfile, JobPosting, JobApplication, CandidateResume
-from .models import Review
+from .models import ArchivedJobApplication, ArchivedJobPosting, InterviewSlot, JobAlert, RequestProfile, SlowQuery, Location, Review, ReviewStats, SavedSearch
+from .geo import grid_cell
+from .paginators import EstimatedCountPaginator
+
+
+class PrefixSearchMixin:
+    """
+    Search '^' fields by prefix, case-insensitively, with the whole search
+    term (not word by word). A '^relation__field' entry is matched in a
+    subquery on the related table (relation IN (SELECT ...)), so each branch
+    of the OR can use its table's case-insensitive index (migration 0020)
+    instead of forcing a scan across the join. Entries without '^' keep
+    Django's icontains.
+    """
+    def prefix_search_q(self, term):
+        q = Q()
+        for entry in self.search_fields:
+            if not entry.startswith('^'):
+                q |= Q(**{f'{entry}__icontains': term})
+                continue
+            relation, _, rest = entry[1:].partition('__')
+            if not rest:
+                q |= Q(**{f'{relation}__istartswith': term})
+                continue
+            related = self.model._meta.get_field(relation).related_model
+            q |= Q(**{f'{relation}__in': related._base_manager.filter(**{f'{rest}__istartswith': term}).values('pk')})
+        return q
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        return queryset.filter(self.prefix_search_q(term)), False
+
+
+def text_search_results(queryset, search_term):
+    """
+    (queryset, False) for a "text: ..." search over a posting's description
+    and requirements, None for any other term.
+    """
+    prefix, _, text = search_term.strip().partition(':')
+    if prefix.strip().lower() != 'text' or not text.strip():
+        return None
+    text = text.strip()
+    return queryset.filter(Q(description__icontains=text) | Q(requirements__icontains=text)), False
 
 
 @admin.register(CandidateProfile)
@@ -18,41 +68,262 @@ class CompanyProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(JobPosting)
-class JobPostingAdmin(admin.ModelAdmin):
-    list_display = ('title', 'company', 'job_type', 'location', 'is_active', 'posted_date', 'application_deadline')
-    list_filter = ('job_type', 'is_active', 'posted_date', 'location')
-    search_fields = ('title', 'company__company_name', 'requirements', 'description')
-    date_hierarchy = 'posted_date'
+class JobPostingAdmin(PrefixSearchMixin, admin.ModelAdmin):
+    list_display = ('title', 'company', 'job_type', 'location', 'normalized_location', 'is_remote', 'is_active',
+                    'posted_date', 'application_deadline')
+    # Only the locations postings actually use, not every gazetteer entry
+    list_filter = ('job_type', 'is_active', 'is_remote', 'posted_date',
+                   ('normalized_location', admin.RelatedOnlyFieldListFilter))
+    # Prefix search on indexed CharFields by default; "text:" opts in to the
+    # description/requirements scan, which reads the whole table.
+    search_fields = ('^title', '^company__company_name')
+    search_help_text = 'Title or company name starting with… Prefix with "text:" to search descriptions and requirements (slow).'
+    list_select_related = ('company', 'normalized_location')
+    raw_id_fields = ('company',)
     ordering = ('-posted_date',)
     list_per_page = 20
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        return text_search_results(queryset, search_term) or super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(Location)
+class LocationAdmin(PrefixSearchMixin, admin.ModelAdmin):
+    list_display = ('name', 'key', 'country', 'latitude', 'longitude')
+    list_filter = ('country',)
+    search_fields = ('^name', '^key')
+    readonly_fields = ('grid_lat', 'grid_lon')
+
+    def save_model(self, request, obj, form, change):
+        # Keep the grid cell in step with hand-entered coordinates
+        if obj.latitude is not None and obj.longitude is not None:
+            obj.grid_lat, obj.grid_lon = grid_cell(obj.latitude, obj.longitude)
+        else:
+            obj.grid_lat = obj.grid_lon = None
+        super().save_model(request, obj, form, change)
 
 
 @admin.register(JobApplication)
-class JobApplicationAdmin(admin.ModelAdmin):
+class JobApplicationAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('job', 'candidate', 'status', 'application_date')
     list_filter = ('status', 'application_date')
-    search_fields = ('job__title', 'candidate__full_name')
-    date_hierarchy = 'application_date'
+    search_fields = ('^job__title', '^candidate__full_name')
+    # job.__str__ reads job.company, and __str__ of the row reads candidate and job
+    list_select_related = ('job__company', 'candidate')
+    raw_id_fields = ('job', 'candidate')
     ordering = ('-application_date',)
     list_per_page = 20
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(CandidateResume)
-class CandidateResumeAdmin(admin.ModelAdmin):
+class CandidateResumeAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('original_filename', 'candidate', 'file_size', 'content_type', 'uploaded_at')
-    search_fields = ('original_filename', 'candidate__full_name', 'candidate__user__username')
+    search_fields = ('^original_filename', '^candidate__full_name', '^candidate__user__username')
     list_filter = ('uploaded_at',)
     readonly_fields = ('file_size', 'content_type', 'original_filename', 'uploaded_at')
-    date_hierarchy = 'uploaded_at'
+    list_select_related = ('candidate',)
+    raw_id_fields = ('candidate',)
     ordering = ('-uploaded_at',)
     list_per_page = 20
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
-    list_display = ('name', 'company', 'reviewer_type', 'rating', 'is_active', 'created_at')
-    list_filter = ('reviewer_type', 'is_active', 'created_at', 'rating')
+    list_display = ('name', 'company', 'reviewer_type', 'rating', 'status', 'is_active', 'created_at')
+    list_filter = ('status', 'reviewer_type', 'is_active', 'created_at', 'rating')
     search_fields = ('name', 'company', 'review')
     ordering = ('-created_at',)
-    readonly_fields = ('created_at',)
+    readonly_fields = ('created_at', 'fingerprint', 'submitter_ip', 'moderated_at')
     list_per_page = 25
+    actions = ['approve_reviews', 'reject_reviews']
+
+    @admin.action(description="Approve selected reviews")
+    def approve_reviews(self, request, queryset):
+        updated = queryset.update(status='APPROVED', is_active=True, rejection_reason='', moderated_at=timezone.now())
+        ReviewStats.refresh()
+        self.message_user(request, f"{updated} review(s) approved.")
+
+    @admin.action(description="Reject selected reviews")
+    def reject_reviews(self, request, queryset):
+        updated = queryset.update(status='REJECTED', is_active=False, rejection_reason='manual', moderated_at=timezone.now())
+        ReviewStats.refresh()
+        self.message_user(request, f"{updated} review(s) rejected.")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        ReviewStats.refresh()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        ReviewStats.refresh()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        ReviewStats.refresh()
+
+
+@admin.register(ReviewStats)
+class ReviewStatsAdmin(admin.ModelAdmin):
+    list_display = ('total_count', 'average_rating', 'student_count', 'company_count', 'updated_at')
+    readonly_fields = ('total_count', 'average_rating', 'student_count', 'company_count', 'updated_at')
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(PrefixSearchMixin, admin.ModelAdmin):
+    list_display = ('name', 'candidate', 'last_posted_date', 'created_at')
+    search_fields = ('^name', '^candidate__full_name')
+    list_select_related = ('candidate',)
+    raw_id_fields = ('candidate',)
+
+
+@admin.register(JobAlert)
+class JobAlertAdmin(admin.ModelAdmin):
+    list_display = ('saved_search', 'candidate', 'is_read', 'created_at')
+    list_filter = ('is_read',)
+    list_select_related = ('saved_search', 'candidate')
+    raw_id_fields = ('candidate', 'saved_search', 'jobs')
+
+
+
+@admin.register(InterviewSlot)
+class InterviewSlotAdmin(PrefixSearchMixin, admin.ModelAdmin):
+    list_display = ('job', 'interviewer', 'start', 'end', 'application', 'booked_at')
+    list_filter = ('start',)
+    search_fields = ('^job__title', '^interviewer')
+    list_select_related = ('job__company', 'application__candidate', 'application__job')
+    raw_id_fields = ('job', 'company', 'application')
+    # Times change only through home.interviews, which checks for overlaps
+    readonly_fields = ('start', 'end', 'booked_at')
+
+    def has_add_permission(self, request):
+        return False
+
+class ReadOnlyAdmin(admin.ModelAdmin):
+    # Archive rows are written only by `manage.py archive_jobs`
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ArchivedJobPosting)
+class ArchivedJobPostingAdmin(PrefixSearchMixin, ReadOnlyAdmin):
+    list_display = ('title', 'company', 'job_type', 'posted_date', 'application_count', 'hired_count', 'archived_at')
+    list_filter = ('job_type', 'archived_at')
+    search_fields = ('^title', '^company__company_name')
+    search_help_text = JobPostingAdmin.search_help_text
+    list_select_related = ('company',)
+    raw_id_fields = ('company',)
+    list_per_page = 20
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        return text_search_results(queryset, search_term) or super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(ArchivedJobApplication)
+class ArchivedJobApplicationAdmin(PrefixSearchMixin, ReadOnlyAdmin):
+    list_display = ('job', 'candidate', 'status', 'application_date')
+    list_filter = ('status',)
+    search_fields = ('^job__title', '^candidate__full_name')
+    list_select_related = ('job', 'candidate')
+    raw_id_fields = ('job', 'candidate')
+    list_per_page = 20
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+def _pre(text):
+    return format_html('<pre style="white-space: pre-wrap; font-size: 12px">{}</pre>', text or '-')
+
+
+class SlowQueryInline(admin.TabularInline):
+    model = SlowQuery
+    fields = ('duration_ms', 'origin', 'sql')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+    show_change_link = True
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(PrefixSearchMixin, ReadOnlyAdmin):
+    list_display = ('created_at', 'method', 'path', 'view', 'mode', 'status_code', 'duration_ms', 'query_count',
+                    'query_ms')
+    list_filter = ('mode', 'view')
+    search_fields = ('^path', '^view')
+    date_hierarchy = 'created_at'
+    fields = ('created_at', 'method', 'path', 'view', 'user', 'mode', 'status_code', 'duration_ms', 'query_count',
+              'query_ms', 'downloads', 'stats_text')
+    readonly_fields = fields
+    inlines = [SlowQueryInline]
+
+    @admin.display(description='Profile')
+    def stats_text(self, obj):
+        return _pre(obj.stats)
+
+    @admin.display(description='Download')
+    def downloads(self, obj):
+        links = []
+        if obj.flame:
+            links.append(format_html('<a href="{}">collapsed stacks</a> (speedscope, flamegraph.pl)',
+                                     reverse('admin:home_requestprofile_flame', args=[obj.pk])))
+        if obj.raw:
+            links.append(format_html('<a href="{}">cProfile dump</a> (snakeviz, pstats)',
+                                     reverse('admin:home_requestprofile_raw', args=[obj.pk])))
+        return format_html(' &middot; '.join(['{}'] * len(links)), *links) if links else '-'
+
+    def get_urls(self):
+        return [
+            path('<int:pk>/flame.txt', self.admin_site.admin_view(self.flame_view), name='home_requestprofile_flame'),
+            path('<int:pk>/profile.prof', self.admin_site.admin_view(self.raw_view), name='home_requestprofile_raw'),
+        ] + super().get_urls()
+
+    def _attachment(self, request, content, content_type, filename):
+        if not self.has_view_permission(request):
+            return HttpResponse(status=403)
+        response = HttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def flame_view(self, request, pk):
+        profile = get_object_or_404(RequestProfile.objects.only('flame'), pk=pk)
+        return self._attachment(request, profile.flame, 'text/plain; charset=utf-8', f'profile-{pk}.folded.txt')
+
+    def raw_view(self, request, pk):
+        profile = get_object_or_404(RequestProfile.objects.only('raw'), pk=pk)
+        return self._attachment(request, bytes(profile.raw or b''), 'application/octet-stream', f'profile-{pk}.prof')
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(PrefixSearchMixin, ReadOnlyAdmin):
+    list_display = ('created_at', 'duration_ms', 'view', 'origin', 'database', 'sql_preview')
+    list_filter = ('view', 'database')
+    search_fields = ('^view', 'origin')
+    date_hierarchy = 'created_at'
+    fields = ('created_at', 'duration_ms', 'database', 'view', 'origin', 'path', 'profile', 'sql_text', 'plan_text')
+    readonly_fields = fields
+    list_select_related = ('profile',)
+
+    @admin.display(description='SQL')
+    def sql_preview(self, obj):
+        return obj.sql[:120]
+
+    @admin.display(description='SQL')
+    def sql_text(self, obj):
+        return _pre(obj.sql)
+
+    @admin.display(description='Plan')
+    def plan_text(self, obj):
+        return _pre(obj.plan)
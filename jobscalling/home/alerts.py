@@ -0,0 +1,175 @@
+"""
+Saved searches and their new-job alerts.
+
+A SavedSearch stores the candidate dashboard's filter parameters plus a
+high-water mark: the (posted_date, id) of the newest posting it has been
+checked against. `match_new_jobs()` (run by the `match_saved_searches`
+command) reads postings past the lowest mark once, in keyset batches, and
+hands each posting only to the searches that could match it: identical
+searches are evaluated once, and searches are indexed by one of their
+facet values so a posting is tested against few of them. Matches for a
+search in one run become a single JobAlert. Cost grows with new postings,
+not with the total number of postings.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .facets import FACETS, facet_label, facet_values, selected_filters
+from .geo import DEFAULT_RADIUS, haversine_km, parse_location, parse_radius
+from .models import JobAlert, JobPosting, Location, SavedSearch
+
+MAX_SAVED_SEARCHES = 10
+
+
+def _setting(name, default):
+    return getattr(settings, 'SAVED_SEARCHES', {}).get(name, default)
+
+
+def search_filters(params):
+    """
+    The dashboard's search parameters (facets plus near/radius) from a
+    QueryDict, normalized so equal searches compare equal.
+    """
+    filters = selected_filters(params)
+    near = params.get('near', '').strip()
+    if near:
+        filters['near'] = near
+        filters['radius'] = parse_radius(params.get('radius'))
+    return filters
+
+
+def describe(filters):
+    """
+    Default name for a saved search, e.g. "Full-time, Dhaka, within 25 km of Gazipur".
+    """
+    names = {}
+    if filters.get('location'):
+        names = dict(Location.objects.filter(key=filters['location']).values_list('key', 'name'))
+    parts = [facet_label(facet, filters[facet], names) for facet in FACETS if facet in filters]
+    if 'near' in filters:
+        parts.append(f"within {filters.get('radius', DEFAULT_RADIUS)} km of {filters['near']}")
+    return ', '.join(parts)[:100] or 'All jobs'
+
+
+class _Matcher:
+    """
+    One distinct set of filters, shared by every search that uses it.
+    """
+
+    def __init__(self, filters):
+        self.pairs = {(facet, filters[facet]) for facet in FACETS if facet in filters}
+        self.center = None
+        self.radius = None
+        if 'near' in filters:
+            place = parse_location(filters['near'])
+            # An unknown place can never match, same as on the dashboard
+            self.center = (place.latitude, place.longitude) if place.latitude is not None else False
+            self.radius = filters.get('radius', DEFAULT_RADIUS)
+        # Index on one equality predicate; location is usually the most selective
+        self.anchor = next(
+            (pair for facet in ('location', 'job_type', 'salary_band', 'industry')
+             for pair in self.pairs if pair[0] == facet),
+            None,
+        )
+        self.searches = []
+
+    def matches(self, job_pairs, job):
+        if not self.pairs <= job_pairs:
+            return False
+        if self.center is not None:
+            place = job.normalized_location
+            if not self.center or place is None or place.latitude is None:
+                return False
+            if haversine_km(*self.center, place.latitude, place.longitude) > self.radius:
+                return False
+        return True
+
+
+def _job_pairs(job):
+    location_key = job.normalized_location.key if job.normalized_location_id else ''
+    return set(facet_values(True, job.job_type, location_key, job.is_remote, job.salary_band,
+                            job.company.industry))
+
+
+def _after(mark_date, mark_id):
+    return Q(posted_date__gt=mark_date) | Q(posted_date=mark_date, id__gt=mark_id)
+
+
+def match_new_jobs(batch_size=500):
+    """
+    Check postings newer than each search's high-water mark and record one
+    alert per search with matches. Returns (postings scanned, alerts created).
+    """
+    searches = list(SavedSearch.objects.all())
+    if not searches:
+        return 0, 0
+
+    matchers = {}
+    for search in searches:
+        signature = tuple(sorted(search.filters.items()))
+        if signature not in matchers:
+            matchers[signature] = _Matcher(search.filters)
+        matchers[signature].searches.append(search)
+    anchored = defaultdict(list)
+    unanchored = []
+    for matcher in matchers.values():
+        if matcher.anchor:
+            anchored[matcher.anchor].append(matcher)
+        else:
+            unanchored.append(matcher)
+
+    # Stay a little behind "now": a posting committed late with an earlier
+    # posted_date must not land behind a mark that has already moved past it.
+    cutoff = timezone.now() - timedelta(seconds=_setting('LAG_SECONDS', 60))
+    mark = min((search.last_posted_date, search.last_job_id) for search in searches)
+    matched = defaultdict(list)
+    scanned = 0
+    last_seen = None
+    while True:
+        batch = list(
+            JobPosting.objects.filter(_after(*mark), is_active=True, posted_date__lte=cutoff)
+            .select_related('company', 'normalized_location')
+            .only('id', 'posted_date', 'job_type', 'is_remote', 'salary_band', 'company__industry',
+                  'normalized_location__key', 'normalized_location__latitude',
+                  'normalized_location__longitude')
+            .order_by('posted_date', 'id')[:batch_size]
+        )
+        for job in batch:
+            job_pairs = _job_pairs(job)
+            candidates = list(unanchored)
+            for pair in job_pairs:
+                candidates.extend(anchored.get(pair, ()))
+            for matcher in candidates:
+                if not matcher.matches(job_pairs, job):
+                    continue
+                for search in matcher.searches:
+                    if (job.posted_date, job.id) > (search.last_posted_date, search.last_job_id):
+                        matched[search.pk].append(job.id)
+        scanned += len(batch)
+        if batch:
+            last_seen = mark = (batch[-1].posted_date, batch[-1].id)
+        if len(batch) < batch_size:
+            break
+
+    with transaction.atomic():
+        alerts = 0
+        for search in searches:
+            job_ids = matched.get(search.pk)
+            if job_ids:
+                alert = JobAlert.objects.create(candidate_id=search.candidate_id, saved_search=search)
+                alert.jobs.add(*job_ids)
+                alerts += 1
+        if last_seen is not None:
+            # Every search has now been checked up to the last posting read
+            moved = []
+            for search in searches:
+                if last_seen > (search.last_posted_date, search.last_job_id):
+                    search.last_posted_date, search.last_job_id = last_seen
+                    moved.append(search)
+            SavedSearch.objects.bulk_update(moved, ['last_posted_date', 'last_job_id'])
+    return scanned, alerts
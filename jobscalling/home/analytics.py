@@ -0,0 +1,285 @@
+"""
+Company analytics backed by rollup tables.
+
+`rollup()` (run by the `rollup_analytics` command) folds new JobApplication
+rows and ApplicationStatusEvent rows into JobDailyStats / JobFunnelStats,
+resuming from the id high-water marks in RollupCheckpoint. Each batch and
+its checkpoint commit together, so a crashed run never double counts.
+The dashboard reads only the rollups, so its cost does not grow with
+application history.
+
+Ids are assigned at INSERT but become visible at COMMIT, so a lower id can
+appear after a higher one was rolled up. The ids a batch skips are kept on
+the checkpoint and re-read by later batches for GAP_SECONDS; ids that never
+show up (rolled back or deleted) then expire.
+
+Funnel stages count applications, not transitions: ApplicationFunnel keeps
+the stages already counted for each application, so REVIEWED -> PENDING ->
+REVIEWED is one reviewed application.
+"""
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import (
+    ApplicationFunnel,
+    ApplicationStatusEvent,
+    JobApplication,
+    JobDailyStats,
+    JobFunnelStats,
+    RollupCheckpoint,
+)
+
+# Funnel stages in order; REJECTED is counted separately
+STAGES = ['PENDING', 'REVIEWED', 'INTERVIEW', 'OFFER', 'HIRED']
+STAGE_FIELDS = {
+    'REVIEWED': 'reached_reviewed',
+    'INTERVIEW': 'reached_interview',
+    'OFFER': 'reached_offer',
+    'HIRED': 'hired',
+}
+# ApplicationFunnel.flags
+STAGE_FLAGS = {'REVIEWED': 1, 'INTERVIEW': 2, 'OFFER': 4, 'HIRED': 8}
+REJECTED = 16
+LEFT_PENDING = 32  # counted in time-to-review
+CHART_DAYS = 30
+GAP_SECONDS = 60 * 60
+MAX_GAPS = 1000
+
+
+def _bump(model, key, defaults, deltas):
+    """
+    Add `deltas` to the row identified by `key`, creating it if needed.
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    row, created = model.objects.get_or_create(**key, defaults=defaults)
+    model.objects.filter(pk=row.pk).update(**{field: F(field) + value for field, value in deltas.items()})
+
+
+def _checkpoint(name):
+    checkpoint, _ = RollupCheckpoint.objects.select_for_update().get_or_create(name=name)
+    return checkpoint
+
+
+def _read_batch(checkpoint, queryset, fields, batch_size):
+    """
+    The next rows past the checkpoint plus any skipped ids below it that
+    have committed since. Moves the checkpoint's last_id and gaps along;
+    the caller saves it with the batch.
+    """
+    gaps = {int(pk): seen for pk, seen in checkpoint.gaps.items()}
+    late = list(queryset.filter(id__in=list(gaps)).values(*fields)) if gaps else []
+    rows = list(queryset.filter(id__gt=checkpoint.last_id).order_by('id').values(*fields)[:batch_size])
+    now = time.time()
+    for row in late:
+        del gaps[row['id']]
+    previous = checkpoint.last_id
+    for row in rows:
+        for missing in range(max(previous + 1, row['id'] - MAX_GAPS), row['id']):
+            gaps[missing] = now
+        previous = row['id']
+    live = sorted(pk for pk, seen in gaps.items() if now - seen < GAP_SECONDS)[-MAX_GAPS:]
+    checkpoint.gaps = {str(pk): gaps[pk] for pk in live}
+    if rows:
+        checkpoint.last_id = rows[-1]['id']
+    return late + rows
+
+
+def _save_checkpoint(checkpoint):
+    checkpoint.save(update_fields=['last_id', 'gaps', 'updated_at'])
+
+
+def rollup_applications(batch_size=1000):
+    """
+    Count new applications per job and day. Returns rows processed.
+    """
+    with transaction.atomic():
+        checkpoint = _checkpoint('applications')
+        old_gaps = checkpoint.gaps
+        rows = _read_batch(checkpoint, JobApplication.objects.all(),
+                           ('id', 'job_id', 'job__company_id', 'application_date'), batch_size)
+        if not rows:
+            if checkpoint.gaps != old_gaps:
+                _save_checkpoint(checkpoint)
+            return 0
+
+        daily = defaultdict(int)
+        totals = defaultdict(int)
+        companies = {}
+        for row in rows:
+            day = timezone.localdate(row['application_date'])
+            daily[(row['job_id'], day)] += 1
+            totals[row['job_id']] += 1
+            companies[row['job_id']] = row['job__company_id']
+
+        for (job_id, day), count in daily.items():
+            _bump(JobDailyStats, {'job_id': job_id, 'date': day},
+                  {'company_id': companies[job_id]}, {'applications': count})
+        for job_id, count in totals.items():
+            _bump(JobFunnelStats, {'job_id': job_id}, {'company_id': companies[job_id]}, {'total': count})
+
+        _save_checkpoint(checkpoint)
+        return len(rows)
+
+
+def _stage(status):
+    return STAGES.index(status) if status in STAGES else None
+
+
+def event_flags(from_status, to_status):
+    """
+    The funnel flags a status change earns its application. Reaching a
+    stage implies the earlier ones (PENDING -> INTERVIEW was reviewed too).
+    """
+    to_stage = _stage(to_status)
+    flags = sum(STAGE_FLAGS[stage] for stage in STAGES[1:to_stage + 1]) if to_stage else 0
+    if to_status == 'REJECTED':
+        flags |= REJECTED
+    if from_status == 'PENDING' and to_status != 'PENDING':
+        flags |= LEFT_PENDING
+    return flags
+
+
+def _save_flags(counted, existing, changed):
+    ApplicationFunnel.objects.bulk_create([
+        ApplicationFunnel(application_id=application_id, flags=counted[application_id])
+        for application_id in changed if application_id not in existing
+    ])
+    by_flags = defaultdict(list)
+    for application_id in changed:
+        if application_id in existing:
+            by_flags[counted[application_id]].append(application_id)
+    for flags, application_ids in by_flags.items():
+        ApplicationFunnel.objects.filter(application_id__in=application_ids).update(flags=flags)
+
+
+def rollup_status_events(batch_size=1000):
+    """
+    Fold status-change events into the funnel and time-to-review rollups.
+    """
+    with transaction.atomic():
+        checkpoint = _checkpoint('status_events')
+        old_gaps = checkpoint.gaps
+        events = _read_batch(
+            checkpoint, ApplicationStatusEvent.objects.all(),
+            ('id', 'application_id', 'job_id', 'job__company_id', 'from_status', 'to_status', 'created_at',
+             'application__application_date'),
+            batch_size,
+        )
+        if not events:
+            if checkpoint.gaps != old_gaps:
+                _save_checkpoint(checkpoint)
+            return 0
+
+        counted = dict(
+            ApplicationFunnel.objects.filter(application_id__in={event['application_id'] for event in events})
+            .values_list('application_id', 'flags')
+        )
+        existing = set(counted)
+        changed = set()
+        daily = defaultdict(lambda: defaultdict(int))
+        funnel = defaultdict(lambda: defaultdict(int))
+        companies = {}
+        for event in events:
+            job_id = event['job_id']
+            companies[job_id] = event['job__company_id']
+            day = timezone.localdate(event['created_at'])
+            if event['from_status']:
+                daily[(job_id, day)]['status_changes'] += 1
+
+            application_id = event['application_id']
+            # An empty from_status is the creation (or seeded) event
+            new = event_flags(event['from_status'], event['to_status']) & ~counted.get(application_id, 0)
+            if not new:
+                continue
+            counted[application_id] = counted.get(application_id, 0) | new
+            changed.add(application_id)
+            for stage, flag in STAGE_FLAGS.items():
+                if new & flag:
+                    funnel[job_id][STAGE_FIELDS[stage]] += 1
+            if new & REJECTED:
+                funnel[job_id]['rejected'] += 1
+            if new & LEFT_PENDING:
+                seconds = max(int((event['created_at'] - event['application__application_date']).total_seconds()), 0)
+                funnel[job_id]['reviewed_count'] += 1
+                funnel[job_id]['review_seconds'] += seconds
+                daily[(job_id, day)]['reviewed'] += 1
+                daily[(job_id, day)]['review_seconds'] += seconds
+
+        for (job_id, day), deltas in daily.items():
+            _bump(JobDailyStats, {'job_id': job_id, 'date': day}, {'company_id': companies[job_id]}, deltas)
+        for job_id, deltas in funnel.items():
+            _bump(JobFunnelStats, {'job_id': job_id}, {'company_id': companies[job_id]}, deltas)
+        _save_flags(counted, existing, changed)
+
+        _save_checkpoint(checkpoint)
+        return len(events)
+
+
+def rollup(batch_size=1000):
+    """
+    Drain both streams. Returns (applications, events) processed.
+    """
+    applications = events = 0
+    while True:
+        processed = rollup_applications(batch_size)
+        applications += processed
+        if processed < batch_size:
+            break
+    while True:
+        processed = rollup_status_events(batch_size)
+        events += processed
+        if processed < batch_size:
+            break
+    return applications, events
+
+
+def company_analytics(company):
+    """
+    Dashboard data for one company, read from the rollups only.
+    """
+    today = timezone.localdate()
+    start = today - timedelta(days=CHART_DAYS - 1)
+    per_day = dict(
+        JobDailyStats.objects.filter(company=company, date__gte=start)
+        .values_list('date').annotate(n=Sum('applications')).order_by()
+    )
+    peak = max(per_day.values(), default=0) or 1
+    daily = []
+    for offset in range(CHART_DAYS):
+        day = start + timedelta(days=offset)
+        count = per_day.get(day, 0)
+        daily.append({'date': day, 'count': count, 'pct': round(count * 100 / peak)})
+
+    sums = JobFunnelStats.objects.filter(company=company).aggregate(
+        total=Sum('total'),
+        reviewed=Sum('reached_reviewed'),
+        interview=Sum('reached_interview'),
+        offer=Sum('reached_offer'),
+        hired=Sum('hired'),
+        rejected=Sum('rejected'),
+    )
+    total = sums['total'] or 0
+    funnel = []
+    for label, key in (('Applied', 'total'), ('Reviewed', 'reviewed'), ('Interview', 'interview'),
+                       ('Offer', 'offer'), ('Hired', 'hired')):
+        count = sums[key] or 0
+        funnel.append({'label': label, 'count': count, 'pct': round(count * 100 / total) if total else 0})
+
+    per_job = (
+        JobFunnelStats.objects.filter(company=company)
+        .select_related('job')
+        .order_by('-job__posted_date')[:10]
+    )
+    return {
+        'daily': daily,
+        'funnel': funnel,
+        'totals': {key: value or 0 for key, value in sums.items()},
+        'per_job': per_job,
+    }
@@ -0,0 +1,235 @@
+"""
+Typeahead suggestions for job titles, company names and skills.
+
+Every process keeps a PrefixIndex in memory: a sorted list of
+(key, kind, label) tuples, where the keys are a label's casefolded text
+from each word onwards, so "py" finds "Senior Python Developer". A lookup
+is two bisects plus a scan of the matching range, ranked by how many
+active postings use the label. No query reaches the database per
+keystroke.
+
+Suggestions come from active postings:
+- the title
+- the company name
+- short phrases from `requirements` (split on commas, semicolons, slashes
+  and line breaks)
+Each posting's contribution is remembered, so a change re-indexes just
+that posting. The signal handlers stamp changed job ids in the
+SuggestionChange table, inside the transaction that made the change. Each
+process reads the rows stamped since its last sync (less OVERLAP, for
+transactions that committed late) at most every SYNC_SECONDS, the process
+that made the change on its next lookup, and rebuilds from scratch only
+when it has fallen behind the pruned log. Replaying a posting twice is
+harmless: it is re-read from its current row.
+"""
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import JobPosting, SuggestionChange
+
+KINDS = ('title', 'company', 'skill')
+LIMIT = 8
+MAX_SKILL_WORDS = 3
+SYNC_SECONDS = 2
+# More changes than this since the last sync: rebuilding is cheaper than replaying
+MAX_REPLAY = 500
+CHANGE_TTL = timedelta(hours=1)
+# A change is stamped before its transaction commits; re-read this far back
+OVERLAP = timedelta(seconds=60)
+MEMO_SIZE = 2048
+
+_SKILL_SPLIT = re.compile(r'[,;/|\n\r•]+|\s[-–]\s|\band\b', re.IGNORECASE)
+_WORD_START = re.compile(r'(?:^|(?<=[\s(\-/]))\w')
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split())
+
+
+def skill_phrases(requirements):
+    phrases = set()
+    for part in _SKILL_SPLIT.split(requirements or ''):
+        part = part.strip(' .:*()"\'\t')
+        if 2 <= len(part) <= 40 and len(part.split()) <= MAX_SKILL_WORDS:
+            phrases.add(part)
+    return phrases
+
+
+def job_entries(title, company_name, requirements):
+    """
+    {(kind, normalized label): label} for one posting; "python" and
+    "Python" are one suggestion.
+    """
+    labels = [('title', title or ''), ('company', company_name or '')]
+    labels += [('skill', phrase) for phrase in skill_phrases(requirements)]
+    return {(kind, normalize(label)): ' '.join(label.split()) for kind, label in labels if label.strip()}
+
+
+def _keys(text):
+    return {text[match.start():] for match in _WORD_START.finditer(text)}
+
+
+class PrefixIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = Counter()
+        self.labels = {}
+        self.keys = []
+        self.by_job = {}
+        self.synced_at = None
+        # {job_id: changed_at} replayed already but still inside OVERLAP
+        self.applied = {}
+        self.next_sync = 0.0
+        self._memo = {}
+
+    def _add(self, entry, label):
+        self.counts[entry] += 1
+        if self.counts[entry] == 1:
+            self.labels[entry] = label  # the first spelling seen is shown
+            for key in _keys(entry[1]):
+                insort(self.keys, (key,) + entry)
+
+    def _remove(self, entry):
+        self.counts[entry] -= 1
+        if self.counts[entry] <= 0:
+            del self.counts[entry]
+            del self.labels[entry]
+            for key in _keys(entry[1]):
+                position = bisect_left(self.keys, (key,) + entry)
+                if position < len(self.keys) and self.keys[position] == (key,) + entry:
+                    del self.keys[position]
+
+    def build(self):
+        """
+        Index every active posting from scratch, sorting once at the end.
+        """
+        started = timezone.now()
+        counts, labels, by_job = Counter(), {}, {}
+        rows = (
+            JobPosting.objects.filter(is_active=True)
+            .values_list('id', 'title', 'company__company_name', 'requirements')
+            .iterator(chunk_size=2000)
+        )
+        for job_id, title, company_name, requirements in rows:
+            entries = job_entries(title, company_name, requirements)
+            by_job[job_id] = entries
+            counts.update(entries.keys())
+            for entry, label in entries.items():
+                labels.setdefault(entry, label)
+        keys = sorted({(key,) + entry for entry in counts for key in _keys(entry[1])})
+        with self._lock:
+            self.counts, self.labels, self.keys, self.by_job = counts, labels, keys, by_job
+            self.synced_at, self.applied = started, {}
+            self._memo = {}
+
+    def apply_jobs(self, job_ids):
+        """
+        Re-index the given postings from their current rows (deleted or
+        inactive ones drop out).
+        """
+        rows = {
+            job_id: job_entries(title, company_name, requirements)
+            for job_id, title, company_name, requirements in JobPosting.objects.filter(
+                id__in=job_ids, is_active=True,
+            ).values_list('id', 'title', 'company__company_name', 'requirements')
+        }
+        with self._lock:
+            for job_id in job_ids:
+                for entry in self.by_job.pop(job_id, ()):
+                    self._remove(entry)
+                for entry, label in rows.get(job_id, {}).items():
+                    self._add(entry, label)
+                if job_id in rows:
+                    self.by_job[job_id] = rows[job_id]
+            self._memo = {}
+
+    def sync(self):
+        """
+        Replay changes logged by any process since the last sync.
+        """
+        now = time.monotonic()
+        if now < self.next_sync:
+            return
+        self.next_sync = now + SYNC_SECONDS
+        started = timezone.now()
+        since = self.synced_at - OVERLAP
+        if since < started - CHANGE_TTL:
+            self.build()  # rows this index has not seen may have been pruned
+            return
+        # More rows than this means more than MAX_REPLAY not yet applied
+        limit = MAX_REPLAY + len(self.applied) + 1
+        changes = list(
+            SuggestionChange.objects.filter(changed_at__gte=since).values_list('job_id', 'changed_at')[:limit]
+        )
+        if len(changes) == limit:
+            self.build()
+            return
+        job_ids = {job_id for job_id, changed_at in changes if self.applied.get(job_id) != changed_at}
+        if job_ids:
+            self.apply_jobs(job_ids)
+        horizon = started - OVERLAP
+        self.applied = {job_id: changed_at for job_id, changed_at in changes if changed_at >= horizon}
+        self.synced_at = started
+
+    def search(self, query, kinds=KINDS, limit=LIMIT):
+        """
+        Up to `limit` (kind, label, count) for labels with a word starting
+        with `query`, most used first.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        memo_key = (prefix, kinds, limit)
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                return cached
+            low = bisect_left(self.keys, (prefix,))
+            high = bisect_left(self.keys, (prefix + '\U0010ffff',), low)
+            entries = {(kind, text) for _key, kind, text in self.keys[low:high] if kind in kinds}
+            # Most postings first, then labels that start with the prefix, then shorter ones
+            ranked = heapq.nsmallest(limit, entries, key=lambda entry: (
+                -self.counts[entry], not entry[1].startswith(prefix), len(entry[1]), entry[1],
+            ))
+            results = [(entry[0], self.labels[entry], self.counts[entry]) for entry in ranked]
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo = {}
+            self._memo[memo_key] = results
+            return results
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = PrefixIndex()
+                index.build()
+                _index = index
+    _index.sync()
+    return _index
+
+
+def log_changes(job_ids):
+    """
+    Record changed postings for every process's index (signal handlers).
+    """
+    now = timezone.now()
+    SuggestionChange.objects.bulk_create(
+        [SuggestionChange(job_id=job_id, changed_at=now) for job_id in job_ids],
+        update_conflicts=True, unique_fields=['job_id'], update_fields=['changed_at'],
+    )
+    SuggestionChange.objects.filter(changed_at__lt=now - CHANGE_TTL).delete()
+    if _index is not None:
+        _index.next_sync = 0.0  # this process picks the change up on its next lookup
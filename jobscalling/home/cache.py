@@ -0,0 +1,134 @@
+"""
+Cache-aside snapshots of JobPosting rows together with their CompanyProfile.
+
+Reads go L1 (process-local cache, short TTL) -> L2 (shared cache) -> DB.
+Keys carry SNAPSHOT_VERSION so a change to the snapshot format never reads
+old entries. Snapshots map attnames to values, so a field added later is
+simply missing from older entries and loads lazily instead of breaking
+them. Entries are dropped by the post_save/post_delete handlers in
+`home.signals`; the short L1 TTL bounds staleness in other processes.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import CompanyProfile, JobPosting
+
+SNAPSHOT_VERSION = 3
+
+# Striped locks: bounded memory, and misses on different keys rarely contend
+_fill_locks = [threading.Lock() for _ in range(64)]
+
+
+def _setting(name, default):
+    return getattr(settings, 'JOB_CACHE', {}).get(name, default)
+
+
+def _l1():
+    return caches[_setting('L1_ALIAS', 'local')]
+
+
+def _l2():
+    return caches[_setting('L2_ALIAS', 'default')]
+
+
+def job_key(pk):
+    return f"jobsnap:v{SNAPSHOT_VERSION}:job:{pk}"
+
+
+def _values(instance):
+    return {f.attname: getattr(instance, f.attname) for f in instance._meta.concrete_fields}
+
+
+def _from_snapshot(model, values):
+    # Fields absent from the snapshot are left deferred (fetched on access)
+    names = [f.attname for f in model._meta.concrete_fields if f.attname in values]
+    return model.from_db('default', names, [values[name] for name in names])
+
+
+def serialize_job(job):
+    return {
+        'job': _values(job),
+        'company': _values(job.company),
+    }
+
+
+def deserialize_job(snapshot):
+    """
+    Rebuild a JobPosting with its company attached, as if loaded from the DB.
+    """
+    job = _from_snapshot(JobPosting, snapshot['job'])
+    job.company = _from_snapshot(CompanyProfile, snapshot['company'])
+    return job
+
+
+def _fill_lock(key):
+    return _fill_locks[hash(key) % len(_fill_locks)]
+
+
+def get_job_snapshot(pk):
+    """
+    Return the JobPosting (with company preloaded) for `pk`, or None if it
+    does not exist. Concurrent misses for the same key are collapsed to a
+    single DB load: threads in this process share a lock, and processes
+    share an L2 `add()` lock while the winner fills the cache.
+    """
+    key = job_key(pk)
+    snapshot = _l1().get(key)
+    if snapshot is None:
+        snapshot = _l2().get(key)
+        if snapshot is None:
+            snapshot = _load_with_lock(pk, key)
+            if snapshot is None:
+                return None
+        _l1().set(key, snapshot, _setting('L1_TTL', 5))
+    return deserialize_job(snapshot)
+
+
+def _load_with_lock(pk, key):
+    l2 = _l2()
+    lock_key = f"{key}:lock"
+    lock_ttl = _setting('LOCK_TTL', 10)
+    with _fill_lock(key):
+        snapshot = l2.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        acquired = l2.add(lock_key, 1, lock_ttl)
+        if not acquired:
+            # Another process is filling: wait briefly for its result
+            deadline = time.monotonic() + _setting('LOCK_WAIT', 1.0)
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                snapshot = l2.get(key)
+                if snapshot is not None:
+                    return snapshot
+            # Fall through and load it ourselves rather than fail the request,
+            # leaving the other process's lock in place
+
+        try:
+            job = JobPosting.objects.select_related('company').filter(pk=pk).first()
+            if job is None:
+                return None
+            snapshot = serialize_job(job)
+            l2.set(key, snapshot, _setting('L2_TTL', 300))
+            return snapshot
+        finally:
+            if acquired:
+                l2.delete(lock_key)
+
+
+def invalidate_job(pk):
+    key = job_key(pk)
+    _l2().delete(key)
+    _l1().delete(key)
+
+
+def invalidate_company(company_id):
+    """
+    Drop every cached job of a company (its profile is embedded in each).
+    """
+    for pk in JobPosting.objects.filter(company_id=company_id).values_list('pk', flat=True):
+        invalidate_job(pk)
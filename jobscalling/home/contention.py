@@ -0,0 +1,97 @@
+"""
+Retrying writes that lose a lock race, and counting how often it happens.
+
+SQLite has a single writer. A concurrent apply or upload that cannot get the
+lock within the busy timeout fails with "database is locked". PostgreSQL
+reports deadlocks and serialization failures the same way, as
+OperationalError. `retry_on_contention()` re-runs the whole transaction a
+bounded number of times. Between attempts it sleeps a random
+("full jitter") exponential backoff, so competing retries spread out
+instead of colliding again.
+
+Per-operation counters (calls, retries, exhausted, duplicates) live in the
+default cache, so in production every worker adds to the same numbers.
+`manage.py contention_stats` prints them as rates.
+"""
+import logging
+import random
+import time
+
+from django.core.cache import cache
+from django.db import OperationalError, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 4
+BASE_DELAY = 0.05
+MAX_DELAY = 1.0
+COUNTERS = ('calls', 'retries', 'exhausted', 'duplicates')
+OPERATIONS = ('apply', 'upload-cv')
+METRIC_TIMEOUT = 7 * 24 * 3600
+
+_LOCK_ERRORS = (
+    'database is locked',
+    'database table is locked',
+    'deadlock detected',
+    'could not serialize access',
+    'lock wait timeout',
+)
+
+
+def is_lock_error(exc):
+    return isinstance(exc, OperationalError) and any(text in str(exc).lower() for text in _LOCK_ERRORS)
+
+
+def _key(operation, counter):
+    return f'contention:{operation}:{counter}'
+
+
+def count(operation, counter):
+    try:
+        cache.add(_key(operation, counter), 0, METRIC_TIMEOUT)
+        cache.incr(_key(operation, counter))
+    except Exception:
+        # Metrics must never fail the request they describe
+        logger.debug("could not count %s %s", operation, counter, exc_info=True)
+
+
+def stats(operations=OPERATIONS):
+    values = cache.get_many([_key(operation, counter) for operation in operations for counter in COUNTERS])
+    return {
+        operation: {counter: values.get(_key(operation, counter), 0) for counter in COUNTERS}
+        for operation in operations
+    }
+
+
+def reset(operations=OPERATIONS):
+    cache.delete_many([_key(operation, counter) for operation in operations for counter in COUNTERS])
+
+
+def backoff(attempt):
+    return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+
+
+def retry_on_contention(operation, func):
+    """
+    Call `func()` in its own transaction, retrying on lock errors. Other
+    errors (IntegrityError included) propagate at once. Inside an outer
+    transaction nothing can be retried, so `func` runs once.
+    """
+    count(operation, 'calls')
+    if connection.in_atomic_block:
+        return func()
+    attempt = 1
+    while True:
+        try:
+            with transaction.atomic():
+                return func()
+        except OperationalError as exc:
+            if not is_lock_error(exc):
+                raise
+            if attempt >= MAX_ATTEMPTS:
+                count(operation, 'exhausted')
+                logger.warning("%s: gave up after %d attempts (%s)", operation, attempt, exc)
+                raise
+            count(operation, 'retries')
+            time.sleep(backoff(attempt))
+            attempt += 1
@@ -0,0 +1,236 @@
+"""
+Copy the data of one database alias into another (`manage.py migrate_database`),
+e.g. from the SQLite file to PostgreSQL, without loading whole tables into memory.
+
+The target must already have the schema (`manage.py migrate --database <target>`).
+Tables are copied parents first, so every foreign key points at a row that is
+already there. Each table is read in primary-key order through a streaming
+cursor (server-side on PostgreSQL) and written in batches: COPY on PostgreSQL
+with psycopg 3, executemany INSERTs elsewhere. Values are written as stored,
+without model save() or signals, so auto_now timestamps are preserved.
+
+Each batch commits together with a checkpoint row (the last primary key copied)
+in CHECKPOINT_TABLE on the target. After an interruption, the next run resumes
+after that key. Once every table is copied, row counts and an order-independent
+checksum of every row are compared on both sides.
+"""
+import datetime
+import hashlib
+import json
+import time
+from decimal import Decimal
+from itertools import islice
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connections, transaction
+
+CHECKPOINT_TABLE = 'migrate_database_checkpoint'
+# Rows `migrate` creates on the target by itself; replaced by the source's rows
+RECREATED_BY_MIGRATE = ['auth.permission', 'contenttypes.contenttype', 'home.reviewstats']
+
+
+class CopyError(Exception):
+    pass
+
+
+def copyable_models(app_labels=None):
+    """
+    Models with their own table (auto-created M2M tables included), parents
+    before the models that point at them.
+    """
+    configs = [apps.get_app_config(label) for label in app_labels] if app_labels else apps.get_app_configs()
+    models = [
+        model for config in configs for model in config.get_models(include_auto_created=True)
+        if model._meta.managed and not model._meta.proxy
+    ]
+    pending = {model: {
+        field.related_model for field in model._meta.concrete_fields
+        if field.is_relation and field.related_model is not model and field.related_model in models
+    } for model in models}
+    ordered = []
+    while pending:
+        ready = [model for model, parents in pending.items() if not parents]
+        if not ready:
+            names = ', '.join(model._meta.label for model in pending)
+            raise CopyError(f"Foreign keys form a cycle between {names}.")
+        for model in ready:
+            del pending[model]
+            ordered.append(model)
+        for parents in pending.values():
+            parents.difference_update(ready)
+    return ordered
+
+
+def _quote(connection, name):
+    return connection.ops.quote_name(name)
+
+
+def ensure_checkpoint_table(target):
+    connection = connections[target]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} "
+            "(model VARCHAR(200) PRIMARY KEY, last_pk TEXT, copied BIGINT NOT NULL, done BOOLEAN NOT NULL)"
+        )
+
+
+def read_checkpoints(target):
+    with connections[target].cursor() as cursor:
+        cursor.execute(f"SELECT model, last_pk, copied, done FROM {CHECKPOINT_TABLE}")
+        return {
+            model: {'last_pk': json.loads(last_pk) if last_pk else None, 'copied': copied, 'done': bool(done)}
+            for model, last_pk, copied, done in cursor.fetchall()
+        }
+
+
+def _save_checkpoint(target, label, last_pk, copied, done):
+    values = [json.dumps(last_pk, default=str) if last_pk is not None else None, copied, done, label]
+    with connections[target].cursor() as cursor:
+        cursor.execute(f"UPDATE {CHECKPOINT_TABLE} SET last_pk = %s, copied = %s, done = %s WHERE model = %s", values)
+        if cursor.rowcount == 0:
+            cursor.execute(
+                f"INSERT INTO {CHECKPOINT_TABLE} (last_pk, copied, done, model) VALUES (%s, %s, %s, %s)", values,
+            )
+
+
+def drop_checkpoint_table(target):
+    with connections[target].cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {CHECKPOINT_TABLE}")
+
+
+def _delete_all(model, target):
+    # Plain DELETE: no collector, no signals, nothing loaded into memory
+    connection = connections[target]
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {_quote(connection, model._meta.db_table)}")
+
+
+def prepare_target(models, target, checkpoints):
+    """
+    Refuse to copy into tables that already hold data this tool did not
+    write, except the rows `migrate` creates on the target by itself.
+    """
+    fresh = [model for model in models if model._meta.label_lower not in checkpoints]
+    for model in fresh:
+        if model._meta.label_lower not in RECREATED_BY_MIGRATE and model._base_manager.using(target).exists():
+            raise CopyError(
+                f"{model._meta.db_table} on '{target}' already has rows. "
+                "Copy into a freshly migrated database, or pass --restart to empty these tables first."
+            )
+    with transaction.atomic(using=target):
+        for label in RECREATED_BY_MIGRATE:
+            if label in [model._meta.label_lower for model in fresh]:
+                _delete_all(apps.get_model(label), target)
+
+
+def empty_target(models, target):
+    # Children first, so no foreign key is left dangling between statements
+    with transaction.atomic(using=target):
+        for model in reversed(models):
+            _delete_all(model, target)
+    drop_checkpoint_table(target)
+
+
+def _insert_rows(connection, model, fields, rows):
+    table = _quote(connection, model._meta.db_table)
+    columns = ', '.join(_quote(connection, field.column) for field in fields)
+    rows = [[field.get_db_prep_save(value, connection) for field, value in zip(fields, row)] for row in rows]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql' and connection.Database.__name__ == 'psycopg':
+            with cursor.cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            placeholders = ', '.join(['%s'] * len(fields))
+            cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows)
+
+
+def copy_model(model, source, target, batch_size, checkpoint=None, progress=None):
+    """
+    Stream one table from `source` to `target`, resuming after the
+    checkpointed primary key. Returns the total number of rows copied.
+    """
+    checkpoint = checkpoint or {'last_pk': None, 'copied': 0, 'done': False}
+    if checkpoint['done']:
+        return checkpoint['copied']
+    label = model._meta.label_lower
+    fields = model._meta.concrete_fields
+    pk_index = fields.index(model._meta.pk)
+    rows = model._base_manager.using(source).order_by('pk').values_list(*[field.attname for field in fields])
+    if checkpoint['last_pk'] is not None:
+        rows = rows.filter(pk__gt=checkpoint['last_pk'])
+    rows = rows.iterator(chunk_size=batch_size)
+    copied, last_pk = checkpoint['copied'], checkpoint['last_pk']
+    while batch := list(islice(rows, batch_size)):
+        with transaction.atomic(using=target):
+            _insert_rows(connections[target], model, fields, batch)
+            copied += len(batch)
+            last_pk = batch[-1][pk_index]
+            _save_checkpoint(target, label, last_pk, copied, False)
+        if progress:
+            progress(model, copied)
+    _save_checkpoint(target, label, last_pk, copied, True)
+    return copied
+
+
+def reset_sequences(models, target):
+    # Rows were inserted with explicit ids; move PostgreSQL/Oracle sequences past them
+    connection = connections[target]
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with transaction.atomic(using=target), connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def _normalize(value):
+    if isinstance(value, memoryview):
+        return bytes(value)
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc)
+    if isinstance(value, Decimal):
+        return value.normalize()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def table_checksum(model, using, batch_size):
+    """
+    (row count, checksum) of a table. Rows are hashed one by one and the
+    hashes summed, so the result does not depend on the database's collation
+    or row order.
+    """
+    rows = model._base_manager.using(using).values_list(*[field.attname for field in model._meta.concrete_fields])
+    count = total = 0
+    for row in rows.iterator(chunk_size=batch_size):
+        digest = hashlib.blake2b(repr(tuple(_normalize(value) for value in row)).encode(), digest_size=16).digest()
+        total = (total + int.from_bytes(digest, 'big')) % (1 << 128)
+        count += 1
+    return count, f'{total:032x}'
+
+
+def verify(models, source, target, batch_size):
+    """
+    Yield (model, source (count, checksum), target (count, checksum)) per table.
+    """
+    for model in models:
+        yield model, table_checksum(model, source, batch_size), table_checksum(model, target, batch_size)
+
+
+def copy_database(models, source, target, batch_size, progress=None):
+    """
+    Copy every model in order, resuming from the target's checkpoints.
+    Returns {model: (rows, seconds)} for the tables copied in this run.
+    """
+    ensure_checkpoint_table(target)
+    checkpoints = read_checkpoints(target)
+    prepare_target(models, target, checkpoints)
+    timings = {}
+    for model in models:
+        start = time.perf_counter()
+        rows = copy_model(model, source, target, batch_size, checkpoints.get(model._meta.label_lower), progress)
+        timings[model] = (rows, time.perf_counter() - start)
+    reset_sequences(models, target)
+    return timings
@@ -0,0 +1,193 @@
+"""
+Live applicant and status updates pushed to the browser.
+
+Signal handlers call `publish()` once the transaction commits. Browsers
+subscribe to their own channels through the `event_stream` view (Server-Sent
+Events) or the WebSocket endpoint in `home.websocket`:
+
+    company-<id>    new applications and status changes on the company's jobs
+    candidate-<id>  status changes on the candidate's applications
+
+The broker is chosen by settings.LIVE_EVENTS['BACKEND'], like a cache
+backend. LocalBroker fans out inside one process, which covers a single
+ASGI server process. RedisBroker goes through Redis pub/sub, so an event
+published by any process (another worker, a WSGI server, a management
+command) reaches subscribers everywhere.
+
+Streams need an ASGI server (uvicorn, daphne, ...). Under WSGI the view
+answers 204, which tells EventSource to stop reconnecting.
+"""
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'home.events.LocalBroker'
+# Comment line sent when nothing happened, so proxies keep the stream open
+HEARTBEAT_SECONDS = 20
+# Streams end after this long and EventSource reconnects, re-checking the session
+MAX_STREAM_SECONDS = 30 * 60
+RETRY_MS = 5000
+
+
+def company_channel(company_id):
+    return f'company-{company_id}'
+
+
+def candidate_channel(candidate_id):
+    return f'candidate-{candidate_id}'
+
+
+def _offer(queue, message):
+    # A subscriber that stops reading loses its oldest events, not memory
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+class LocalBroker:
+    """
+    In-process pub/sub. `publish` may be called from any thread (sync views
+    run in a thread pool under ASGI); each message is handed to the
+    subscriber's event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self, QUEUE_SIZE=100, **options):
+        self.queue_size = QUEUE_SIZE
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, channel, message):
+        with self._lock:
+            targets = list(self._subscribers.get(channel, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                pass  # loop already closed; its subscription is on the way out
+
+    @asynccontextmanager
+    async def subscribe(self, channels):
+        entry = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                for channel in channels:
+                    self._subscribers[channel].discard(entry)
+                    if not self._subscribers[channel]:
+                        del self._subscribers[channel]
+
+
+class RedisBroker:
+    """
+    Redis pub/sub, shared by every process. Needs the `redis` package.
+    """
+
+    def __init__(self, URL=None, PREFIX='jobscalling:events:', QUEUE_SIZE=100, **options):
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImproperlyConfigured("RedisBroker requires the 'redis' package.") from exc
+        self.url = URL or getattr(settings, 'REDIS_URL', None) or 'redis://localhost:6379/0'
+        self.prefix = PREFIX
+        self.queue_size = QUEUE_SIZE
+        self._client = redis.Redis.from_url(self.url)
+
+    def publish(self, channel, message):
+        self._client.publish(self.prefix + channel, json.dumps(message))
+
+    @asynccontextmanager
+    async def subscribe(self, channels):
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(*[self.prefix + channel for channel in channels])
+        queue = asyncio.Queue(self.queue_size)
+
+        async def pump():
+            async for item in pubsub.listen():
+                if item['type'] == 'message':
+                    _offer(queue, json.loads(item['data']))
+
+        task = asyncio.create_task(pump())
+        try:
+            yield queue
+        finally:
+            task.cancel()
+            await pubsub.aclose()
+            await client.aclose()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = getattr(settings, 'LIVE_EVENTS', {})
+                backend = import_string(config.get('BACKEND', DEFAULT_BACKEND))
+                _broker = backend(**config.get('OPTIONS', {}))
+    return _broker
+
+
+def publish(channels, event, data):
+    """
+    Send `event` to every subscriber of `channels`. Never raises: a broker
+    outage must not fail the request that caused the event.
+    """
+    message = {'event': event, 'data': data}
+    for channel in channels:
+        try:
+            broker().publish(channel, message)
+        except Exception:
+            logger.exception("could not publish %s to %s", event, channel)
+
+
+def channels_for_user(user):
+    """
+    The channels `user` may listen on (a user can hold both profiles).
+    """
+    from .models import CandidateProfile, CompanyProfile
+
+    channels = [company_channel(pk) for pk in CompanyProfile.objects.filter(user=user).values_list('pk', flat=True)]
+    channels += [candidate_channel(pk) for pk in CandidateProfile.objects.filter(user=user).values_list('pk', flat=True)]
+    return channels
+
+
+def format_sse(message, event_id):
+    return f"id: {event_id}\nevent: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+
+
+async def sse_messages(channels):
+    """
+    Async iterator of Server-Sent Events text for a StreamingHttpResponse.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_STREAM_SECONDS
+    yield f"retry: {RETRY_MS}\n\n"
+    async with broker().subscribe(channels) as queue:
+        event_id = 0
+        while loop.time() < deadline:
+            try:
+                message = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            event_id += 1
+            yield format_sse(message, event_id)
@@ -0,0 +1,227 @@
+"""
+Faceted navigation for the candidate job listing.
+
+Facet counts (active jobs per job type, normalized location, salary band
+and company industry) are read from the JobFacetCount summary table instead of being
+computed with GROUP BY per request. The table is kept current incrementally
+by the JobPosting/CompanyProfile signal handlers in `home.signals`, and
+rebuilt from scratch by the `refresh_facets` command to correct any drift
+(e.g. from queryset.update(), which sends no signals).
+
+Besides the global count of each (facet, value), the table keeps a
+drill-down count within every value of the other facets, e.g. full-time
+postings within industry=Software. A facet with one other facet selected
+reads its exact counts from those rows; with two or more selected, each
+count is the smallest of the drill-down counts, an upper bound. The
+"near" radius does not narrow the counts.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import CompanyProfile, JobFacetCount, JobPosting, Location
+
+# (key, label, lower bound inclusive, upper bound exclusive)
+SALARY_BANDS = [
+    ('lt20k', 'Under 20k', 0, 20000),
+    ('20k-50k', '20k - 50k', 20000, 50000),
+    ('50k-100k', '50k - 100k', 50000, 100000),
+    ('100k+', '100k and above', 100000, None),
+]
+SALARY_UNSPECIFIED = 'none'
+# Location facet value for remote postings; other values are Location keys
+REMOTE = 'remote'
+
+FACETS = ('job_type', 'location', 'salary_band', 'industry')
+FILTER_FIELDS = {
+    'job_type': 'job_type',
+    'location': 'normalized_location__key',
+    'salary_band': 'salary_band',
+    'industry': 'company__industry',
+}
+
+
+def salary_band_for(min_salary, max_salary):
+    """
+    Bucket a posting by the top of its advertised range.
+    """
+    top = max_salary if max_salary is not None else min_salary
+    if top is None:
+        return SALARY_UNSPECIFIED
+    for key, _label, low, high in SALARY_BANDS:
+        if top >= low and (high is None or top < high):
+            return key
+    return SALARY_UNSPECIFIED
+
+
+def normalize_industry(industry):
+    """
+    The one spelling of an industry used by the company row, the facet
+    table and the filter: surrounding and repeated whitespace removed.
+    """
+    return ' '.join((industry or '').split())
+
+
+def facet_label(facet, value, location_names=None):
+    if facet == 'location':
+        if value == REMOTE:
+            return 'Remote'
+        return (location_names or {}).get(value, value)
+    if facet == 'job_type':
+        return dict(JobPosting.JOB_TYPES).get(value, value)
+    if facet == 'salary_band':
+        labels = {key: label for key, label, _low, _high in SALARY_BANDS}
+        return labels.get(value, 'Not specified')
+    return value
+
+
+def facet_values(is_active, job_type, location_key, is_remote, salary_band, industry):
+    """
+    The (facet, value) pairs a posting contributes to; none when inactive.
+    A remote posting with a place counts under both.
+    """
+    if not is_active:
+        return []
+    pairs = [
+        ('job_type', job_type),
+        ('location', location_key or ''),
+        ('salary_band', salary_band),
+        ('industry', normalize_industry(industry)),
+    ]
+    if is_remote:
+        pairs.append(('location', REMOTE))
+    return pairs
+
+
+def summary_keys(pairs):
+    """
+    The JobFacetCount keys (facet, value, within facet, within value) one
+    posting's pairs count towards: the global count ('', '') and the
+    drill-down count within each of its values of the other facets.
+    """
+    pairs = [(facet, value) for facet, value in pairs if value]
+    keys = []
+    for facet, value in pairs:
+        keys.append((facet, value, '', ''))
+        keys.extend((facet, value, other, other_value) for other, other_value in pairs if other != facet)
+    return keys
+
+
+def apply_deltas(changes):
+    """
+    Move counts for several postings, each given as (removed pairs, added
+    pairs).
+    """
+    delta = Counter()
+    for removed, added in changes:
+        delta.update(summary_keys(added))
+        delta.subtract(summary_keys(removed))
+    with transaction.atomic():
+        for (facet, value, within_facet, within_value), change in delta.items():
+            if not change:
+                continue
+            row, created = JobFacetCount.objects.get_or_create(
+                facet=facet, value=value, within_facet=within_facet, within_value=within_value,
+                defaults={'count': max(change, 0)},
+            )
+            if not created:
+                JobFacetCount.objects.filter(pk=row.pk).update(count=F('count') + change)
+
+
+def apply_delta(removed, added):
+    """
+    Move one posting's counts from its `removed` pairs to its `added` pairs.
+    """
+    apply_deltas([(removed, added)])
+
+
+def rebuild_facet_counts():
+    """
+    Recompute every facet count from the live tables: one GROUP BY over
+    the combinations of facet values.
+    """
+    combinations = (
+        JobPosting.objects.filter(is_active=True)
+        .values_list('job_type', 'normalized_location__key', 'is_remote', 'salary_band', 'company__industry')
+        .annotate(n=Count('id')).order_by()
+    )
+    merged = Counter()
+    for job_type, location_key, is_remote, salary_band, industry, count in combinations:
+        for key in summary_keys(facet_values(True, job_type, location_key, is_remote, salary_band, industry)):
+            merged[key] += count
+    with transaction.atomic():
+        JobFacetCount.objects.all().delete()
+        JobFacetCount.objects.bulk_create(
+            [JobFacetCount(facet=facet, value=value, within_facet=within_facet, within_value=within_value, count=count)
+             for (facet, value, within_facet, within_value), count in merged.items()],
+            batch_size=500,
+        )
+    return len(merged)
+
+
+def facet_counts(selected=None):
+    """
+    Facet options for the listing page, most common first, from the
+    summary table (one query). Each facet is counted within the other
+    selected facets (see the module docstring). Selected options are
+    always listed, with a zero count if nothing matches.
+    """
+    selected = selected or {}
+    contexts = Q(within_facet='', within_value='')
+    for facet, value in selected.items():
+        contexts |= Q(within_facet=facet, within_value=value)
+    by_context = defaultdict(lambda: defaultdict(dict))
+    for row in JobFacetCount.objects.filter(contexts, count__gt=0):
+        by_context[(row.within_facet, row.within_value)][row.facet][row.value] = row.count
+
+    counts = {}
+    for facet in FACETS:
+        others = [(other, value) for other, value in selected.items() if other != facet]
+        if not others:
+            counts[facet] = dict(by_context[('', '')][facet])
+        else:
+            within = [by_context[context][facet] for context in others]
+            counts[facet] = {
+                value: min(counts_within[value] for counts_within in within)
+                for value in set.intersection(*(set(counts_within) for counts_within in within))
+            }
+    for facet, value in selected.items():
+        counts[facet].setdefault(value, 0)
+
+    location_keys = [value for value in counts['location'] if value != REMOTE]
+    location_names = dict(Location.objects.filter(key__in=location_keys).values_list('key', 'name'))
+    return {
+        facet: [
+            {
+                'value': value,
+                'label': facet_label(facet, value, location_names),
+                'count': count,
+                'selected': selected.get(facet) == value,
+            }
+            for value, count in sorted(counts[facet].items(), key=lambda item: (-item[1], item[0]))
+        ]
+        for facet in FACETS
+    }
+
+
+def selected_filters(params):
+    selected = {facet: params.get(facet, '').strip() for facet in FACETS if params.get(facet, '').strip()}
+    if 'industry' in selected:
+        selected['industry'] = normalize_industry(selected['industry'])
+    return selected
+
+
+def filter_jobs(queryset, selected):
+    """
+    Apply the chosen facets as equality predicates on indexed columns.
+    """
+    lookups = {FILTER_FIELDS[facet]: value for facet, value in selected.items()}
+    if selected.get('location') == REMOTE:
+        del lookups[FILTER_FIELDS['location']]
+        lookups['is_remote'] = True
+    return queryset.filter(**lookups)
+
+
+def company_industry(company_id):
+    return CompanyProfile.objects.filter(pk=company_id).values_list('industry', flat=True).first()
@@ -0,0 +1,221 @@
+"""
+Sitemaps and job feeds for crawlers, generated to files.
+
+Active postings are split into sitemap chunks by id range (CHUNK_SIZE ids
+per file), so a change to one posting only dirties the chunk it falls in.
+The JobPosting/CompanyProfile signal handlers mark FeedFile rows dirty and
+`manage.py build_feeds` (cron) rewrites just those files, streaming rows
+with `.iterator()` and only the columns it writes. Files land in
+FEEDS_ROOT via a temp file and os.replace, so readers never see a partial
+file. In production nginx serves them directly, e.g.
+
+    location = /sitemap.xml { alias <FEEDS_ROOT>/sitemap.xml; }
+    location /sitemaps/     { alias <FEEDS_ROOT>/sitemaps/; }
+    location /feeds/        { alias <FEEDS_ROOT>/feeds/; }
+
+otherwise `home.views.serve_feed_file` reads the same files from disk.
+"""
+import json
+import os
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from .models import FeedFile, JobPosting
+
+CHUNK_SIZE = 5000
+FEED_SIZE = 100
+FEED_NAME = 'jobs-feed'
+INDEX_NAME = 'sitemap.xml'
+
+
+def _root():
+    return str(getattr(settings, 'FEEDS_ROOT', os.path.join(settings.BASE_DIR, 'feeds')))
+
+
+def _absolute(path):
+    return getattr(settings, 'SITE_URL', 'http://localhost:8000').rstrip('/') + path
+
+
+def chunk_name(number):
+    return f'sitemap-{number}'
+
+
+def chunk_path(number):
+    return f'sitemaps/{chunk_name(number)}.xml'
+
+
+def chunk_number(name):
+    return int(name.split('-')[1])
+
+
+def mark_job_dirty(job_id):
+    """
+    Flag the sitemap chunk holding `job_id` and the feed for rebuilding.
+    """
+    names = [chunk_name(job_id // CHUNK_SIZE), FEED_NAME]
+    mark_dirty(names)
+
+
+def mark_dirty(names):
+    existing = set(FeedFile.objects.filter(name__in=names).values_list('name', flat=True))
+    FeedFile.objects.filter(name__in=existing, dirty=False).update(dirty=True)
+    FeedFile.objects.bulk_create(
+        [FeedFile(name=name) for name in names if name not in existing], ignore_conflicts=True
+    )
+
+
+class _AtomicWriter:
+    """Write to `<path>.tmp` and move it into place on success."""
+
+    def __init__(self, relative_path):
+        self.path = os.path.join(_root(), relative_path)
+        self.tmp_path = self.path + '.tmp'
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.handle = open(self.tmp_path, 'w', encoding='utf-8')
+        return self.handle
+
+    def __exit__(self, exc_type, exc, tb):
+        self.handle.close()
+        if exc_type is None:
+            os.chmod(self.tmp_path, 0o644)
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.unlink(self.tmp_path)
+
+
+def _active_jobs():
+    return JobPosting.objects.filter(is_active=True)
+
+
+def build_chunk(number):
+    """
+    Rewrite one sitemap chunk; returns the number of URLs (0 removes it).
+    """
+    rows = (
+        _active_jobs()
+        .filter(id__gte=number * CHUNK_SIZE, id__lt=(number + 1) * CHUNK_SIZE)
+        .order_by('id')
+        .values_list('id', 'posted_date')
+        .iterator(chunk_size=1000)
+    )
+    count = 0
+    with _AtomicWriter(chunk_path(number)) as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for job_id, posted_date in rows:
+            loc = escape(_absolute(reverse('job_detail', args=[job_id])))
+            out.write(f'<url><loc>{loc}</loc><lastmod>{posted_date.date().isoformat()}</lastmod></url>\n')
+            count += 1
+        out.write('</urlset>\n')
+    if not count:
+        os.unlink(os.path.join(_root(), chunk_path(number)))
+    return count
+
+
+def build_index():
+    chunks = FeedFile.objects.filter(name__startswith='sitemap-', item_count__gt=0)
+    # By number, not name: "sitemap-10" sorts before "sitemap-2" as text
+    chunks = sorted(chunks, key=lambda chunk: chunk_number(chunk.name))
+    with _AtomicWriter(INDEX_NAME) as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for chunk in chunks:
+            loc = escape(_absolute('/' + chunk_path(chunk_number(chunk.name))))
+            lastmod = chunk.generated_at.isoformat(timespec='seconds')
+            out.write(f'<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>\n')
+        out.write('</sitemapindex>\n')
+
+
+def _feed_items():
+    jobs = (
+        _active_jobs()
+        .select_related('company')
+        .only('id', 'title', 'description', 'location', 'posted_date', 'company__company_name')
+        .order_by('-posted_date', '-id')[:FEED_SIZE]
+    )
+    for job in jobs.iterator(chunk_size=FEED_SIZE):
+        yield {
+            'id': job.id,
+            'url': _absolute(reverse('job_detail', args=[job.id])),
+            'title': f"{job.title} at {job.company.company_name}",
+            'summary': Truncator(job.description).chars(300),
+            'location': job.location,
+            'date_published': job.posted_date,
+        }
+
+
+def build_feed():
+    """
+    Write the newest FEED_SIZE active postings as RSS 2.0 and JSON Feed 1.1.
+    """
+    items = list(_feed_items())
+    home = _absolute('/')
+    with _AtomicWriter('feeds/jobs.rss') as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>\n')
+        out.write(f'<title>Jobs Calling - latest jobs</title><link>{escape(home)}</link>'
+                  f'<description>Newest job postings</description>\n')
+        for item in items:
+            out.write(
+                f"<item><title>{escape(item['title'])}</title><link>{escape(item['url'])}</link>"
+                f"<guid isPermaLink=\"true\">{escape(item['url'])}</guid>"
+                f"<description>{escape(item['summary'])}</description>"
+                f"<category>{escape(item['location'])}</category>"
+                f"<pubDate>{item['date_published'].strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate></item>\n"
+            )
+        out.write('</channel></rss>\n')
+
+    with _AtomicWriter('feeds/jobs.json') as out:
+        json.dump({
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': 'Jobs Calling - latest jobs',
+            'home_page_url': home,
+            'feed_url': _absolute('/feeds/jobs.json'),
+            'items': [
+                {
+                    'id': str(item['id']),
+                    'url': item['url'],
+                    'title': item['title'],
+                    'summary': item['summary'],
+                    'content_text': item['summary'],
+                    'tags': [item['location']] if item['location'] else [],
+                    'date_published': item['date_published'].isoformat(timespec='seconds'),
+                }
+                for item in items
+            ],
+        }, out, ensure_ascii=False)
+    return len(items)
+
+
+def _finish(name, count):
+    FeedFile.objects.filter(name=name).update(item_count=count, generated_at=timezone.now())
+
+
+def build_dirty(rebuild_all=False):
+    """
+    Regenerate dirty files (everything on the first run or with
+    `rebuild_all`). Returns the names rebuilt.
+    """
+    index_path = os.path.join(_root(), INDEX_NAME)
+    if rebuild_all or not os.path.exists(index_path):
+        last_id = JobPosting.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        mark_dirty([chunk_name(number) for number in range(last_id // CHUNK_SIZE + 1)] + [FEED_NAME])
+
+    rebuilt = []
+    for feed_file in FeedFile.objects.filter(dirty=True).order_by('name'):
+        # Clear the flag first: a change landing mid-build dirties it again
+        FeedFile.objects.filter(pk=feed_file.pk).update(dirty=False)
+        if feed_file.name == FEED_NAME:
+            _finish(feed_file.name, build_feed())
+        else:
+            _finish(feed_file.name, build_chunk(chunk_number(feed_file.name)))
+        rebuilt.append(feed_file.name)
+
+    if any(name.startswith('sitemap-') for name in rebuilt) or not os.path.exists(index_path):
+        build_index()
+    return rebuilt
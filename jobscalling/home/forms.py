@@ -12,12 +12,16 @@ class JobPostingForm(forms.ModelForm):
             'title', 
             'description', 
             'location', 
+            'is_remote',
             'job_type', 
             'min_salary', 
             'max_salary', 
             'requirements', 
             'application_deadline',
-            'is_active'
+            'is_active',
+            'min_experience_months',
+            'min_education_level',
+            'screen_salary',
         ]
         widgets = {
             'application_deadline': forms.DateInput(attrs={'type': 'date'}),
@@ -27,4 +31,28 @@ class JobPostingForm(forms.ModelForm):
         labels = {
             'min_salary': 'Minimum Annual Salary ($)',
             'max_salary': 'Maximum Annual Salary ($)',
+            'min_experience_months': 'Minimum Experience (months)',
+            'min_education_level': 'Minimum Education',
         }
+
+
+class InterviewSlotForm(forms.Form):
+    """
+    Bulk slot generation for one job: back-to-back interviews in a time window.
+    """
+    day = forms.DateField(widget=forms.DateInput(attrs={'type': 'date'}))
+    start_time = forms.TimeField(widget=forms.TimeInput(attrs={'type': 'time'}))
+    end_time = forms.TimeField(widget=forms.TimeInput(attrs={'type': 'time'}))
+    duration = forms.IntegerField(min_value=10, max_value=240, initial=30, label="Minutes per interview")
+    gap = forms.IntegerField(min_value=0, max_value=120, initial=0, label="Break between interviews (minutes)")
+    interviewer = forms.CharField(max_length=100, required=False)
+    count = forms.IntegerField(min_value=1, max_value=100, required=False,
+                               help_text="Leave blank for one slot per shortlisted applicant without one.")
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_time, end_time = cleaned_data.get('start_time'), cleaned_data.get('end_time')
+        if start_time and end_time and end_time <= start_time:
+            raise forms.ValidationError("The end time must be after the start time.")
+        cleaned_data['interviewer'] = cleaned_data.get('interviewer', '').strip()
+        return cleaned_data
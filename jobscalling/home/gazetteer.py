@@ -0,0 +1,72 @@
+"""
+Offline gazetteer used to normalize free-text job locations.
+
+Each entry is keyed by its canonical slug and lists the aliases that map
+to it (matched after lowercasing and stripping punctuation). Coordinates
+are city centres, which is precise enough for "within N km" search.
+"""
+
+# slug: (display name, country code, latitude, longitude, aliases)
+PLACES = {
+    # Bangladesh: divisional and district cities
+    'dhaka': ('Dhaka', 'BD', 23.8103, 90.4125, ['dacca', 'dhaka city', 'dhaka division']),
+    'chattogram': ('Chattogram', 'BD', 22.3569, 91.7832, ['chittagong', 'ctg', 'chottogram']),
+    'khulna': ('Khulna', 'BD', 22.8456, 89.5403, []),
+    'rajshahi': ('Rajshahi', 'BD', 24.3745, 88.6042, []),
+    'sylhet': ('Sylhet', 'BD', 24.8949, 91.8687, []),
+    'barishal': ('Barishal', 'BD', 22.7010, 90.3535, ['barisal']),
+    'rangpur': ('Rangpur', 'BD', 25.7439, 89.2752, []),
+    'mymensingh': ('Mymensingh', 'BD', 24.7471, 90.4203, []),
+    'cumilla': ('Cumilla', 'BD', 23.4607, 91.1809, ['comilla', 'kumilla']),
+    'gazipur': ('Gazipur', 'BD', 23.9999, 90.4203, []),
+    'narayanganj': ('Narayanganj', 'BD', 23.6238, 90.5000, []),
+    'noakhali': ('Noakhali', 'BD', 22.8696, 91.0995, ['maijdee', 'maijdi']),
+    'coxs-bazar': ("Cox's Bazar", 'BD', 21.4272, 92.0058, ['coxs bazar', 'cox bazar', 'coxsbazar']),
+    'bogura': ('Bogura', 'BD', 24.8465, 89.3776, ['bogra']),
+    'jashore': ('Jashore', 'BD', 23.1664, 89.2081, ['jessore']),
+    'savar': ('Savar', 'BD', 23.8583, 90.2667, []),
+    'tangail': ('Tangail', 'BD', 24.2513, 89.9167, []),
+    'feni': ('Feni', 'BD', 23.0159, 91.3976, []),
+    'dinajpur': ('Dinajpur', 'BD', 25.6217, 88.6354, []),
+    'pabna': ('Pabna', 'BD', 24.0064, 89.2372, []),
+    'kushtia': ('Kushtia', 'BD', 23.9013, 89.1204, []),
+    'brahmanbaria': ('Brahmanbaria', 'BD', 23.9571, 91.1119, []),
+    'faridpur': ('Faridpur', 'BD', 23.6070, 89.8429, []),
+    # Dhaka neighbourhoods commonly written as the job location
+    'gulshan': ('Gulshan, Dhaka', 'BD', 23.7925, 90.4078, []),
+    'banani': ('Banani, Dhaka', 'BD', 23.7937, 90.4066, []),
+    'dhanmondi': ('Dhanmondi, Dhaka', 'BD', 23.7461, 90.3742, []),
+    'mirpur': ('Mirpur, Dhaka', 'BD', 23.8223, 90.3654, []),
+    'uttara': ('Uttara, Dhaka', 'BD', 23.8759, 90.3795, []),
+    'motijheel': ('Motijheel, Dhaka', 'BD', 23.7330, 90.4172, []),
+    'mohakhali': ('Mohakhali, Dhaka', 'BD', 23.7781, 90.4050, []),
+    'tejgaon': ('Tejgaon, Dhaka', 'BD', 23.7639, 90.3889, []),
+    # Frequent overseas locations
+    'kolkata': ('Kolkata', 'IN', 22.5726, 88.3639, ['calcutta']),
+    'delhi': ('Delhi', 'IN', 28.6139, 77.2090, ['new delhi']),
+    'singapore': ('Singapore', 'SG', 1.3521, 103.8198, []),
+    'kuala-lumpur': ('Kuala Lumpur', 'MY', 3.1390, 101.6869, ['kl']),
+    'dubai': ('Dubai', 'AE', 25.2048, 55.2708, []),
+    'london': ('London', 'GB', 51.5074, -0.1278, []),
+    'new-york': ('New York', 'US', 40.7128, -74.0060, ['nyc', 'new york city']),
+}
+
+# Words that mark a posting as remote
+REMOTE_TERMS = {'remote', 'wfh', 'work from home', 'anywhere', 'online', 'remote only', 'fully remote'}
+
+# Work-arrangement words that are not places ("Onsite, Dhaka" -> "dhaka")
+ARRANGEMENT_TERMS = {'onsite', 'on site', 'on-site', 'hybrid', 'in office', 'office'}
+
+# Trailing qualifiers dropped before matching ("Dhaka, BD" -> "dhaka")
+COUNTRY_SUFFIXES = {'bd', 'bangladesh', 'india', 'in', 'uae', 'uk', 'usa', 'us'}
+
+
+def build_alias_index():
+    index = {}
+    for slug, (name, _country, _lat, _lon, aliases) in PLACES.items():
+        for alias in [slug.replace('-', ' '), name.lower()] + aliases:
+            index[alias] = slug
+    return index
+
+
+ALIASES = build_alias_index()
@@ -0,0 +1,159 @@
+"""
+Location normalization and "within N km" job search.
+
+Free-text JobPosting.location values are parsed against the offline
+gazetteer in `home.gazetteer`; every spelling of a place resolves to one
+Location row carrying lat/lon and a coarse grid cell. Proximity queries
+first select candidate Locations by grid-cell range (an indexed bounding
+box) and then refine with the haversine distance, so the jobs query itself
+is a plain `normalized_location_id IN (...)` filter.
+"""
+import math
+import re
+from collections import namedtuple
+
+from django.utils.text import slugify
+
+from .gazetteer import ALIASES, ARRANGEMENT_TERMS, COUNTRY_SUFFIXES, PLACES, REMOTE_TERMS
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+# Grid cell size in degrees (~55 km of latitude)
+GRID_DEGREES = 0.5
+RADIUS_CHOICES = [5, 10, 25, 50, 100]
+DEFAULT_RADIUS = 25
+
+ParsedLocation = namedtuple('ParsedLocation', 'key name country latitude longitude is_remote')
+
+
+def _terms_pattern(terms):
+    alternatives = sorted((re.escape(term) for term in terms), key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b')
+
+
+_REMOTE_PATTERN = _terms_pattern(REMOTE_TERMS)
+_NON_PLACE_PATTERN = _terms_pattern(REMOTE_TERMS | ARRANGEMENT_TERMS)
+
+
+def _clean(text):
+    text = (text or '').lower().replace("'", '')
+    return re.sub(r'[^\w\s,/|()-]', ' ', text)
+
+
+def _match_place(part):
+    """
+    Gazetteer slug for one comma-separated part: the whole part, then word
+    pairs, then single words ("gulshan 2" -> gulshan).
+    """
+    if part in ALIASES:
+        return ALIASES[part]
+    words = part.split()
+    for size in (2, 1):
+        for start in range(len(words) - size + 1):
+            slug = ALIASES.get(' '.join(words[start:start + size]))
+            if slug:
+                return slug
+    return None
+
+
+def parse_location(text):
+    """
+    Parse free text into a ParsedLocation; `key` is None for remote-only or
+    empty input. Unknown places get a slug key and no coordinates so that
+    their spellings still collapse together.
+    """
+    cleaned = _clean(text)
+    is_remote = bool(_REMOTE_PATTERN.search(cleaned))
+    parts = []
+    for part in re.split(r'[,/|()]|\s-\s', _NON_PLACE_PATTERN.sub(' ', cleaned)):
+        part = ' '.join(part.replace('-', ' ').split())
+        if part and part not in COUNTRY_SUFFIXES:
+            parts.append(part)
+
+    for part in parts:
+        slug = _match_place(part)
+        if slug:
+            name, country, latitude, longitude, _aliases = PLACES[slug]
+            return ParsedLocation(slug, name, country, latitude, longitude, is_remote)
+    if not parts:
+        return ParsedLocation(None, '', '', None, None, is_remote)
+    key = slugify(' '.join(parts))[:100]
+    name = ', '.join(part.title() for part in parts)[:100]
+    return ParsedLocation(key or None, name, '', None, None, is_remote)
+
+
+def grid_cell(latitude, longitude):
+    return math.floor(latitude / GRID_DEGREES), math.floor(longitude / GRID_DEGREES)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def resolve_location(text, memo=None):
+    """
+    Return (Location or None, is_remote) for free text, creating the
+    Location row on first use. `memo` caches rows across a batch.
+    """
+    from .models import Location
+
+    parsed = parse_location(text)
+    if parsed.key is None:
+        return None, parsed.is_remote
+    if memo is not None and parsed.key in memo:
+        return memo[parsed.key], parsed.is_remote
+
+    defaults = {'name': parsed.name, 'country': parsed.country}
+    if parsed.latitude is not None:
+        grid_lat, grid_lon = grid_cell(parsed.latitude, parsed.longitude)
+        defaults.update(latitude=parsed.latitude, longitude=parsed.longitude, grid_lat=grid_lat, grid_lon=grid_lon)
+    location, _created = Location.objects.get_or_create(key=parsed.key, defaults=defaults)
+    if memo is not None:
+        memo[parsed.key] = location
+    return location, parsed.is_remote
+
+
+def locations_within(latitude, longitude, radius_km):
+    """
+    {location_id: distance_km} for every Location within `radius_km`.
+    """
+    from .models import Location
+
+    lat_delta = radius_km / KM_PER_DEGREE
+    lon_delta = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+    low_lat, low_lon = grid_cell(latitude - lat_delta, longitude - lon_delta)
+    high_lat, high_lon = grid_cell(latitude + lat_delta, longitude + lon_delta)
+    candidates = Location.objects.filter(
+        grid_lat__range=(low_lat, high_lat),
+        grid_lon__range=(low_lon, high_lon),
+    ).values_list('id', 'latitude', 'longitude')
+
+    within = {}
+    for location_id, lat, lon in candidates:
+        distance = haversine_km(latitude, longitude, lat, lon)
+        if distance <= radius_km:
+            within[location_id] = round(distance, 1)
+    return within
+
+
+def parse_radius(value):
+    try:
+        radius = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RADIUS
+    return radius if radius in RADIUS_CHOICES else DEFAULT_RADIUS
+
+
+def filter_near(queryset, place, radius_km):
+    """
+    Restrict JobPostings to those within `radius_km` of the gazetteer place
+    named by `place`. Returns (queryset, parsed place or None); an unknown
+    place matches nothing.
+    """
+    parsed = parse_location(place)
+    if parsed.latitude is None:
+        return queryset.none(), None
+    within = locations_within(parsed.latitude, parsed.longitude, radius_km)
+    return queryset.filter(normalized_location_id__in=list(within)), parsed
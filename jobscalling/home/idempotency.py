@@ -0,0 +1,43 @@
+"""
+Idempotency keys for form POSTs (apply, CV upload).
+
+Each rendered form carries a fresh key in a hidden `idempotency_key` field.
+API clients can send an `Idempotency-Key` header instead. The view stores
+the key with `remember()` inside the transaction that performs the write.
+A second submission with the same key (double-click, browser resend,
+client retry) is answered from `completed_url()` without writing again. If
+two copies race, the unique constraint lets only one commit.
+"""
+import uuid
+
+from .models import IdempotencyKey
+
+FIELD = 'idempotency_key'
+# Keys only need to outlive a user's retries; `purge_idempotency_keys` drops older ones
+MAX_AGE_HOURS = 24
+
+
+def new_key():
+    return uuid.uuid4().hex
+
+
+def request_key(request):
+    key = request.headers.get('Idempotency-Key') or request.POST.get(FIELD, '')
+    return key.strip()[:64] or None
+
+
+def completed_url(user, scope, key):
+    """
+    Where the first request with this key sent the user, or None.
+    """
+    if not key:
+        return None
+    return (
+        IdempotencyKey.objects.filter(user=user, scope=scope, key=key)
+        .values_list('redirect_url', flat=True).first()
+    )
+
+
+def remember(user, scope, key, redirect_url):
+    if key:
+        IdempotencyKey.objects.create(user=user, scope=scope, key=key, redirect_url=redirect_url)
@@ -0,0 +1,172 @@
+"""
+Interview scheduling: company slots, bulk slot generation and booking.
+
+Conflicts are found with an IntervalIndex over an interviewer's (or a
+candidate's) existing slots: those never overlap, so kept sorted by start
+only the neighbour at the bisect point can clash with a new interval, and
+checking k proposed slots against n existing ones costs O(k log n) rather
+than k * n comparisons.
+
+Concurrency: slot generation locks the company row, so two recruiters
+generating at once queue up instead of interleaving (SQLite serializes
+writers anyway, and the unique (company, interviewer, start) constraint
+catches the identical-start case everywhere). Booking claims a slot with a
+conditional UPDATE ... WHERE application_id IS NULL, which only one of two
+concurrent requests can win, and JobApplication is a OneToOne target so an
+application never holds two slots.
+"""
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import CandidateProfile, CompanyProfile, InterviewSlot, JobApplication
+
+SHORTLISTED = 'INTERVIEW'
+
+
+class SlotUnavailable(Exception):
+    pass
+
+
+class IntervalIndex:
+    """
+    Disjoint half-open [start, end) intervals sorted by start.
+    """
+
+    def __init__(self, intervals=()):
+        self._starts = []
+        self._intervals = []
+        for start, end in sorted(intervals):
+            self._starts.append(start)
+            self._intervals.append((start, end))
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def conflict(self, start, end):
+        """
+        The existing interval overlapping [start, end), or None. Of those
+        starting before `end`, the last one ends latest.
+        """
+        position = bisect_left(self._starts, end)
+        if position and self._intervals[position - 1][1] > start:
+            return self._intervals[position - 1]
+        return None
+
+    def add(self, start, end):
+        clash = self.conflict(start, end)
+        if clash:
+            raise ValueError(f"{start}-{end} overlaps {clash[0]}-{clash[1]}")
+        position = bisect_left(self._starts, start)
+        self._starts.insert(position, start)
+        self._intervals.insert(position, (start, end))
+
+
+def shortlisted_without_slot(job):
+    return JobApplication.objects.filter(job=job, status=SHORTLISTED, interview_slot__isnull=True)
+
+
+def generate_slots(job, day, start_time, end_time, duration, gap=0, interviewer='', count=None):
+    """
+    Create back-to-back slots of `duration` minutes (`gap` minutes apart)
+    between start_time and end_time on `day`, skipping times the interviewer
+    is already busy. `count` defaults to the shortlisted applicants still
+    without an interview minus the job's open upcoming slots. Returns the
+    new slots.
+    """
+    tz = timezone.get_current_timezone()
+    window_start = timezone.make_aware(datetime.combine(day, start_time), tz)
+    window_end = timezone.make_aware(datetime.combine(day, end_time), tz)
+    length = timedelta(minutes=duration)
+    step_gap = timedelta(minutes=gap)
+
+    with transaction.atomic():
+        list(CompanyProfile.objects.select_for_update().filter(pk=job.company_id).values_list('pk'))
+        if count is None:
+            open_slots = job.interview_slots.filter(application__isnull=True, start__gt=timezone.now()).count()
+            count = max(shortlisted_without_slot(job).count() - open_slots, 0)
+        busy = IntervalIndex(
+            InterviewSlot.objects.filter(
+                company_id=job.company_id, interviewer=interviewer, start__lt=window_end, end__gt=window_start,
+            ).values_list('start', 'end')
+        )
+        slots = []
+        start, now = window_start, timezone.now()
+        if now > start:
+            # The window has begun: continue on its slot grid, not at now's odd seconds
+            step = length + step_gap
+            start += -((start - now) // step) * step
+        while len(slots) < count and start + length <= window_end:
+            clash = busy.conflict(start, start + length)
+            if clash:
+                # Jump straight past the busy interval rather than stepping through it
+                start = clash[1]
+                continue
+            busy.add(start, start + length)
+            slots.append(InterviewSlot(job=job, company_id=job.company_id, interviewer=interviewer,
+                                       start=start, end=start + length))
+            start += length + step_gap
+        InterviewSlot.objects.bulk_create(slots)
+    return slots
+
+
+def open_slots(application):
+    """
+    Upcoming unbooked slots of the application's job, each flagged with
+    `clashes` when it overlaps another interview the candidate has booked.
+    """
+    now = timezone.now()
+    slots = list(application.job.interview_slots.filter(application__isnull=True, start__gt=now))
+    booked = IntervalIndex(
+        InterviewSlot.objects.filter(application__candidate_id=application.candidate_id, end__gt=now)
+        .exclude(application=application).values_list('start', 'end')
+    )
+    for slot in slots:
+        slot.clashes = booked.conflict(slot.start, slot.end) is not None
+    return slots
+
+
+def book_slot(application, slot_id):
+    """
+    Book `slot_id` for the application, releasing any slot it held before.
+    Raises SlotUnavailable if the slot was taken, has passed, or overlaps
+    another of the candidate's interviews.
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            # One booking at a time per candidate, so the overlap check below holds
+            list(CandidateProfile.objects.select_for_update().filter(pk=application.candidate_id).values_list('pk'))
+            slot = InterviewSlot.objects.filter(
+                pk=slot_id, job_id=application.job_id, application__isnull=True, start__gt=now,
+            ).first()
+            if slot is None:
+                raise SlotUnavailable("That interview time is no longer available.")
+            overlapping = InterviewSlot.objects.filter(
+                application__candidate_id=application.candidate_id, start__lt=slot.end, end__gt=slot.start,
+            ).exclude(application=application)
+            if overlapping.exists():
+                raise SlotUnavailable("That time overlaps another interview you have booked.")
+            InterviewSlot.objects.filter(application=application).update(application=None, booked_at=None)
+            claimed = InterviewSlot.objects.filter(pk=slot.pk, application__isnull=True).update(
+                application=application, booked_at=now,
+            )
+            if not claimed:
+                raise SlotUnavailable("That interview time was just booked by someone else.")
+    except IntegrityError:
+        raise SlotUnavailable("This application already has an interview booked.")
+    slot.application = application
+    slot.booked_at = now
+    return slot
+
+
+def cancel_booking(application):
+    """
+    Free the application's upcoming slot; returns whether one was freed.
+    """
+    return bool(
+        InterviewSlot.objects.filter(application=application, start__gt=timezone.now())
+        .update(application=None, booked_at=None)
+    )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from home.archive import archivable_jobs, archive_jobs, retention_days
+
+
+class Command(BaseCommand):
+    help = "Move closed job postings past the retention window, with their applications, into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help="Retention window in days (default: ARCHIVE_AFTER_DAYS, 365).")
+        parser.add_argument('--batch-size', type=int, default=200, help="Postings per transaction.")
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help="Stop after this many batches; rerun to continue.")
+        parser.add_argument('--dry-run', action='store_true', help="Only count what would be archived.")
+
+    def handle(self, *args, **options):
+        days = retention_days() if options['days'] is None else options['days']
+        if options['dry_run']:
+            count = archivable_jobs(days).count()
+            self.stdout.write(f"{count} posting(s) closed for more than {days} day(s) would be archived.")
+            return
+        postings, applications = archive_jobs(days, options['batch_size'], options['max_batches'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {postings} posting(s) and {applications} application(s)."
+        ))
@@ -0,0 +1,62 @@
+import os
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+class Command(BaseCommand):
+    help = "Measure password hashing cost and single-core throughput for each configured hasher."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=5, help="Hashes computed per configuration.")
+        parser.add_argument('--pbkdf2-iterations', type=_int_list, default=[],
+                            help="Extra PBKDF2 iteration counts to try, comma separated.")
+        parser.add_argument('--scrypt-work-factors', type=_int_list, default=[],
+                            help="Extra scrypt work factors (N) to try, comma separated.")
+        parser.add_argument('--argon2-memory-costs', type=_int_list, default=[],
+                            help="Extra Argon2 memory costs (KiB) to try, comma separated.")
+
+    def handle(self, *args, **options):
+        configs = []
+        for hasher in get_hashers():
+            configs.append((type(hasher).__name__, hasher))
+        for iterations in options['pbkdf2_iterations']:
+            hasher = self._variant('TunedPBKDF2PasswordHasher', iterations=iterations)
+            configs.append((f"pbkdf2 iterations={iterations}", hasher))
+        for work_factor in options['scrypt_work_factors']:
+            hasher = self._variant('TunedScryptPasswordHasher', work_factor=work_factor)
+            configs.append((f"scrypt N={work_factor}", hasher))
+        for memory_cost in options['argon2_memory_costs']:
+            hasher = self._variant('TunedArgon2PasswordHasher', memory_cost=memory_cost)
+            configs.append((f"argon2 memory={memory_cost}KiB", hasher))
+
+        cores = os.cpu_count() or 1
+        self.stdout.write(f"{'hasher':45} {'ms/hash':>10} {'hashes/s/core':>14} {'hashes/s/box':>13}")
+        for label, hasher in configs:
+            try:
+                elapsed = self._time(hasher, options['rounds'])
+            except (ValueError, ImportError) as exc:
+                # e.g. argon2-cffi not installed
+                self.stdout.write(f"{label:45} skipped: {exc}")
+                continue
+            per_hash = elapsed / options['rounds']
+            per_core = 1 / per_hash if per_hash else 0
+            self.stdout.write(f"{label:45} {per_hash * 1000:10.1f} {per_core:14.1f} {per_core * cores:13.1f}")
+        self.stdout.write(f"({cores} core(s); box throughput assumes one worker per core)")
+
+    def _variant(self, base_name, **attrs):
+        from home import hashers
+        base = getattr(hashers, base_name)
+        return type(base_name, (base,), attrs)()
+
+    def _time(self, hasher, rounds):
+        salt = hasher.salt()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            hasher.encode('benchmark-password', salt)
+        return time.perf_counter() - start
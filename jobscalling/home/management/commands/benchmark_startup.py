@@ -0,0 +1,79 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter: build the WSGI app, optionally warm it up the
+# way wsgi.py does (plus the post-fork reconnect), then time one request.
+WORKER_SCRIPT = r'''
+import json, os, sys, time
+from wsgiref.util import setup_testing_defaults
+start = time.perf_counter()
+import django
+from django.core.wsgi import get_wsgi_application
+imported = time.perf_counter()
+application = get_wsgi_application()
+ready = time.perf_counter()
+warm = 0.0
+if os.environ['BENCH_WARMUP'] == '1':
+    from home.warmup import connect_databases, warm_up
+    warm_up()
+    connect_databases()
+    warm = time.perf_counter() - ready
+environ = {'PATH_INFO': os.environ['BENCH_PATH'], 'HTTP_HOST': os.environ['BENCH_HOST']}
+setup_testing_defaults(environ)
+status = []
+request_start = time.perf_counter()
+body = application(environ, lambda s, h, exc_info=None: status.append(s))
+for chunk in body:
+    if chunk:
+        break
+ttfb = time.perf_counter() - request_start
+getattr(body, 'close', lambda: None)()
+print(json.dumps({'import': imported - start, 'setup': ready - imported, 'warm': warm,
+                  'ttfb': ttfb, 'status': status[0] if status else ''}))
+'''
+
+
+class Command(BaseCommand):
+    help = "Start fresh worker processes with and without warm-up and report import time and time to first byte."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help="Fresh processes per mode.")
+        parser.add_argument('--path', default='/', help="Path requested by each fresh worker.")
+        parser.add_argument('--host', default='localhost', help="Host header (must be in ALLOWED_HOSTS).")
+
+    def handle(self, *args, **options):
+        rows = []
+        for label, warm in (('cold', '0'), ('warm-up', '1')):
+            samples = [self._run(warm, options) for _ in range(options['runs'])]
+            rows.append((label, samples))
+
+        self.stdout.write(f"{'mode':8} {'process':>9} {'import':>8} {'setup':>8} {'warm-up':>8} {'TTFB':>8}  (median ms, {options['runs']} runs)")
+        for label, samples in rows:
+            med = {key: statistics.median(sample[key] for sample in samples) * 1000
+                   for key in ('process', 'import', 'setup', 'warm', 'ttfb')}
+            self.stdout.write(
+                f"{label:8} {med['process']:9.1f} {med['import']:8.1f} {med['setup']:8.1f} "
+                f"{med['warm']:8.1f} {med['ttfb']:8.1f}  status {samples[0]['status']}"
+            )
+        self.stdout.write("process = interpreter start to response; with a preloading server the "
+                          "warm-up column is paid once in the master, not per worker.")
+
+    def _run(self, warm, options):
+        env = dict(os.environ, BENCH_WARMUP=warm, BENCH_PATH=options['path'], BENCH_HOST=options['host'],
+                   DJANGO_WARMUP='0', DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', ''))
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', WORKER_SCRIPT], cwd=settings.BASE_DIR, env=env,
+                                capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise CommandError(f"worker failed:\n{result.stderr[-2000:]}")
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        sample['process'] = elapsed
+        return sample
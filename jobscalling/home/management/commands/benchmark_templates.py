@@ -0,0 +1,75 @@
+import copy
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template.backends.django import DjangoTemplates
+from django.test import RequestFactory
+
+DISK_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+# Loader setups to compare: templates read and parsed from disk on every
+# render, and the prod profile's cached loader (parse once per process).
+PROFILES = [
+    ('uncached', DISK_LOADERS),
+    ('prod (cached)', [('django.template.loaders.cached.Loader', DISK_LOADERS)]),
+]
+
+
+class Command(BaseCommand):
+    help = "Compare render time of the busiest templates with and without the cached template loader."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--renders', type=int, default=200, help="Renders per template and profile.")
+        parser.add_argument('--template', action='append', dest='templates',
+                            help="Template to render (repeatable). Defaults to landing and candidate dashboard.")
+
+    def handle(self, *args, **options):
+        templates = options['templates'] or ['landing.html', 'CandidateDashboard.html']
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        renders = options['renders']
+
+        self.stdout.write(f"{'template':28} {'profile':15} {'first ms':>9} {'ms/render':>10} {'renders/s':>10}")
+        for name in templates:
+            baseline = None
+            for label, loaders in PROFILES:
+                backend = self._backend(loaders)
+                try:
+                    first, per_render = self._time(backend, name, request, renders)
+                except Exception as exc:
+                    self.stdout.write(f"{name:28} {label:15} failed: {exc}")
+                    continue
+                speedup = f"  x{baseline / per_render:.1f}" if baseline and per_render else ''
+                baseline = baseline or per_render
+                self.stdout.write(
+                    f"{name:28} {label:15} {first * 1000:9.2f} {per_render * 1000:10.3f} "
+                    f"{1 / per_render if per_render else 0:10.0f}{speedup}"
+                )
+        active = settings.TEMPLATES[0].get('OPTIONS', {}).get('loaders')
+        self.stdout.write(f"(active profile loaders: {active or 'Django default for APP_DIRS'})")
+
+    def _backend(self, loaders):
+        config = copy.deepcopy(settings.TEMPLATES[0])
+        options = config.pop('OPTIONS', {})
+        options['loaders'] = loaders
+        return DjangoTemplates({
+            'NAME': 'benchmark',
+            'DIRS': config.get('DIRS', []),
+            'APP_DIRS': False,
+            'OPTIONS': options,
+        })
+
+    def _time(self, backend, name, request, renders):
+        # Look the template up on every render, as render()/TemplateResponse do
+        start = time.perf_counter()
+        backend.get_template(name).render({}, request)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(renders):
+            backend.get_template(name).render({}, request)
+        return first, (time.perf_counter() - start) / renders
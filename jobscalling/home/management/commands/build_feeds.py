@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from home.feeds import build_dirty
+
+
+class Command(BaseCommand):
+    help = "Regenerate the sitemap chunks and job feeds whose postings changed (run from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Rebuild every file, not just dirty ones.")
+
+    def handle(self, *args, **options):
+        rebuilt = build_dirty(rebuild_all=options['all'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(rebuilt)} file(s): {', '.join(rebuilt) or 'none'}."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from home.contention import OPERATIONS, reset, stats
+
+
+class Command(BaseCommand):
+    help = "Show lock-contention retry rates for application and CV submissions (see home/contention.py)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Zero the counters after printing them.")
+
+    def handle(self, *args, **options):
+        for operation, counters in stats().items():
+            calls = counters['calls']
+            if not calls:
+                self.stdout.write(f"{operation}: no submissions recorded")
+                continue
+            self.stdout.write(
+                f"{operation}: {calls} submission(s), "
+                f"{counters['retries']} retried lock wait(s) ({counters['retries'] / calls:.1%}), "
+                f"{counters['exhausted']} gave up ({counters['exhausted'] / calls:.1%}), "
+                f"{counters['duplicates']} duplicate(s) rejected"
+            )
+        if options['reset']:
+            reset(OPERATIONS)
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,125 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from home.models import ArchivedJobApplication, CandidateResume, JobApplication, ResumePreview
+from home.previews import preview_dir
+from home.storage import resume_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete resume files that no CandidateResume or (archived) JobApplication row references, "
+        "with their ResumePreview rows and thumbnails."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='resumes', help="Directory inside the storage to scan.")
+        parser.add_argument('--grace-hours', type=float, default=24,
+                            help="Keep unreferenced files younger than this (uploads still in flight).")
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        storage = resume_storage()
+        refcounts = self.reference_counts()
+        cutoff = time.time() - options['grace_hours'] * 3600
+        root = storage.path(options['prefix'])
+
+        removed = kept = freed = 0
+        for dirpath, dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, storage.location).replace(os.sep, '/')
+                if refcounts.get(name, 0) > 0:
+                    kept += 1
+                    continue
+                stat = os.stat(path)
+                if stat.st_mtime > cutoff:
+                    kept += 1
+                    continue
+                if options['dry_run']:
+                    self.stdout.write(f"would remove {name}")
+                else:
+                    # The snapshot may be minutes old: an identical upload since then
+                    # touched the file (storage dedup) and may have committed a row
+                    if os.stat(path).st_mtime > cutoff or self.is_referenced(name):
+                        kept += 1
+                        continue
+                    os.unlink(path)
+                removed += 1
+                freed += stat.st_size
+
+        if not options['dry_run']:
+            self.prune_empty_dirs(root)
+        previews, thumbnails = self.remove_orphaned_previews(refcounts, cutoff, options['dry_run'])
+        verb = "Would remove" if options['dry_run'] else "Removed"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {removed} orphaned file(s) ({freed} bytes), {previews} preview(s) and "
+            f"{thumbnails} thumbnail(s); {kept} kept."
+        ))
+
+    def reference_counts(self):
+        """
+        Count rows per stored name. Content-addressed names are shared by
+        identical uploads, so a file stays until its last reference is gone.
+        """
+        counts = {}
+        sources = (
+            CandidateResume.objects.values_list('file', flat=True),
+            JobApplication.objects.exclude(resume='').exclude(resume__isnull=True).values_list('resume', flat=True),
+            ArchivedJobApplication.objects.exclude(resume='').exclude(resume__isnull=True)
+            .values_list('resume', flat=True),
+        )
+        for queryset in sources:
+            for name in queryset.iterator(chunk_size=5000):
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def is_referenced(self, name):
+        return (
+            CandidateResume.objects.filter(file=name).exists()
+            or JobApplication.objects.filter(resume=name).exists()
+            or ArchivedJobApplication.objects.filter(resume=name).exists()
+        )
+
+    def remove_orphaned_previews(self, refcounts, cutoff, dry_run):
+        """
+        Drop ResumePreview rows of files nothing references any more, then
+        the thumbnails no remaining row points at (identical uploads share one).
+        """
+        orphaned = set()
+        thumbnails = set()
+        for pk, name, thumbnail in ResumePreview.objects.values_list('pk', 'source_name', 'thumbnail').iterator():
+            if refcounts.get(name, 0) > 0 or self.is_referenced(name):
+                thumbnails.add(thumbnail)
+            else:
+                orphaned.add(pk)
+        if orphaned and not dry_run:
+            ResumePreview.objects.filter(pk__in=orphaned).delete()
+
+        root = os.path.join(settings.MEDIA_ROOT, preview_dir())
+        removed = 0
+        for dirpath, dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, '/')
+                # A young file may be a render whose row is not written yet
+                if name in thumbnails or os.stat(path).st_mtime > cutoff:
+                    continue
+                if dry_run:
+                    self.stdout.write(f"would remove {name}")
+                elif ResumePreview.objects.filter(thumbnail=name).exists():
+                    continue
+                else:
+                    os.unlink(path)
+                removed += 1
+        if not dry_run:
+            self.prune_empty_dirs(root)
+        return len(orphaned), removed
+
+    def prune_empty_dirs(self, root):
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            if dirpath != root and not os.listdir(dirpath):
+                os.rmdir(dirpath)
@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from home.models import CandidateResume, JobApplication, ResumePreview
+from home.previews import render_preview
+from home.storage import resume_storage
+
+
+class Command(BaseCommand):
+    help = "Render thumbnails and text previews for resumes that do not have one yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Renderer processes.")
+        parser.add_argument('--limit', type=int, default=None, help="Render at most this many files.")
+        parser.add_argument('--rebuild', action='store_true', help="Re-render files that already have a preview.")
+
+    def handle(self, *args, **options):
+        names = set(CandidateResume.objects.values_list('file', flat=True).iterator())
+        names |= set(
+            JobApplication.objects.exclude(resume='').exclude(resume__isnull=True)
+            .values_list('resume', flat=True).iterator()
+        )
+        if options['rebuild']:
+            ResumePreview.objects.filter(source_name__in=names).delete()
+        else:
+            names -= set(ResumePreview.objects.values_list('source_name', flat=True).iterator())
+
+        storage = resume_storage()
+        pending = sorted(name for name in names if name and storage.exists(name))
+        if options['limit']:
+            pending = pending[:options['limit']]
+        if not pending:
+            self.stdout.write("No resumes need previews.")
+            return
+
+        created = []
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            futures = {
+                pool.submit(render_preview, storage.path(name), str(settings.MEDIA_ROOT)): name
+                for name in pending
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    digest, text, thumbnail = future.result()
+                except Exception as exc:
+                    self.stderr.write(f"{name}: {exc}")
+                    continue
+                created.append(ResumePreview(source_name=name, content_hash=digest, text=text, thumbnail=thumbnail))
+
+        ResumePreview.objects.bulk_create(created, batch_size=500, ignore_conflicts=True)
+        with_thumbnail = sum(1 for preview in created if preview.thumbnail)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {len(created)} preview(s), {with_thumbnail} with thumbnails."
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from home.alerts import match_new_jobs
+
+
+class Command(BaseCommand):
+    help = "Match postings created since each saved search's high-water mark and batch them into alerts (run from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Postings read per query.")
+
+    def handle(self, *args, **options):
+        scanned, alerts = match_new_jobs(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Checked {scanned} new posting(s); created {alerts} alert(s)."))
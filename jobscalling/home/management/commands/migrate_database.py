@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from home.dbcopy import CopyError, copy_database, copyable_models, drop_checkpoint_table, empty_target, verify
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream every table from one database alias into another (e.g. SQLite to PostgreSQL) in "
+        "foreign-key order, resumable from checkpoints, then verify row counts and checksums. "
+        "Run `migrate --database <target>` first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default='default', help="Database alias to read from.")
+        parser.add_argument('--target', required=True, help="Database alias to write to.")
+        parser.add_argument('--app', action='append', dest='apps', metavar='APP_LABEL',
+                            help="Only copy this app's tables (repeatable; default: every installed app).")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Rows per transaction and checkpoint.")
+        parser.add_argument('--restart', action='store_true',
+                            help="Empty the target tables and drop the checkpoints before copying.")
+        parser.add_argument('--verify-only', action='store_true', help="Only compare counts and checksums.")
+
+    def handle(self, *args, **options):
+        source, target = options['source'], options['target']
+        self.verbosity = options['verbosity']
+        for alias in (source, target):
+            if alias not in settings.DATABASES:
+                raise CommandError(f"Unknown database alias '{alias}'.")
+        if source == target:
+            raise CommandError("Source and target must be different databases.")
+        try:
+            models = copyable_models(options['apps'])
+        except (CopyError, LookupError) as exc:
+            raise CommandError(exc)
+
+        if not options['verify_only']:
+            if options['restart']:
+                empty_target(models, target)
+            try:
+                timings = copy_database(models, source, target, options['batch_size'], self._progress)
+            except CopyError as exc:
+                raise CommandError(exc)
+            for model, (rows, seconds) in timings.items():
+                rate = f", {rows / seconds:,.0f} rows/s" if seconds > 0.01 else ""
+                self.stdout.write(f"{model._meta.label}: {rows} row(s) in {seconds:.1f}s{rate}")
+
+        mismatched = []
+        for model, (source_count, source_sum), (target_count, target_sum) in verify(
+            models, source, target, options['batch_size'],
+        ):
+            if (source_count, source_sum) != (target_count, target_sum):
+                mismatched.append(model._meta.label)
+                self.stderr.write(
+                    f"{model._meta.label}: source {source_count} row(s) [{source_sum}], "
+                    f"target {target_count} row(s) [{target_sum}]"
+                )
+        if mismatched:
+            raise CommandError(f"Verification failed for {len(mismatched)} table(s): {', '.join(mismatched)}")
+        if not options['verify_only']:
+            drop_checkpoint_table(target)
+        self.stdout.write(self.style.SUCCESS(
+            f"Verified {len(models)} table(s): row counts and checksums match on '{source}' and '{target}'."
+        ))
+
+    def _progress(self, model, copied):
+        if self.verbosity >= 2:
+            self.stdout.write(f"  {model._meta.label}: {copied} row(s) copied")
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from home.models import ReviewStats
+from home.moderation import moderate_pending_reviews
+
+
+class Command(BaseCommand):
+    help = "Screen pending reviews in batches and publish the ones that pass."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help="Reviews screened per batch.")
+        parser.add_argument('--once', action='store_true', help="Process a single batch and exit.")
+        parser.add_argument('--refresh-stats', action='store_true', help="Rebuild the landing page aggregate row.")
+
+    def handle(self, *args, **options):
+        if options['refresh_stats']:
+            stats = ReviewStats.refresh()
+            self.stdout.write(f"Refreshed review stats: {stats}")
+
+        total_approved = total_rejected = 0
+        while True:
+            approved, rejected = moderate_pending_reviews(options['batch_size'])
+            total_approved += approved
+            total_rejected += rejected
+            if options['once'] or not (approved or rejected):
+                break
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Approved {total_approved} review(s), rejected {total_rejected}."
+        ))
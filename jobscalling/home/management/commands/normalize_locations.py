@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from home.cache import invalidate_job
+from home.facets import rebuild_facet_counts
+from home.geo import resolve_location
+from home.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = "Resolve JobPosting.location text to normalized Locations and set the remote flag, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Postings per transaction.")
+        parser.add_argument('--all', action='store_true',
+                            help="Re-resolve every posting, not just those without a normalized location.")
+
+    def handle(self, *args, **options):
+        queryset = JobPosting.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(normalized_location__isnull=True)
+        memo = {}
+        last_id = 0
+        scanned = changed = 0
+        while True:
+            # Keyset pagination: each batch commits on its own, so an
+            # interrupted run simply picks up the remaining rows next time.
+            with transaction.atomic():
+                batch = list(
+                    queryset.filter(id__gt=last_id).order_by('id')
+                    .only('id', 'location', 'normalized_location', 'is_remote')[:options['batch_size']]
+                )
+                if not batch:
+                    break
+                updated = []
+                for job in batch:
+                    location, text_remote = resolve_location(job.location, memo)
+                    is_remote = job.is_remote or text_remote
+                    new_id = location.pk if location else None
+                    if new_id != job.normalized_location_id or is_remote != job.is_remote:
+                        job.normalized_location_id = new_id
+                        job.is_remote = is_remote
+                        updated.append(job)
+                JobPosting.objects.bulk_update(updated, ['normalized_location', 'is_remote'])
+            for job in updated:
+                invalidate_job(job.pk)
+            scanned += len(batch)
+            changed += len(updated)
+            last_id = batch[-1].id
+
+        # bulk_update sends no signals, so rebuild the facet table once at the end
+        if changed:
+            rebuild_facet_counts()
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {scanned} posting(s), updated {changed}; {len(memo)} distinct location(s)."
+        ))
@@ -0,0 +1,49 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_WIDTHS = [48, 96, 192]
+
+
+class Command(BaseCommand):
+    help = "Write resized JPEG and WebP variants of static images for srcset use (requires Pillow)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('images', nargs='+', help="Image paths relative to the first STATICFILES_DIRS entry.")
+        parser.add_argument('--widths', default=','.join(map(str, DEFAULT_WIDTHS)),
+                            help="Comma separated target widths in pixels.")
+        parser.add_argument('--output-dir', default='img', help="Output directory inside the static dir.")
+        parser.add_argument('--quality', type=int, default=82)
+
+    def handle(self, *args, **options):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise CommandError("Pillow is required: pip install Pillow")
+
+        static_dir = str(settings.STATICFILES_DIRS[0])
+        out_dir = os.path.join(static_dir, options['output_dir'])
+        os.makedirs(out_dir, exist_ok=True)
+        widths = [int(w) for w in options['widths'].split(',') if w.strip()]
+
+        for rel_path in options['images']:
+            source = os.path.join(static_dir, rel_path)
+            stem = self._stem(rel_path)
+            with Image.open(source) as image:
+                image = image.convert('RGB')
+                for width in widths:
+                    if width > image.width:
+                        continue
+                    height = round(image.height * width / image.width)
+                    resized = image.resize((width, height), Image.LANCZOS)
+                    for ext, fmt, extra in (('jpg', 'JPEG', {'optimize': True, 'progressive': True}),
+                                            ('webp', 'WEBP', {'method': 6})):
+                        target = os.path.join(out_dir, f"{stem}-{width}.{ext}")
+                        resized.save(target, fmt, quality=options['quality'], **extra)
+                        self.stdout.write(f"{target} ({os.path.getsize(target)} bytes)")
+
+    def _stem(self, rel_path):
+        # "jobs_calling_logoge 2025-10-05 at ..." -> "jobs-calling-logoge"
+        base = os.path.splitext(os.path.basename(rel_path))[0].split(' ')[0]
+        return base.replace('_', '-').lower()
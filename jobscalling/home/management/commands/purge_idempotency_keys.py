@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from home.idempotency import MAX_AGE_HOURS
+from home.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Delete idempotency keys older than their retry window, in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=float, default=MAX_AGE_HOURS, help="Keep keys younger than this.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows deleted per transaction.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        deleted = 0
+        while True:
+            ids = list(
+                IdempotencyKey.objects.filter(created_at__lt=cutoff)
+                .values_list('id', flat=True)[:options['batch_size']]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                count, _ = IdempotencyKey.objects.filter(id__in=ids).delete()
+            deleted += count
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} idempotency key(s)."))
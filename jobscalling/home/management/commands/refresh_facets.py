@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from home.facets import rebuild_facet_counts
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job facet summary table from the live JobPosting rows."
+
+    def handle(self, *args, **options):
+        rows = rebuild_facet_counts()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} facet count row(s)."))
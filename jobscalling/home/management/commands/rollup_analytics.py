@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from home.analytics import rollup
+
+
+class Command(BaseCommand):
+    help = "Fold new applications and status changes into the company analytics rollups."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per transaction.")
+
+    def handle(self, *args, **options):
+        applications, events = rollup(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled up {applications} application(s) and {events} status event(s)."
+        ))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from home.models import JobPosting
+from home.screening import backfill, rescreen
+
+
+class Command(BaseCommand):
+    help = "Parse experience/education on older applications, then re-run every posting's knockout rules over its applicants."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Applications parsed per UPDATE batch.")
+        parser.add_argument('--reparse', action='store_true',
+                            help="Re-parse every application, not only those never parsed (after a parser fix).")
+        parser.add_argument('--job', type=int, action='append', dest='jobs', help="Only this posting id (repeatable).")
+
+    def handle(self, *args, **options):
+        parsed = backfill(options['batch_size'], reparse=options['reparse'])
+        jobs = JobPosting.objects.filter(applications__isnull=False).distinct()
+        if options['jobs']:
+            jobs = jobs.filter(id__in=options['jobs'])
+        screened = 0
+        for job in jobs.only('id', 'min_experience_months', 'min_education_level', 'screen_salary', 'max_salary'):
+            rescreen(job)
+            screened += 1
+        self.stdout.write(self.style.SUCCESS(
+            f"Parsed {parsed} application(s); screened the applicants of {screened} posting(s)."
+        ))
@@ -0,0 +1,138 @@
+"""
+Hand protected media files to the client without a public MEDIA_URL.
+
+MEDIA_SERVE_METHOD picks how the bytes leave the server:
+  'x-accel'    - nginx: respond with X-Accel-Redirect to MEDIA_ACCEL_PREFIX
+                 (an `internal` location aliased to MEDIA_ROOT)
+  'x-sendfile' - Apache mod_xsendfile / lighttpd: X-Sendfile with the path
+  'django'     - FileResponse fallback (wsgi.file_wrapper / sendfile where
+                 the server supports it) with Range and conditional support
+With a front server the worker only does the permission check.
+"""
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from django.utils.encoding import escape_uri_path
+
+RANGE_HEADER = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _not_modified(request, stat, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+    since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return since is not None and int(stat.st_mtime) <= since
+
+
+def _disposition(filename, as_attachment):
+    kind = 'attachment' if as_attachment else 'inline'
+    return f"{kind}; filename*=UTF-8''{escape_uri_path(filename)}"
+
+
+class _RangeFile:
+    """File wrapper that yields only `length` bytes from the current offset."""
+    block_size = 64 * 1024
+
+    def __init__(self, handle, length):
+        self.handle = handle
+        self.remaining = length
+
+    def __iter__(self):
+        while self.remaining > 0:
+            chunk = self.handle.read(min(self.block_size, self.remaining))
+            if not chunk:
+                break
+            self.remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        self.handle.close()
+
+
+def protected_file_response(request, field_file, filename=None, as_attachment=False):
+    """
+    Build the response for an already-authorized FieldFile.
+    """
+    if not field_file:
+        raise Http404("No file attached.")
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        raise Http404("File not found.")
+    return protected_path_response(request, path, field_file.name, filename, as_attachment)
+
+
+def protected_path_response(request, path, name, filename=None, as_attachment=False):
+    """
+    Same as protected_file_response for a file under MEDIA_ROOT given by its
+    absolute `path` and MEDIA_ROOT-relative `name`.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise Http404("File not found.")
+
+    filename = filename or os.path.basename(name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    etag = _etag(stat)
+    method = getattr(settings, 'MEDIA_SERVE_METHOD', 'django')
+
+    if _not_modified(request, stat, etag):
+        response = HttpResponseNotModified()
+    elif method == 'x-accel':
+        response = HttpResponse(content_type=content_type)
+        prefix = getattr(settings, 'MEDIA_ACCEL_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + escape_uri_path(name)
+    elif method == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = path
+    else:
+        response = _file_response(request, path, stat, content_type)
+
+    # The front server honours Range/conditional requests itself for X-Accel/X-Sendfile
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = _disposition(filename, as_attachment)
+    response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    response['X-Content-Type-Options'] = 'nosniff'
+    return response
+
+
+def _file_response(request, path, stat, content_type):
+    size = stat.st_size
+    match = RANGE_HEADER.match(request.META.get('HTTP_RANGE', '').strip())
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if match and (if_range is None or if_range == _etag(stat)):
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        elif last:
+            start = max(size - int(last), 0)
+            end = size - 1
+        else:
+            start, end = 0, -1
+        if start > end or start >= size:
+            response = HttpResponse(status=416, content_type=content_type)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        handle = open(path, 'rb')
+        handle.seek(start)
+        response = FileResponse(_RangeFile(handle, end - start + 1), status=206, content_type=content_type)
+        response['Content-Length'] = end - start + 1
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        return response
+
+    response = FileResponse(open(path, 'rb'), content_type=content_type)
+    response['Content-Length'] = size
+    return response
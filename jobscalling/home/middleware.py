@@ -0,0 +1,157 @@
+import json
+import logging
+import mimetypes
+import os
+import re
+import time
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_etags
+
+from .profiling import profile_call, requested_mode, save_slow_queries, timed_queries
+
+logger = logging.getLogger(__name__)
+
+# Matches the 12-hex-digit hash ManifestStaticFilesStorage inserts into names
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.')
+ONE_YEAR = 60 * 60 * 24 * 365
+# Pre-compressed siblings, preferred in this order when the client rates them equally
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def accepted_encodings(header):
+    """
+    {coding: q} from an Accept-Encoding header; q=0 means "not acceptable".
+    """
+    codings = {}
+    for item in header.split(','):
+        coding, *params = item.split(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding] = q
+    return codings
+
+
+class StaticFilesMiddleware:
+    """
+    Serve collected static files from STATIC_ROOT inside the Django process,
+    for single-box deployments without a front server.
+
+    Hashed (manifest) names get a one-year immutable Cache-Control; anything
+    else gets STATIC_MAX_AGE. Pre-compressed `.br`/`.gz` siblings written by
+    CompressedManifestStaticFilesStorage are chosen from Accept-Encoding.
+    Enabled by SERVE_STATIC (defaults to the inverse of DEBUG).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'SERVE_STATIC', not settings.DEBUG) and settings.STATIC_ROOT
+        self.prefix = '/' + settings.STATIC_URL.lstrip('/')
+        self.root = os.path.realpath(settings.STATIC_ROOT) if self.enabled else None
+        self.max_age = getattr(settings, 'STATIC_MAX_AGE', 60)
+        self.hashed = self._load_manifest() if self.enabled else set()
+
+    def __call__(self, request):
+        if self.enabled and request.path.startswith(self.prefix) and request.method in ('GET', 'HEAD'):
+            response = self.serve(request, request.path[len(self.prefix):])
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(settings.STATIC_ROOT, 'staticfiles.json')) as manifest:
+                return set(json.load(manifest).get('paths', {}).values())
+        except (OSError, ValueError):
+            return set()
+
+    def serve(self, request, name):
+        path = os.path.realpath(os.path.join(self.root, name))
+        if not path.startswith(self.root + os.sep) or not os.path.isfile(path):
+            return None
+
+        content_type, _ = mimetypes.guess_type(path)
+        codings = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        encoding, suffix, best = None, '', 0
+        for candidate, candidate_suffix in ENCODINGS:
+            # "*" stands for any coding the header does not name
+            q = codings.get(candidate, codings.get('*', 0))
+            if q > best and os.path.isfile(path + candidate_suffix):
+                encoding, suffix, best = candidate, candidate_suffix, q
+        path += suffix
+
+        stat = os.stat(path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        if etag in if_none_match or f'W/{etag}' in if_none_match or '*' in if_none_match:
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(open(path, 'rb'), content_type=content_type or 'application/octet-stream')
+            response['Content-Length'] = stat.st_size
+            del response['Content-Disposition']
+            if encoding:
+                response['Content-Encoding'] = encoding
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        response['Vary'] = 'Accept-Encoding'
+        if name in self.hashed or HASHED_NAME.search(name):
+            response['Cache-Control'] = f'public, max-age={ONE_YEAR}, immutable'
+        else:
+            response['Cache-Control'] = f'public, max-age={self.max_age}'
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Capture slow SQL statements on every request, and profile single
+    requests when staff ask for it (see home/profiling.py). Must come after
+    AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold_ms = getattr(settings, 'PROFILING', {}).get('SLOW_QUERY_MS', 0)
+
+    def __call__(self, request):
+        mode = requested_mode(request)
+        if not mode and not self.threshold_ms:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        stack, timers = timed_queries(self.threshold_ms)
+        with stack:
+            if mode:
+                response, stats, flame, raw = profile_call(mode, lambda: self.get_response(request))
+            else:
+                response = self.get_response(request)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        match = request.resolver_match
+        view = f"{match.func.__module__}.{match.func.__name__}" if match else ''
+        try:
+            profile = None
+            if mode:
+                from .models import RequestProfile
+
+                profile = RequestProfile.objects.create(
+                    mode=mode, method=request.method, path=request.get_full_path()[:255], view=view,
+                    user=request.user, status_code=response.status_code, duration_ms=round(duration_ms, 2),
+                    query_count=sum(timer.count for timer in timers),
+                    query_ms=round(sum(timer.total_ms for timer in timers), 2),
+                    stats=stats, flame=flame, raw=raw,
+                )
+                response['X-Profile-Id'] = str(profile.pk)
+            save_slow_queries(timers, view, request.path, profile)
+        except Exception:
+            logger.exception("could not store profiling data for %s", request.path)
+        return response
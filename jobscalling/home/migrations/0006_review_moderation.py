@@ -0,0 +1,85 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:18
+
+import hashlib
+import re
+
+from django.db import migrations, models
+
+
+def approve_existing_reviews(apps, schema_editor):
+    # Reviews published before moderation existed stay published
+    Review = apps.get_model('home', 'Review')
+    ReviewStats = apps.get_model('home', 'ReviewStats')
+    db_alias = schema_editor.connection.alias
+    for review in Review.objects.using(db_alias):
+        normalized = re.sub(r'[\W_]+', ' ', (review.review or '').lower()).strip()
+        review.fingerprint = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        review.status = 'APPROVED' if review.is_active else 'REJECTED'
+        review.save(update_fields=['fingerprint', 'status'])
+
+    published = Review.objects.using(db_alias).filter(is_active=True)
+    totals = published.aggregate(total=models.Count('id'), avg=models.Avg('rating'))
+    ReviewStats.objects.using(db_alias).update_or_create(
+        pk=1,
+        defaults={
+            'total_count': totals['total'] or 0,
+            'student_count': published.filter(reviewer_type='student').count(),
+            'company_count': published.filter(reviewer_type='company').count(),
+            'average_rating': round(totals['avg'] or 0, 2),
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0005_review'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_count', models.PositiveIntegerField(default=0)),
+                ('student_count', models.PositiveIntegerField(default=0)),
+                ('company_count', models.PositiveIntegerField(default=0)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=0, max_digits=3)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Review Stats',
+                'verbose_name_plural': 'Review Stats',
+            },
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='fingerprint',
+            field=models.CharField(blank=True, db_index=True, help_text='Hash of the normalized review text, used for dedupe.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='moderated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='rejection_reason',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending Moderation'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected')], db_index=True, default='PENDING', help_text='Moderation state of this review.', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='submitter_ip',
+            field=models.GenericIPAddressField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['is_active', 'reviewer_type', '-created_at'], name='review_landing_idx'),
+        ),
+        migrations.RunPython(approve_existing_reviews, migrations.RunPython.noop),
+    ]
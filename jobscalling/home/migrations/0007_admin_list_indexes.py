@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0006_review_moderation'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidateprofile',
+            name='full_name',
+            field=models.CharField(db_index=True, max_length=150),
+        ),
+        migrations.AlterField(
+            model_name='companyprofile',
+            name='company_name',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='jobposting',
+            name='title',
+            field=models.CharField(db_index=True, help_text="The job title (e.g., 'Senior Python Developer')", max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='candidateresume',
+            index=models.Index(fields=['-uploaded_at'], name='resume_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['-application_date'], name='jobapp_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['-posted_date'], name='jobposting_posted_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:25
+
+import home.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0007_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidateresume',
+            name='file',
+            field=models.FileField(storage=home.storage.resume_storage, upload_to='resumes/'),
+        ),
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='resume',
+            field=models.FileField(blank=True, help_text='Uploaded resume file.', null=True, storage=home.storage.resume_storage, upload_to='resumes/'),
+        ),
+    ]
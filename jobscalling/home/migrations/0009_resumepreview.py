@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0008_resume_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumePreview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_name', models.CharField(help_text='Storage name of the resume file.', max_length=255, unique=True)),
+                ('content_hash', models.CharField(db_index=True, max_length=64)),
+                ('thumbnail', models.CharField(blank=True, help_text='MEDIA_ROOT-relative PNG of the first page.', max_length=255)),
+                ('text', models.TextField(blank=True, help_text='Plain-text excerpt of the first page.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Resume Preview',
+                'verbose_name_plural': 'Resume Previews',
+            },
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:28
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def backfill_job_facets(apps, schema_editor):
+    JobPosting = apps.get_model('home', 'JobPosting')
+    JobFacetCount = apps.get_model('home', 'JobFacetCount')
+    bands = [('lt20k', 0, 20000), ('20k-50k', 20000, 50000), ('50k-100k', 50000, 100000), ('100k+', 100000, None)]
+
+    db_alias = schema_editor.connection.alias
+    counts = Counter()
+    for job in JobPosting.objects.using(db_alias).select_related('company'):
+        top = job.max_salary if job.max_salary is not None else job.min_salary
+        job.salary_band = 'none'
+        if top is not None:
+            for key, low, high in bands:
+                if top >= low and (high is None or top < high):
+                    job.salary_band = key
+        job.location = (job.location or '').strip()
+        job.save(update_fields=['salary_band', 'location'])
+        if job.is_active:
+            for facet, value in (('job_type', job.job_type), ('location', job.location),
+                                 ('salary_band', job.salary_band), ('industry', (job.company.industry or '').strip())):
+                if value:
+                    counts[(facet, value)] += 1
+
+    JobFacetCount.objects.using(db_alias).bulk_create(
+        [JobFacetCount(facet=facet, value=value, count=count) for (facet, value), count in counts.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0009_resumepreview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(choices=[('job_type', 'Job Type'), ('location', 'Location'), ('salary_band', 'Salary Band'), ('industry', 'Industry')], max_length=20)),
+                ('value', models.CharField(max_length=200)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Job Facet Count',
+                'verbose_name_plural': 'Job Facet Counts',
+            },
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='salary_band',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='companyprofile',
+            name='industry',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='jobposting',
+            name='location',
+            field=models.CharField(db_index=True, help_text="City, State, or 'Remote'", max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'job_type', '-posted_date'], name='jobposting_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'location', '-posted_date'], name='jobposting_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'salary_band', '-posted_date'], name='jobposting_salary_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobfacetcount',
+            unique_together={('facet', 'value')},
+        ),
+        migrations.RunPython(backfill_job_facets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def seed_status_events(apps, schema_editor):
+    # Applications already past PENDING get an initial event so the funnel
+    # rollup credits their current stage (no time-to-review is known for them).
+    JobApplication = apps.get_model('home', 'JobApplication')
+    ApplicationStatusEvent = apps.get_model('home', 'ApplicationStatusEvent')
+    db_alias = schema_editor.connection.alias
+    ApplicationStatusEvent.objects.using(db_alias).bulk_create([
+        ApplicationStatusEvent(application_id=app_id, job_id=job_id, from_status='', to_status=status)
+        for app_id, job_id, status in JobApplication.objects.using(db_alias).exclude(status='PENDING').values_list('id', 'job_id', 'status')
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0010_job_facets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, max_length=10)),
+                ('to_status', models.CharField(max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='home.jobapplication')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='home.jobposting')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobFunnelStats',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='funnel', serialize=False, to='home.jobposting')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('reached_reviewed', models.PositiveIntegerField(default=0)),
+                ('reached_interview', models.PositiveIntegerField(default=0)),
+                ('reached_offer', models.PositiveIntegerField(default=0)),
+                ('hired', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('reviewed_count', models.PositiveIntegerField(default=0)),
+                ('review_seconds', models.BigIntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='funnel_stats', to='home.companyprofile')),
+            ],
+            options={
+                'verbose_name_plural': 'Job Funnel Stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='JobDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('status_changes', models.PositiveIntegerField(default=0)),
+                ('reviewed', models.PositiveIntegerField(default=0, help_text='Applications that left PENDING on this day.')),
+                ('review_seconds', models.BigIntegerField(default=0, help_text='Sum of time-to-review for `reviewed`.')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='home.companyprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='home.jobposting')),
+            ],
+            options={
+                'verbose_name_plural': 'Job Daily Stats',
+                'indexes': [models.Index(fields=['company', 'date'], name='dailystats_company_idx')],
+                'unique_together': {('job', 'date')},
+            },
+        ),
+        migrations.RunPython(seed_status_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0011_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('country', models.CharField(blank=True, max_length=2)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('grid_lat', models.IntegerField(blank=True, null=True)),
+                ('grid_lon', models.IntegerField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='jobposting',
+            name='jobposting_location_idx',
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='is_remote',
+            field=models.BooleanField(db_index=True, default=False, help_text='Can this job be done remotely?'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['grid_lat', 'grid_lon'], name='location_grid_idx'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='normalized_location',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job_postings', to='home.location'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'normalized_location', '-posted_date'], name='jobposting_place_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'is_remote', '-posted_date'], name='jobposting_remote_idx'),
+        ),
+    ]
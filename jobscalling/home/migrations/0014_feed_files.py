@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0013_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('dirty', models.BooleanField(db_index=True, default=True)),
+                ('item_count', models.IntegerField(default=0)),
+                ('generated_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:45
+
+import django.db.models.deletion
+import home.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0014_feed_files'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJobPosting',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('location', models.CharField(max_length=100)),
+                ('is_remote', models.BooleanField(default=False)),
+                ('job_type', models.CharField(choices=[('FT', 'Full-time'), ('PT', 'Part-time'), ('CT', 'Contract'), ('IT', 'Internship')], max_length=2)),
+                ('min_salary', models.IntegerField(blank=True, null=True)),
+                ('max_salary', models.IntegerField(blank=True, null=True)),
+                ('requirements', models.TextField()),
+                ('posted_date', models.DateTimeField()),
+                ('application_deadline', models.DateField(blank=True, null=True)),
+                ('application_count', models.IntegerField(default=0)),
+                ('hired_count', models.IntegerField(default=0)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_job_postings', to='home.companyprofile')),
+            ],
+            options={
+                'verbose_name_plural': 'Archived Job Postings',
+                'ordering': ['-posted_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedJobApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('full_name', models.CharField(default='', max_length=100)),
+                ('email', models.EmailField(default='', max_length=254)),
+                ('phone', models.CharField(default='', max_length=20)),
+                ('dob', models.DateField(blank=True, null=True)),
+                ('education', models.CharField(blank=True, max_length=200)),
+                ('experience', models.CharField(blank=True, max_length=50)),
+                ('expected_salary', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('skills', models.TextField(blank=True)),
+                ('portfolio', models.URLField(blank=True)),
+                ('cover_letter', models.TextField(blank=True, null=True)),
+                ('resume', models.FileField(blank=True, null=True, storage=home.storage.resume_storage, upload_to='resumes/')),
+                ('application_date', models.DateTimeField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending Review'), ('REVIEWED', 'Reviewed'), ('INTERVIEW', 'Interview Scheduled'), ('OFFER', 'Offer Extended'), ('HIRED', 'Hired'), ('REJECTED', 'Rejected')], max_length=10)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='home.candidateprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='home.archivedjobposting')),
+            ],
+            options={
+                'verbose_name_plural': 'Archived Job Applications',
+                'ordering': ['-application_date'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedjobposting',
+            index=models.Index(fields=['company', '-posted_date'], name='archivedjob_company_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedjobapplication',
+            index=models.Index(fields=['candidate', '-application_date'], name='archivedapp_candidate_idx'),
+        ),
+    ]
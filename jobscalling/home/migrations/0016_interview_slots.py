@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0015_job_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interviewer', models.CharField(blank=True, help_text="Leave blank for the company's shared calendar.", max_length=100)),
+                ('start', models.DateTimeField()),
+                ('end', models.DateTimeField()),
+                ('booked_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('application', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='interview_slot', to='home.jobapplication')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interview_slots', to='home.companyprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interview_slots', to='home.jobposting')),
+            ],
+            options={
+                'ordering': ['start'],
+                'indexes': [models.Index(fields=['job', 'start'], name='interviewslot_job_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end__gt', models.F('start'))), name='interviewslot_end_after_start'), models.UniqueConstraint(fields=('company', 'interviewer', 'start'), name='interviewslot_unique_start')],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0018_request_profiling'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='education_level',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Secondary (SSC / O level)'), (2, 'Higher secondary (HSC / A level)'), (3, 'Diploma'), (4, "Bachelor's"), (5, "Master's"), (6, 'Doctorate')], editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='experience_months',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='screening_flags',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='min_education_level',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Secondary (SSC / O level)'), (2, 'Higher secondary (HSC / A level)'), (3, 'Diploma'), (4, "Bachelor's"), (5, "Master's"), (6, 'Doctorate')], help_text='Flag applicants below this education level (optional).', null=True),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='min_experience_months',
+            field=models.PositiveIntegerField(blank=True, help_text='Flag applicants with less experience than this, in months (optional).', null=True),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='screen_salary',
+            field=models.BooleanField(default=False, help_text='Flag applicants whose expected salary is above the maximum salary.'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'screening_flags'], name='jobapp_screening_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'experience_months'], name='jobapp_experience_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'education_level'], name='jobapp_education_idx'),
+        ),
+    ]
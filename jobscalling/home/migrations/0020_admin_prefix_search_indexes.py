@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# Columns the admin searches by prefix (istartswith). A plain B-tree index
+# does not serve a case-insensitive LIKE, so each gets an index in the form
+# the backend's istartswith can use.
+PREFIX_SEARCHED = [
+    ('home_jobposting', 'title'),
+    ('home_companyprofile', 'company_name'),
+    ('home_candidateprofile', 'full_name'),
+    ('home_candidateresume', 'original_filename'),
+    ('home_location', 'name'),
+    ('home_location', 'key'),
+    ('home_savedsearch', 'name'),
+    ('home_interviewslot', 'interviewer'),
+    ('home_archivedjobposting', 'title'),
+    ('home_requestprofile', 'path'),
+    ('home_requestprofile', 'view'),
+    ('home_slowquery', 'view'),
+]
+
+
+def _index_sql(connection, table, column):
+    name = connection.ops.quote_name(f'{table}_{column}_ci'[:63])
+    table, column = connection.ops.quote_name(table), connection.ops.quote_name(column)
+    if connection.vendor == 'sqlite':
+        # LIKE is case-insensitive on SQLite and uses a NOCASE index for a constant prefix
+        return f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({column} COLLATE NOCASE)', name
+    if connection.vendor == 'postgresql':
+        # istartswith compiles to UPPER(col::text) LIKE UPPER(%s)
+        return f'CREATE INDEX IF NOT EXISTS {name} ON {table} ((UPPER({column}::text)) text_pattern_ops)', name
+    return None, name
+
+
+def create_indexes(apps, schema_editor):
+    for table, column in PREFIX_SEARCHED:
+        sql, _name = _index_sql(schema_editor.connection, table, column)
+        if sql:
+            schema_editor.execute(sql)
+
+
+def drop_indexes(apps, schema_editor):
+    for table, column in PREFIX_SEARCHED:
+        sql, name = _index_sql(schema_editor.connection, table, column)
+        if sql:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0019_applicant_screening'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:21
+
+import django.db.models.deletion
+from collections import defaultdict
+
+from django.db import migrations, models
+
+# As in home.analytics at the time of this migration
+STAGES = ['PENDING', 'REVIEWED', 'INTERVIEW', 'OFFER', 'HIRED']
+STAGE_FLAGS = {'REVIEWED': 1, 'INTERVIEW': 2, 'OFFER': 4, 'HIRED': 8}
+STAGE_FIELDS = {'REVIEWED': 'reached_reviewed', 'INTERVIEW': 'reached_interview', 'OFFER': 'reached_offer', 'HIRED': 'hired'}
+REJECTED = 16
+LEFT_PENDING = 32
+
+
+def _event_flags(from_status, to_status):
+    to_stage = STAGES.index(to_status) if to_status in STAGES else None
+    flags = sum(STAGE_FLAGS[stage] for stage in STAGES[1:to_stage + 1]) if to_stage else 0
+    if to_status == 'REJECTED':
+        flags |= REJECTED
+    if from_status == 'PENDING' and to_status != 'PENDING':
+        flags |= LEFT_PENDING
+    return flags
+
+
+def backfill_funnel_flags(apps, schema_editor):
+    # Flags for the events already rolled up, and the funnel's stage counts
+    # recounted from them (they used to count every forward transition).
+    RollupCheckpoint = apps.get_model('home', 'RollupCheckpoint')
+    ApplicationStatusEvent = apps.get_model('home', 'ApplicationStatusEvent')
+    ApplicationFunnel = apps.get_model('home', 'ApplicationFunnel')
+    JobFunnelStats = apps.get_model('home', 'JobFunnelStats')
+    db_alias = schema_editor.connection.alias
+    checkpoint = RollupCheckpoint.objects.using(db_alias).filter(name='status_events').first()
+    if checkpoint is None:
+        return
+    flags = defaultdict(int)
+    jobs = {}
+    events = (
+        ApplicationStatusEvent.objects.using(db_alias).filter(id__lte=checkpoint.last_id)
+        .values_list('application_id', 'job_id', 'from_status', 'to_status').iterator(chunk_size=2000)
+    )
+    for application_id, job_id, from_status, to_status in events:
+        flags[application_id] |= _event_flags(from_status, to_status)
+        jobs[application_id] = job_id
+    ApplicationFunnel.objects.using(db_alias).bulk_create(
+        [ApplicationFunnel(application_id=application_id, flags=value) for application_id, value in flags.items()],
+        batch_size=1000,
+    )
+    counts = defaultdict(lambda: defaultdict(int))
+    for application_id, value in flags.items():
+        for stage, flag in STAGE_FLAGS.items():
+            if value & flag:
+                counts[jobs[application_id]][STAGE_FIELDS[stage]] += 1
+        if value & REJECTED:
+            counts[jobs[application_id]]['rejected'] += 1
+    for stats in JobFunnelStats.objects.using(db_alias).all():
+        job_counts = counts.get(stats.job_id, {})
+        for field in [*STAGE_FIELDS.values(), 'rejected']:
+            setattr(stats, field, job_counts.get(field, 0))
+        stats.save(using=db_alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0020_admin_prefix_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationFunnel',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='home.jobapplication')),
+                ('flags', models.PositiveSmallIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='rollupcheckpoint',
+            name='gaps',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(backfill_funnel_flags, migrations.RunPython.noop),
+    ]
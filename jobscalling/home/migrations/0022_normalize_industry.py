@@ -0,0 +1,46 @@
+from collections import Counter
+
+from django.db import migrations
+
+
+def _normalize(industry):
+    return ' '.join((industry or '').split())
+
+
+def normalize_industry(apps, schema_editor):
+    # One spelling everywhere: company rows, facet rows and saved filters
+    CompanyProfile = apps.get_model('home', 'CompanyProfile')
+    JobFacetCount = apps.get_model('home', 'JobFacetCount')
+    SavedSearch = apps.get_model('home', 'SavedSearch')
+    db_alias = schema_editor.connection.alias
+
+    for pk, industry in CompanyProfile.objects.using(db_alias).values_list('pk', 'industry'):
+        if _normalize(industry) != industry:
+            CompanyProfile.objects.using(db_alias).filter(pk=pk).update(industry=_normalize(industry))
+
+    rows = list(JobFacetCount.objects.using(db_alias).filter(facet='industry'))
+    merged = Counter()
+    for row in rows:
+        merged[_normalize(row.value)] += row.count
+    if any(_normalize(row.value) != row.value for row in rows):
+        JobFacetCount.objects.using(db_alias).filter(facet='industry').delete()
+        JobFacetCount.objects.using(db_alias).bulk_create([
+            JobFacetCount(facet='industry', value=value, count=count) for value, count in merged.items() if value
+        ])
+
+    for search in SavedSearch.objects.using(db_alias).exclude(filters__industry=None):
+        industry = search.filters.get('industry')
+        if isinstance(industry, str) and _normalize(industry) != industry:
+            search.filters['industry'] = _normalize(industry)
+            search.save(update_fields=['filters'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0021_rollup_gaps_and_funnel_flags'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_industry, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:35
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def rebuild_with_drilldown(apps, schema_editor):
+    # As home.facets.rebuild_facet_counts at the time of this migration
+    JobPosting = apps.get_model('home', 'JobPosting')
+    JobFacetCount = apps.get_model('home', 'JobFacetCount')
+    db_alias = schema_editor.connection.alias
+    combinations = (
+        JobPosting.objects.using(db_alias).filter(is_active=True)
+        .values_list('job_type', 'normalized_location__key', 'is_remote', 'salary_band', 'company__industry')
+        .annotate(n=Count('id')).order_by()
+    )
+    merged = Counter()
+    for job_type, location_key, is_remote, salary_band, industry, count in combinations:
+        pairs = [('job_type', job_type), ('location', location_key or ''), ('salary_band', salary_band),
+                 ('industry', ' '.join((industry or '').split()))]
+        if is_remote:
+            pairs.append(('location', 'remote'))
+        pairs = [(facet, value) for facet, value in pairs if value]
+        for facet, value in pairs:
+            merged[(facet, value, '', '')] += count
+            for other, other_value in pairs:
+                if other != facet:
+                    merged[(facet, value, other, other_value)] += count
+    JobFacetCount.objects.using(db_alias).all().delete()
+    JobFacetCount.objects.using(db_alias).bulk_create(
+        [JobFacetCount(facet=facet, value=value, within_facet=within_facet, within_value=within_value, count=count)
+         for (facet, value, within_facet, within_value), count in merged.items()],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0022_normalize_industry'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='jobfacetcount',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='jobfacetcount',
+            name='within_facet',
+            field=models.CharField(blank=True, choices=[('job_type', 'Job Type'), ('location', 'Location'), ('salary_band', 'Salary Band'), ('industry', 'Industry')], max_length=20),
+        ),
+        migrations.AddField(
+            model_name='jobfacetcount',
+            name='within_value',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobfacetcount',
+            unique_together={('within_facet', 'within_value', 'facet', 'value')},
+        ),
+        migrations.RunPython(rebuild_with_drilldown, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:36
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def hide_unapproved_reviews(apps, schema_editor):
+    # Reviews created outside submit_review were shown while still pending
+    Review = apps.get_model('home', 'Review')
+    ReviewStats = apps.get_model('home', 'ReviewStats')
+    db_alias = schema_editor.connection.alias
+    if not Review.objects.using(db_alias).exclude(status='APPROVED').filter(is_active=True).update(is_active=False):
+        return
+    published = Review.objects.using(db_alias).filter(is_active=True)
+    totals = published.aggregate(total=Count('id'), avg=Avg('rating'))
+    by_type = dict(published.values_list('reviewer_type').annotate(n=Count('id')).order_by())
+    ReviewStats.objects.using(db_alias).update_or_create(pk=1, defaults={
+        'total_count': totals['total'] or 0,
+        'student_count': by_type.get('student', 0),
+        'company_count': by_type.get('company', 0),
+        'average_rating': round(totals['avg'] or 0, 2),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0023_facet_drilldown_counts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='is_active',
+            field=models.BooleanField(default=False, help_text='Show this review on the landing page (approved reviews only)'),
+        ),
+        migrations.RunPython(hide_unapproved_reviews, migrations.RunPython.noop),
+    ]
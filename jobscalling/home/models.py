@@ -1,12 +1,15 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from django.utils import timezone
+
+from .storage import resume_storage
 
 
 # Candidate Profile (extra info)
 class CandidateProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
-    full_name = models.CharField(max_length=150)
+    full_name = models.CharField(max_length=150, db_index=True)
     agree_terms = models.BooleanField(default=False)
 
     def __str__(self):
@@ -14,17 +17,61 @@ class CandidateProfile(models.Model):
     
 class CompanyProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
-    company_name = models.CharField(max_length=200)
-    industry = models.CharField(max_length=100)
+    company_name = models.CharField(max_length=200, db_index=True)
+    industry = models.CharField(max_length=100, db_index=True)
     company_size = models.CharField(max_length=50)
     contact_person = models.CharField(max_length=150)
     phone_number = models.CharField(max_length=20)
     website = models.URLField(blank=True, null=True)
     agree_terms = models.BooleanField(default=False)
 
+    def save(self, *args, **kwargs):
+        from .facets import normalize_industry
+
+        # Stored as the facet table and the listing filter spell it
+        self.industry = normalize_industry(self.industry)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.company_name
-    
+
+
+class Location(models.Model):
+    """
+    A normalized place. Gazetteer matches carry coordinates and a grid cell
+    for proximity search; unmatched free text is kept without them so its
+    spellings still collapse to one row (see `home.geo`).
+    """
+    key = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+    country = models.CharField(max_length=2, blank=True)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    # Coarse grid cell (home.geo.GRID_DEGREES) used as the bounding-box index
+    grid_lat = models.IntegerField(null=True, blank=True)
+    grid_lon = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['grid_lat', 'grid_lon'], name='location_grid_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+# Highest qualification, ranked so that "at least a bachelor's" is a comparison
+EDUCATION_LEVELS = [
+    (1, 'Secondary (SSC / O level)'),
+    (2, 'Higher secondary (HSC / A level)'),
+    (3, 'Diploma'),
+    (4, "Bachelor's"),
+    (5, "Master's"),
+    (6, 'Doctorate'),
+]
+
+
 class JobPosting(models.Model):
     """
     Represents a single job advertisement posted by a company.
@@ -38,9 +85,19 @@ class JobPosting(models.Model):
     )
 
     # Core Job Details
-    title = models.CharField(max_length=255, help_text="The job title (e.g., 'Senior Python Developer')")
+    title = models.CharField(max_length=255, db_index=True, help_text="The job title (e.g., 'Senior Python Developer')")
     description = models.TextField(help_text="Detailed description of the role.")
-    location = models.CharField(max_length=100, help_text="City, State, or 'Remote'")
+    location = models.CharField(max_length=100, db_index=True, help_text="City, State, or 'Remote'")
+    # Derived from `location` on save (home.geo.resolve_location)
+    normalized_location = models.ForeignKey(
+        Location,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='job_postings',
+    )
+    is_remote = models.BooleanField(default=False, db_index=True, help_text="Can this job be done remotely?")
     
     # Job Type Choices
     JOB_TYPES = [
@@ -71,6 +128,9 @@ class JobPosting(models.Model):
         help_text="Maximum expected annual salary (optional)."
     )
 
+    # Salary bucket for faceted filtering, derived from min/max_salary on save
+    salary_band = models.CharField(max_length=10, blank=True, db_index=True, editable=False)
+
     # Requirements/Skills
     requirements = models.TextField(help_text="Key skills and qualifications required (e.g., technologies, education).")
 
@@ -79,13 +139,48 @@ class JobPosting(models.Model):
     application_deadline = models.DateField(null=True, blank=True)
     is_active = models.BooleanField(default=True, help_text="Is this job currently accepting applications?")
 
+    # Knockout rules, checked against each application (home.screening)
+    min_experience_months = models.PositiveIntegerField(
+        null=True, blank=True, help_text="Flag applicants with less experience than this, in months (optional)."
+    )
+    min_education_level = models.PositiveSmallIntegerField(
+        choices=EDUCATION_LEVELS, null=True, blank=True,
+        help_text="Flag applicants below this education level (optional).",
+    )
+    screen_salary = models.BooleanField(
+        default=False, help_text="Flag applicants whose expected salary is above the maximum salary."
+    )
+
     class Meta:
         ordering = ['-posted_date']
         verbose_name_plural = "Job Postings"
+        indexes = [
+            models.Index(fields=['-posted_date'], name='jobposting_posted_idx'),
+            # Facet filters on the candidate listing (active jobs, newest first)
+            models.Index(fields=['is_active', 'job_type', '-posted_date'], name='jobposting_type_idx'),
+            models.Index(fields=['is_active', 'normalized_location', '-posted_date'], name='jobposting_place_idx'),
+            models.Index(fields=['is_active', 'is_remote', '-posted_date'], name='jobposting_remote_idx'),
+            models.Index(fields=['is_active', 'salary_band', '-posted_date'], name='jobposting_salary_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} at {self.company.company_name}"
 
+    def save(self, *args, **kwargs):
+        from .facets import salary_band_for
+        from .geo import resolve_location
+
+        self.location = (self.location or '').strip()
+        self.salary_band = salary_band_for(self.min_salary, self.max_salary)
+        # "Remote" in the location text implies the flag; it is never cleared here
+        self.normalized_location, text_remote = resolve_location(self.location)
+        self.is_remote = self.is_remote or text_remote
+        if 'update_fields' in kwargs and kwargs['update_fields'] is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {
+                'location', 'salary_band', 'normalized_location', 'is_remote',
+            }
+        super().save(*args, **kwargs)
+
 
 class JobApplication(models.Model):
     """
@@ -117,9 +212,15 @@ class JobApplication(models.Model):
     skills = models.TextField(blank=True, help_text="Skills or technologies known by the applicant.")
     portfolio = models.URLField(blank=True, help_text="Link to LinkedIn or portfolio (optional).")
 
+    # Derived on save (home.screening): parsed `experience`/`education` and the
+    # posting's failed knockout rules as bit flags, 0 meaning it passed them all
+    experience_months = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    education_level = models.PositiveSmallIntegerField(choices=EDUCATION_LEVELS, null=True, blank=True, editable=False)
+    screening_flags = models.PositiveSmallIntegerField(default=0, editable=False)
+
     # Application fields
     cover_letter = models.TextField(blank=True, null=True)
-    resume = models.FileField(upload_to='resumes/', null=True, blank=True, help_text="Uploaded resume file.")
+    resume = models.FileField(upload_to='resumes/', storage=resume_storage, null=True, blank=True, help_text="Uploaded resume file.")
     application_date = models.DateTimeField(auto_now_add=True)
 
     # Application Status Choices
@@ -142,10 +243,92 @@ class JobApplication(models.Model):
         unique_together = ('job', 'candidate')
         ordering = ['-application_date']
         verbose_name_plural = "Job Applications"
+        indexes = [
+            models.Index(fields=['-application_date'], name='jobapp_applied_idx'),
+            # Applicant list filters, always within one job
+            models.Index(fields=['job', 'screening_flags'], name='jobapp_screening_idx'),
+            models.Index(fields=['job', 'experience_months'], name='jobapp_experience_idx'),
+            models.Index(fields=['job', 'education_level'], name='jobapp_education_idx'),
+        ]
 
     def __str__(self):
         return f"{self.candidate.full_name}'s application for {self.job.title}"
 
+    # The applicant's answers the derived screening fields are computed from
+    SCREENING_INPUTS = ('experience', 'education', 'expected_salary')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._screened_inputs = instance._screening_inputs()
+        return instance
+
+    def _screening_inputs(self):
+        loaded = self.__dict__
+        if any(name not in loaded for name in self.SCREENING_INPUTS):
+            return None  # deferred; treat as unknown
+        return tuple(loaded[name] for name in self.SCREENING_INPUTS)
+
+    def save(self, *args, **kwargs):
+        from .screening import education_level, parse_experience, screen
+
+        # Views pass POST strings straight in; the salary rule compares numbers.
+        # A bad value raises ValidationError here instead of a TypeError later.
+        self.expected_salary = self._meta.get_field('expected_salary').to_python(self.expected_salary)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not set(update_fields) & set(self.SCREENING_INPUTS):
+            super().save(*args, **kwargs)  # e.g. a status change: nothing to re-screen
+            return
+        inputs = self._screening_inputs()
+        # Posting rule changes are re-screened in bulk (signals.rescreen_applicants)
+        if self._state.adding or inputs is None or inputs != getattr(self, '_screened_inputs', None):
+            self.experience_months = parse_experience(self.experience)
+            self.education_level = education_level(self.education)
+            self.screening_flags = screen(self, self.job)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {
+                    'experience_months', 'education_level', 'screening_flags',
+                }
+        super().save(*args, **kwargs)
+        self._screened_inputs = self._screening_inputs()
+
+    @property
+    def screening_failures(self):
+        from .screening import failure_labels
+
+        return failure_labels(self.job, self.screening_flags)
+
+class JobFacetCount(models.Model):
+    """
+    Number of active job postings per facet value (summary table for the
+    candidate listing filters), maintained by home.facets. Blank
+    within_facet/within_value is the global count; otherwise the count
+    among postings that also have that other facet value.
+    """
+    FACET_CHOICES = [
+        ('job_type', 'Job Type'),
+        ('location', 'Location'),
+        ('salary_band', 'Salary Band'),
+        ('industry', 'Industry'),
+    ]
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=200)
+    within_facet = models.CharField(max_length=20, choices=FACET_CHOICES, blank=True)
+    within_value = models.CharField(max_length=200, blank=True)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Leading with the context: the listing reads whole contexts at a time
+        unique_together = ('within_facet', 'within_value', 'facet', 'value')
+        verbose_name = 'Job Facet Count'
+        verbose_name_plural = 'Job Facet Counts'
+
+    def __str__(self):
+        within = f" within {self.within_facet}={self.within_value}" if self.within_facet else ""
+        return f"{self.facet}={self.value}{within}: {self.count}"
+
+
 class CandidateResume(models.Model):
     """
     Stores uploaded CVs/resumes for candidates.
@@ -156,7 +339,7 @@ class CandidateResume(models.Model):
         related_name='resumes',
         help_text="Candidate who uploaded this resume."
     )
-    file = models.FileField(upload_to='resumes/')
+    file = models.FileField(upload_to='resumes/', storage=resume_storage)
     original_filename = models.CharField(max_length=255, blank=True)
     content_type = models.CharField(max_length=100, blank=True)
     file_size = models.PositiveIntegerField(null=True, blank=True)
@@ -166,6 +349,9 @@ class CandidateResume(models.Model):
         ordering = ['-uploaded_at']
         verbose_name = 'Candidate Resume'
         verbose_name_plural = 'Candidate Resumes'
+        indexes = [
+            models.Index(fields=['-uploaded_at'], name='resume_uploaded_idx'),
+        ]
 
     def __str__(self):
         return f"{self.candidate.full_name} - {self.original_filename or self.file.name}"
@@ -176,18 +362,458 @@ class Review(models.Model):
         ('student', 'Student'),
         ('company', 'Company'),
     ]
+    # Moderation states: submissions land as PENDING and are screened in
+    # batches by the `moderate_reviews` command before being published.
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending Moderation'),
+        ('APPROVED', 'Approved'),
+        ('REJECTED', 'Rejected'),
+    ]
     name = models.CharField(max_length=150)
     company = models.CharField(max_length=200, blank=True, null=True)
     rating = models.PositiveSmallIntegerField(default=5)
     review = models.TextField()
     reviewer_type = models.CharField(max_length=20, choices=REVIEWER_TYPES, default='student')
-    is_active = models.BooleanField(default=True, help_text='Show this review on the landing page')
+    is_active = models.BooleanField(default=False, help_text='Show this review on the landing page (approved reviews only)')
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='PENDING',
+        db_index=True,
+        help_text="Moderation state of this review."
+    )
+    fingerprint = models.CharField(max_length=64, blank=True, db_index=True, help_text="Hash of the normalized review text, used for dedupe.")
+    submitter_ip = models.GenericIPAddressField(null=True, blank=True)
+    rejection_reason = models.CharField(max_length=100, blank=True)
+    moderated_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Review'
         verbose_name_plural = 'Reviews'
+        indexes = [
+            models.Index(fields=['is_active', 'reviewer_type', '-created_at'], name='review_landing_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Only an approved review can be shown; an approved one may still be hidden by hand
+        if self.status != 'APPROVED':
+            self.is_active = False
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name} - {self.company or self.reviewer_type}"
+
+
+class ReviewStats(models.Model):
+    """
+    Precomputed aggregate over published reviews, shown on the landing page.
+    A single row (pk=1) is maintained by `ReviewStats.refresh()`.
+    """
+    total_count = models.PositiveIntegerField(default=0)
+    student_count = models.PositiveIntegerField(default=0)
+    company_count = models.PositiveIntegerField(default=0)
+    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Review Stats'
+        verbose_name_plural = 'Review Stats'
+
+    def __str__(self):
+        return f"{self.total_count} reviews, avg {self.average_rating}"
+
+    @classmethod
+    def load(cls):
+        stats, _ = cls.objects.get_or_create(pk=1)
+        return stats
+
+    @classmethod
+    def refresh(cls):
+        """
+        Recompute the aggregate row from published reviews.
+        Called after each moderation batch, not per request.
+        """
+        published = Review.objects.filter(is_active=True)
+        totals = published.aggregate(total=models.Count('id'), avg=models.Avg('rating'))
+        by_type = dict(
+            published.values_list('reviewer_type').annotate(n=models.Count('id')).order_by()
+        )
+        stats, _ = cls.objects.update_or_create(
+            pk=1,
+            defaults={
+                'total_count': totals['total'] or 0,
+                'student_count': by_type.get('student', 0),
+                'company_count': by_type.get('company', 0),
+                'average_rating': round(totals['avg'] or 0, 2),
+            },
+        )
+        return stats
+
+
+class ResumePreview(models.Model):
+    """
+    Cached preview of a stored resume file, produced by `generate_previews`.
+    The thumbnail lives on disk under MEDIA_ROOT keyed by content hash.
+    """
+    source_name = models.CharField(max_length=255, unique=True, help_text="Storage name of the resume file.")
+    content_hash = models.CharField(max_length=64, db_index=True)
+    thumbnail = models.CharField(max_length=255, blank=True, help_text="MEDIA_ROOT-relative PNG of the first page.")
+    text = models.TextField(blank=True, help_text="Plain-text excerpt of the first page.")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Resume Preview'
+        verbose_name_plural = 'Resume Previews'
+
+    def __str__(self):
+        return self.source_name
+
+
+class ApplicationStatusEvent(models.Model):
+    """
+    Append-only log of JobApplication status changes (creation included),
+    written by signal handlers and consumed by the analytics rollup.
+    """
+    application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, related_name='status_events')
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='status_events')
+    from_status = models.CharField(max_length=10, blank=True)
+    to_status = models.CharField(max_length=10)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class JobDailyStats(models.Model):
+    """
+    Per-job, per-day rollup of application activity for company analytics.
+    """
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='daily_stats')
+    company = models.ForeignKey(CompanyProfile, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    applications = models.PositiveIntegerField(default=0)
+    status_changes = models.PositiveIntegerField(default=0)
+    reviewed = models.PositiveIntegerField(default=0, help_text="Applications that left PENDING on this day.")
+    review_seconds = models.BigIntegerField(default=0, help_text="Sum of time-to-review for `reviewed`.")
+
+    class Meta:
+        unique_together = ('job', 'date')
+        indexes = [
+            models.Index(fields=['company', 'date'], name='dailystats_company_idx'),
+        ]
+        verbose_name_plural = 'Job Daily Stats'
+
+    def __str__(self):
+        return f"{self.job_id} @ {self.date}: {self.applications}"
+
+
+class JobFunnelStats(models.Model):
+    """
+    Running status funnel for a job: how many applications reached each stage.
+    """
+    job = models.OneToOneField(JobPosting, on_delete=models.CASCADE, primary_key=True, related_name='funnel')
+    company = models.ForeignKey(CompanyProfile, on_delete=models.CASCADE, related_name='funnel_stats')
+    total = models.PositiveIntegerField(default=0)
+    reached_reviewed = models.PositiveIntegerField(default=0)
+    reached_interview = models.PositiveIntegerField(default=0)
+    reached_offer = models.PositiveIntegerField(default=0)
+    hired = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    reviewed_count = models.PositiveIntegerField(default=0)
+    review_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'Job Funnel Stats'
+
+    def __str__(self):
+        return f"Funnel for job {self.job_id}"
+
+    @property
+    def avg_review_hours(self):
+        if not self.reviewed_count:
+            return None
+        return round(self.review_seconds / self.reviewed_count / 3600, 1)
+
+
+class ApplicationFunnel(models.Model):
+    """
+    Bit flags (home.analytics) of the funnel stages already counted for an
+    application, so moving back and forth between statuses counts it once
+    per stage. Kept out of JobApplication so a save() of a stale instance
+    cannot reset them.
+    """
+    application = models.OneToOneField(JobApplication, on_delete=models.CASCADE, primary_key=True, related_name='+')
+    flags = models.PositiveSmallIntegerField(default=0)
+
+    def __str__(self):
+        return f"Funnel flags for application {self.application_id}: {self.flags}"
+
+
+class RollupCheckpoint(models.Model):
+    """
+    High-water mark (last processed id) for an incremental rollup stream,
+    plus the ids skipped below it that may still commit ({id: first seen}).
+    """
+    name = models.CharField(max_length=50, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    gaps = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
+
+
+class SavedSearch(models.Model):
+    """
+    A candidate's saved dashboard search. `filters` holds the same
+    parameters as the dashboard query string; (last_posted_date, last_job_id)
+    is the newest posting already checked for alerts (see home.alerts).
+    """
+    candidate = models.ForeignKey(CandidateProfile, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=100)
+    filters = models.JSONField(default=dict, blank=True)
+    # Starts at creation time so a new search only alerts on later postings
+    last_posted_date = models.DateTimeField(default=timezone.now)
+    last_job_id = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name_plural = "Saved Searches"
+
+    def __str__(self):
+        return f"{self.name} ({self.candidate.full_name})"
+
+
+class JobAlert(models.Model):
+    """
+    New postings matching one saved search, batched per matcher run.
+    """
+    candidate = models.ForeignKey(CandidateProfile, on_delete=models.CASCADE, related_name='job_alerts')
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='alerts')
+    jobs = models.ManyToManyField(JobPosting, related_name='+')
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['candidate', 'is_read', '-created_at'], name='jobalert_inbox_idx'),
+        ]
+
+    def __str__(self):
+        return f"Alert for {self.saved_search.name} ({self.created_at:%Y-%m-%d})"
+
+
+class FeedFile(models.Model):
+    """
+    A generated crawler file (sitemap chunk or job feed) and whether it must
+    be rebuilt; see home.feeds.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    dirty = models.BooleanField(default=True, db_index=True)
+    item_count = models.IntegerField(default=0)
+    generated_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.name
+
+
+class SuggestionChange(models.Model):
+    """
+    A posting whose typeahead suggestions changed, for every process's
+    in-memory index to replay (home.autocomplete). One row per posting,
+    restamped on each change; no foreign key, deletions are logged too.
+    """
+    job_id = models.BigIntegerField(unique=True)
+    changed_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Job {self.job_id} at {self.changed_at:%Y-%m-%d %H:%M:%S}"
+
+
+class ArchivedJobPosting(models.Model):
+    """
+    A closed JobPosting moved out of the live table by home.archive. Keeps
+    the original id; read-only from the site and admin.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    company = models.ForeignKey(CompanyProfile, on_delete=models.CASCADE, related_name='archived_job_postings')
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    location = models.CharField(max_length=100)
+    is_remote = models.BooleanField(default=False)
+    job_type = models.CharField(max_length=2, choices=JobPosting.JOB_TYPES)
+    min_salary = models.IntegerField(null=True, blank=True)
+    max_salary = models.IntegerField(null=True, blank=True)
+    requirements = models.TextField()
+    posted_date = models.DateTimeField()
+    application_deadline = models.DateField(null=True, blank=True)
+    # Totals at archive time (the live analytics rows go with the posting)
+    application_count = models.IntegerField(default=0)
+    hired_count = models.IntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-posted_date']
+        verbose_name_plural = "Archived Job Postings"
+        indexes = [
+            models.Index(fields=['company', '-posted_date'], name='archivedjob_company_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+
+class ArchivedJobApplication(models.Model):
+    """
+    A JobApplication archived together with its posting.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(ArchivedJobPosting, on_delete=models.CASCADE, related_name='applications')
+    candidate = models.ForeignKey(CandidateProfile, on_delete=models.CASCADE, related_name='archived_applications')
+    full_name = models.CharField(max_length=100, default="")
+    email = models.EmailField(default="")
+    phone = models.CharField(max_length=20, default="")
+    dob = models.DateField(null=True, blank=True)
+    education = models.CharField(max_length=200, blank=True)
+    experience = models.CharField(max_length=50, blank=True)
+    expected_salary = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    skills = models.TextField(blank=True)
+    portfolio = models.URLField(blank=True)
+    cover_letter = models.TextField(blank=True, null=True)
+    resume = models.FileField(upload_to='resumes/', storage=resume_storage, null=True, blank=True)
+    application_date = models.DateTimeField()
+    status = models.CharField(max_length=10, choices=JobApplication.STATUS_CHOICES)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-application_date']
+        verbose_name_plural = "Archived Job Applications"
+        indexes = [
+            models.Index(fields=['candidate', '-application_date'], name='archivedapp_candidate_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.full_name}'s application for {self.job.title} (archived)"
+
+
+class InterviewSlot(models.Model):
+    """
+    A bookable interview time for one of a company's jobs. Slots of the same
+    interviewer never overlap (checked by home.interviews when they are
+    created) and a slot holds at most one application, each application
+    booking at most one slot.
+    """
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='interview_slots')
+    # Denormalized from job: an interviewer's calendar spans all of the company's jobs
+    company = models.ForeignKey(CompanyProfile, on_delete=models.CASCADE, related_name='interview_slots')
+    interviewer = models.CharField(max_length=100, blank=True, help_text="Leave blank for the company's shared calendar.")
+    start = models.DateTimeField()
+    end = models.DateTimeField()
+    application = models.OneToOneField(
+        JobApplication, on_delete=models.SET_NULL, null=True, blank=True, related_name='interview_slot'
+    )
+    booked_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['start']
+        constraints = [
+            models.CheckConstraint(condition=models.Q(end__gt=models.F('start')), name='interviewslot_end_after_start'),
+            # Backstop for two concurrent generators picking the same time
+            models.UniqueConstraint(fields=['company', 'interviewer', 'start'], name='interviewslot_unique_start'),
+        ]
+        indexes = [
+            models.Index(fields=['job', 'start'], name='interviewslot_job_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job.title} interview at {self.start:%Y-%m-%d %H:%M}"
+
+    @property
+    def is_booked(self):
+        return self.application_id is not None
+
+
+class IdempotencyKey(models.Model):
+    """
+    The client key of a POST that must take effect once (home.idempotency).
+    Written in the same transaction as the row it guards, so a double-click
+    or a retried request finds it and gets the first outcome back.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    scope = models.CharField(max_length=30)
+    key = models.CharField(max_length=64)
+    redirect_url = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'scope', 'key'], name='idempotency_key_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key}"
+
+
+class RequestProfile(models.Model):
+    """
+    One profiled request, recorded on demand by staff (home.profiling).
+    """
+    MODES = [
+        ('cprofile', 'cProfile'),
+        ('sample', 'Sampling'),
+    ]
+    mode = models.CharField(max_length=10, choices=MODES)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=255)
+    view = models.CharField(max_length=200, blank=True)
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    query_ms = models.FloatField(default=0)
+    # Hottest functions as pstats text, and collapsed stacks ("a;b;c 12" per
+    # line) that flamegraph.pl and speedscope read
+    stats = models.TextField(blank=True)
+    flame = models.TextField(blank=True)
+    # Raw cProfile dump (pstats/snakeviz), cProfile mode only
+    raw = models.BinaryField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+class SlowQuery(models.Model):
+    """
+    A SQL statement that ran longer than PROFILING['SLOW_QUERY_MS'], with
+    its plan. Parameters are not kept (they may hold personal data).
+    """
+    sql = models.TextField()
+    duration_ms = models.FloatField()
+    plan = models.TextField(blank=True)
+    database = models.CharField(max_length=50, default='default')
+    view = models.CharField(max_length=200, blank=True)
+    # Innermost home/views.py frame that issued the query, e.g. "views.py:312 in candidate_dashboard"
+    origin = models.CharField(max_length=200, blank=True)
+    path = models.CharField(max_length=255, blank=True)
+    profile = models.ForeignKey(RequestProfile, on_delete=models.CASCADE, null=True, blank=True,
+                                related_name='slow_queries')
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name_plural = "Slow queries"
+
+    def __str__(self):
+        return f"{self.duration_ms:.0f} ms in {self.view or self.path}"
@@ -0,0 +1,119 @@
+"""
+Batch screening for submitted reviews.
+
+Reviews are stored as PENDING by `submit_review` and only become visible on
+the landing page once `moderate_pending_reviews` approves them. Screening
+runs out of band (see the `moderate_reviews` management command) so that
+spam bursts never touch the landing page read path.
+"""
+import hashlib
+import re
+from bisect import bisect_right, insort
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Review, ReviewStats
+
+# Heuristic thresholds (override via settings.REVIEW_MODERATION)
+DEFAULTS = {
+    'MIN_LENGTH': 10,
+    'MAX_LENGTH': 2000,
+    'RATE_WINDOW_MINUTES': 60,
+    'RATE_LIMIT': 3,
+    'BATCH_SIZE': 500,
+}
+
+
+def moderation_setting(key):
+    return getattr(settings, 'REVIEW_MODERATION', {}).get(key, DEFAULTS[key])
+
+
+def review_fingerprint(text):
+    """
+    Hash of the review text with case, punctuation and whitespace removed,
+    so trivially-altered reposts collide.
+    """
+    normalized = re.sub(r'[\W_]+', ' ', (text or '').lower()).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def screen_review(review, seen_fingerprints, ip_times):
+    """
+    Return a rejection reason for a single review, or '' if it passes.
+    `seen_fingerprints` and `ip_times` (sorted submission times per IP)
+    carry state across the batch. The rate limit counts an IP's
+    submissions in the RATE_WINDOW_MINUTES before this review's own
+    created_at, however late the batch runs.
+    """
+    length = len(review.review.strip())
+    if length < moderation_setting('MIN_LENGTH'):
+        return 'too short'
+    if length > moderation_setting('MAX_LENGTH'):
+        return 'too long'
+    if review.fingerprint in seen_fingerprints:
+        return 'duplicate'
+    if review.submitter_ip:
+        times = ip_times.setdefault(review.submitter_ip, [])
+        window_start = review.created_at - timedelta(minutes=moderation_setting('RATE_WINDOW_MINUTES'))
+        recent = bisect_right(times, review.created_at) - bisect_right(times, window_start)
+        insort(times, review.created_at)
+        if recent + 1 > moderation_setting('RATE_LIMIT'):
+            return 'rate limited'
+    return ''
+
+
+def moderate_pending_reviews(batch_size=None):
+    """
+    Screen one batch of pending reviews and publish/reject them in bulk.
+    Returns a (approved, rejected) tuple of counts.
+    """
+    batch_size = batch_size or moderation_setting('BATCH_SIZE')
+    pending = list(
+        Review.objects.filter(status='PENDING').order_by('created_at', 'id')[:batch_size]
+    )
+    if not pending:
+        return 0, 0
+
+    # Fingerprints already published are duplicates for the whole batch
+    fingerprints = {r.fingerprint for r in pending if r.fingerprint}
+    seen_fingerprints = set(
+        Review.objects.filter(status='APPROVED', fingerprint__in=fingerprints)
+        .values_list('fingerprint', flat=True)
+    )
+
+    # Seed per-IP submission times with what was already accepted around the batch
+    window_start = pending[0].created_at - timedelta(minutes=moderation_setting('RATE_WINDOW_MINUTES'))
+    ips = {r.submitter_ip for r in pending if r.submitter_ip}
+    ip_times = {}
+    for ip, created_at in Review.objects.filter(
+        status='APPROVED', submitter_ip__in=ips, created_at__gte=window_start, created_at__lte=pending[-1].created_at,
+    ).order_by('created_at').values_list('submitter_ip', 'created_at'):
+        ip_times.setdefault(ip, []).append(created_at)
+
+    now = timezone.now()
+    approved, rejected = [], []
+    for review in pending:
+        if not review.fingerprint:
+            review.fingerprint = review_fingerprint(review.review)
+        reason = screen_review(review, seen_fingerprints, ip_times)
+        review.moderated_at = now
+        review.rejection_reason = reason
+        if reason:
+            review.status = 'REJECTED'
+            review.is_active = False
+            rejected.append(review)
+        else:
+            review.status = 'APPROVED'
+            review.is_active = True
+            seen_fingerprints.add(review.fingerprint)
+            approved.append(review)
+
+    fields = ['status', 'is_active', 'fingerprint', 'rejection_reason', 'moderated_at']
+    with transaction.atomic():
+        Review.objects.bulk_update(approved + rejected, fields, batch_size=batch_size)
+        if approved:
+            ReviewStats.refresh()
+    return len(approved), len(rejected)
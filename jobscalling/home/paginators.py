@@ -0,0 +1,37 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids a full COUNT(*) on large tables.
+
+    Unfiltered querysets use the planner's row estimate where the backend
+    keeps one (PostgreSQL reltuples). Everything else counts at most
+    `count_limit` rows, so deep pages past the cap are not reachable but
+    the first pages of a huge result stay fast.
+    """
+    count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        estimate = self._estimated_table_rows(queryset)
+        if estimate is not None and estimate > self.count_limit:
+            return estimate
+        return queryset.order_by()[:self.count_limit].count()
+
+    def _estimated_table_rows(self, queryset):
+        if not hasattr(queryset, 'query') or queryset.query.where:
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] > 0 else None
@@ -0,0 +1,200 @@
+"""
+First-page thumbnails and short text previews for uploaded resumes.
+
+Rendering happens out of band: a saved resume is queued with
+`queue_preview()` for a background thread of the process that saved it,
+and the `generate_previews` command (which fans files out to a process
+pool) catches up on anything that was missed. Output is cached on disk under
+RESUME_PREVIEW_DIR keyed by the file's SHA-256, so identical uploads are
+rendered once; a ResumePreview row maps each stored resume name to its
+preview so listing pages can show them with a single query.
+
+Renderers are optional: PyMuPDF or poppler's `pdftoppm`/`pdftotext`
+for PDFs, and the stdlib zip reader for DOCX text. Without any of them a
+preview row is still recorded, just without a thumbnail or text.
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTH = 320
+TEXT_PREVIEW_CHARS = 1200
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # older PyMuPDF releases
+    except ImportError:
+        fitz = None
+
+
+def preview_dir():
+    return getattr(settings, 'RESUME_PREVIEW_DIR', 'previews')
+
+
+def content_hash(path):
+    """
+    SHA-256 of a stored file. Content-addressed names already carry it.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if re.fullmatch(r'[0-9a-f]{64}', stem):
+        return stem
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def thumbnail_name(digest):
+    return f"{preview_dir()}/{digest[:2]}/{digest}.png"
+
+
+def render_preview(path, media_root):
+    """
+    Render one resume; safe to run in a worker process (no DB access).
+    Returns (content_hash, text, thumbnail_name or '').
+    """
+    digest = content_hash(path)
+    name = thumbnail_name(digest)
+    target = os.path.join(media_root, name)
+    ext = os.path.splitext(path)[1].lower()
+
+    text = ''
+    thumbnail = ''
+    if ext == '.pdf':
+        if os.path.exists(target) or _render_pdf_thumbnail(path, target):
+            thumbnail = name
+        text = _pdf_text(path)
+    elif ext == '.docx':
+        text = _docx_text(path)
+    return digest, _squash(text)[:TEXT_PREVIEW_CHARS], thumbnail
+
+
+def _squash(text):
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _render_pdf_thumbnail(path, target):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_target = target + '.tmp'
+    try:
+        if fitz is not None:
+            with fitz.open(path) as document:
+                page = document[0]
+                zoom = THUMBNAIL_WIDTH / page.rect.width
+                page.get_pixmap(matrix=fitz.Matrix(zoom, zoom)).save(tmp_target, output='png')
+        elif shutil.which('pdftoppm'):
+            prefix = tmp_target[:-len('.tmp')] + '-render'
+            subprocess.run(
+                ['pdftoppm', '-png', '-f', '1', '-l', '1', '-scale-to-x', str(THUMBNAIL_WIDTH),
+                 '-scale-to-y', '-1', '-singlefile', path, prefix],
+                check=True, capture_output=True, timeout=30,
+            )
+            os.replace(prefix + '.png', tmp_target)
+        else:
+            return False
+        os.replace(tmp_target, target)
+        return True
+    except Exception:
+        # A broken or encrypted PDF should not stop the batch
+        if os.path.exists(tmp_target):
+            os.unlink(tmp_target)
+        return False
+
+
+def _pdf_text(path):
+    try:
+        if fitz is not None:
+            with fitz.open(path) as document:
+                return document[0].get_text()
+        if shutil.which('pdftotext'):
+            result = subprocess.run(
+                ['pdftotext', '-f', '1', '-l', '1', path, '-'],
+                check=True, capture_output=True, timeout=30,
+            )
+            return result.stdout.decode('utf-8', 'replace')
+    except Exception:
+        pass
+    return ''
+
+
+def _docx_text(path):
+    try:
+        with zipfile.ZipFile(path) as archive:
+            xml = archive.read('word/document.xml').decode('utf-8', 'replace')
+    except (KeyError, OSError, zipfile.BadZipFile):
+        return ''
+    xml = re.sub(r'</w:p>', '\n', xml)
+    return re.sub(r'<[^>]+>', '', xml)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def queue_preview(name):
+    """
+    Render the preview of stored resume `name` in the background (one
+    thread per process, so uploads never wait on a renderer).
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='resume-preview')
+    return _pool.submit(_record_in_worker, name)
+
+
+def _record_in_worker(name):
+    try:
+        record_preview(name)
+    finally:
+        connection.close()  # the worker thread's own connection
+
+
+def record_preview(name):
+    """
+    Render `name` and store its ResumePreview row, unless it has one.
+    """
+    from .models import ResumePreview
+    from .storage import resume_storage
+
+    try:
+        storage = resume_storage()
+        if ResumePreview.objects.filter(source_name=name).exists() or not storage.exists(name):
+            return
+        digest, text, thumbnail = render_preview(storage.path(name), str(settings.MEDIA_ROOT))
+        ResumePreview.objects.get_or_create(
+            source_name=name, defaults={'content_hash': digest, 'text': text, 'thumbnail': thumbnail},
+        )
+    except Exception:
+        # `generate_previews` retries whatever failed here
+        logger.exception("could not render a preview of %s", name)
+
+
+def attach_previews(items, attr):
+    """
+    Set `.preview` on each item from the ResumePreview row of its FileField
+    `attr` (one query for the whole list).
+    """
+    from .models import ResumePreview
+
+    names = {getattr(item, attr).name for item in items if getattr(item, attr)}
+    previews = {p.source_name: p for p in ResumePreview.objects.filter(source_name__in=names)}
+    for item in items:
+        field_file = getattr(item, attr)
+        item.preview = previews.get(field_file.name) if field_file else None
+    return items
@@ -0,0 +1,215 @@
+"""
+On-demand request profiling and slow-query capture.
+
+ProfilingMiddleware (home.middleware) wraps every request's database
+access with a query timer. A statement slower than
+PROFILING['SLOW_QUERY_MS'] is saved as a SlowQuery together with:
+- its EXPLAIN plan
+- the resolved view
+- the home/views.py line that issued it
+
+Staff can profile a single request by adding `?_profile=1` (cProfile) or
+`?_profile=sample` (sampling profiler), or by sending an `X-Profile` header
+with the same values. The result is stored as a RequestProfile, and the
+response carries its id in X-Profile-Id. Both are browsed in the admin.
+
+cProfile is exact but slows hot Python code down. The sampler records the
+request thread's stack every SAMPLE_INTERVAL_MS from a side thread. It
+has almost no overhead, but only sees where time was spent often enough.
+"""
+import cProfile
+import io
+import logging
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+QUERY_FLAG = '_profile'
+HEADER = 'X-Profile'
+MAX_SLOW_QUERIES = 10
+STATS_LINES = 60
+VIEWS_FILE = os.path.join('home', 'views.py')
+
+
+def _setting(name, default):
+    return getattr(settings, 'PROFILING', {}).get(name, default)
+
+
+def requested_mode(request):
+    """
+    'cprofile', 'sample' or None. Only staff may turn profiling on.
+    """
+    flag = request.GET.get(QUERY_FLAG) or request.headers.get(HEADER)
+    if not flag or not getattr(request, 'user', None) or not request.user.is_staff:
+        return None
+    return 'sample' if flag.lower() == 'sample' else 'cprofile'
+
+
+def _view_origin():
+    # Innermost frame in home/views.py: the view line that caused the query
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.endswith(VIEWS_FILE):
+            return f"views.py:{frame.lineno} in {frame.name}"
+    return ''
+
+
+class QueryTimer:
+    """
+    execute_wrapper that times statements and keeps the slow ones (with
+    their parameters, for EXPLAIN) until the response is done.
+    """
+
+    def __init__(self, alias, threshold_ms):
+        self.alias = alias
+        self.threshold_ms = threshold_ms
+        self.count = 0
+        self.total_ms = 0.0
+        self.slow = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.total_ms += elapsed
+            if self.threshold_ms and elapsed >= self.threshold_ms and len(self.slow) < MAX_SLOW_QUERIES:
+                self.slow.append((sql, None if many else params, elapsed, _view_origin()))
+
+
+def timed_queries(threshold_ms):
+    """
+    Context manager installing a QueryTimer on every database; yields them.
+    """
+    stack = ExitStack()
+    timers = [QueryTimer(alias, threshold_ms) for alias in connections]
+    for timer in timers:
+        stack.enter_context(connections[timer.alias].execute_wrapper(timer))
+    return stack, timers
+
+
+def explain(alias, sql, params):
+    # Only reads are explained again; `params` is None for executemany()
+    if params is None or not sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+        return ''
+    connection = connections[alias]
+    try:
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            rows = cursor.fetchall()
+    except Exception as exc:  # the plan is a bonus; never fail the request over it
+        return f"(no plan: {exc})"
+    return '\n'.join(' | '.join(str(column) for column in row) for row in rows)
+
+
+def save_slow_queries(timers, view, path, profile=None):
+    from .models import SlowQuery
+
+    rows = [
+        SlowQuery(sql=sql, duration_ms=round(elapsed, 2), plan=explain(timer.alias, sql, params),
+                  database=timer.alias, view=view, origin=origin, path=path[:255], profile=profile)
+        for timer in timers
+        for sql, params, elapsed, origin in timer.slow
+    ]
+    if rows:
+        SlowQuery.objects.bulk_create(rows)
+    return rows
+
+
+class Sampler:
+    """
+    Records one thread's stack every `interval` seconds from a daemon thread
+    and counts identical stacks (root first) for a flame graph.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self):
+        return '\n'.join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def top(self, limit=STATS_LINES):
+        # Self time: how often each function was the innermost frame
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        total = sum(leaves.values()) or 1
+        return '\n'.join(f"{count / total:6.1%}  {count:5d}  {name}" for name, count in leaves.most_common(limit))
+
+
+def profile_call(mode, func):
+    """
+    Run func() under the chosen profiler; returns (result, stats, flame, raw).
+    """
+    if mode == 'sample':
+        with Sampler(_setting('SAMPLE_INTERVAL_MS', 5) / 1000) as sampler:
+            result = func()
+        return result, sampler.top(), sampler.collapsed(), None
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats('cumulative').print_stats(STATS_LINES)
+    return result, out.getvalue(), _collapsed_from_pstats(stats), marshal.dumps(stats.stats)
+
+
+def _collapsed_from_pstats(stats):
+    """
+    Approximate collapsed stacks from cProfile's caller graph: each
+    function's own time under the single heaviest caller chain.
+    """
+    def label(func):
+        filename, line, name = func
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    lines = []
+    for func, (_calls, _primitive, own_time, _cumulative, callers) in stats.stats.items():
+        if own_time <= 0:
+            continue
+        chain, seen, current = [label(func)], {func}, callers
+        while current:
+            parent = max(current, key=lambda caller: stats.stats.get(caller, (0, 0, 0, 0))[3])
+            if parent in seen:
+                break
+            seen.add(parent)
+            chain.append(label(parent))
+            current = stats.stats.get(parent, (0, 0, 0, 0, {}))[4]
+        lines.append(f"{';'.join(reversed(chain))} {max(int(own_time * 1_000_000), 1)}")
+    return '\n'.join(lines)
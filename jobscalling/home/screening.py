@@ -0,0 +1,175 @@
+"""
+Structured applicant fields and knockout screening.
+
+`JobApplication.save()` parses the free-text `experience` into months and
+`education` into an EDUCATION_LEVELS rank, then screens the application
+against its posting's knockout rules. Failed rules are stored as a bitmask
+(`screening_flags`, 0 = passed), so the applicant list filters on indexed
+integer columns instead of the text.
+
+A posting's rules are compiled once per distinct set of rule values (the
+compiled form is shared by every posting with the same values). Each rule
+carries both a Python test, used when a single application is saved, and
+the equivalent Q, used by `rescreen()` to re-evaluate every applicant of a
+posting in a few UPDATEs. An applicant whose experience, education or
+salary is unknown is not knocked out by that rule.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from .models import EDUCATION_LEVELS, JobApplication
+
+EXPERIENCE = 1
+EDUCATION = 2
+SALARY = 4
+
+# Only numbers carrying a unit count; "since 2019" or "3 companies" are not experience
+_NUMBER_UNIT = re.compile(r'(\d+(?:\.\d+)?)\s*\+?\s*(y(?:ea)?rs?|y|months?|mos?|m)\b', re.IGNORECASE)
+_PLUS_ONLY = re.compile(r'^(\d+(?:\.\d+)?)\s*\+$')
+_CALENDAR_YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+_RANGE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:-|–|to)\s*\d+(?:\.\d+)?', re.IGNORECASE)
+_NO_EXPERIENCE = re.compile(r'\b(?:none|no experience|fresh(?:er)?|entry[- ]level)\b', re.IGNORECASE)
+
+# Checked from the highest level down, so "MSc after BSc" ranks as a master's
+_EDUCATION_PATTERNS = [
+    (6, r'\bph\.?\s?d\b|doctor(?:ate|al)|\bd\.?\s?phil\b'),
+    (5, r'master|postgrad|\bm\.?\s?(?:sc|a|b\.?a|eng|tech|phil|com)\b|\bmbbs\b'),
+    (4, r'bachelor|graduat|undergrad|honou?rs|\bb\.?\s?(?:sc|a|b\.?a|eng|tech|com|s)\b'),
+    (3, r'diploma|associate'),
+    (2, r'\bhsc\b|higher secondary|\ba[- ]levels?\b|intermediate|12th'),
+    (1, r'\bssc\b|secondary|\bo[- ]levels?\b|high school|10th|matric'),
+]
+_EDUCATION = [(level, re.compile(pattern, re.IGNORECASE)) for level, pattern in _EDUCATION_PATTERNS]
+
+
+def parse_experience(text):
+    """
+    Months of experience in free text: "2 years, 6 months" -> 30,
+    "1.5 yrs" -> 18, "3+" -> 36, "18 months" -> 18, "fresher" -> 0.
+    Ranges count from their lower end ("2-4 years" -> 24). Numbers without
+    a year or month unit and calendar years ("since 2019") are ignored.
+    None, never knocked out, when nothing unambiguous is found.
+    """
+    text = (text or '').strip()
+    if not text:
+        return None
+    if _NO_EXPERIENCE.search(text):
+        return 0
+    plus = _PLUS_ONLY.match(text)
+    if plus:
+        return round(float(plus.group(1)) * 12)
+    matches = _NUMBER_UNIT.findall(_RANGE.sub(r'\1', _CALENDAR_YEAR.sub(' ', text)))
+    if not matches:
+        return None
+    months = 0.0
+    for number, unit in matches:
+        months += float(number) * (1 if unit.lower().startswith('m') else 12)
+    return round(months)
+
+
+def education_level(text):
+    for level, pattern in _EDUCATION:
+        if pattern.search(text or ''):
+            return level
+    return None
+
+
+class Rule(NamedTuple):
+    flag: int
+    label: str
+    fails: Callable  # application -> bool
+    failing: Q
+
+
+@lru_cache(maxsize=1024)
+def _compile(min_experience_months, min_education_level, salary_ceiling):
+    rules = []
+    if min_experience_months:
+        rules.append(Rule(
+            EXPERIENCE, f"Under {min_experience_months} months' experience",
+            lambda application: application.experience_months is not None
+            and application.experience_months < min_experience_months,
+            Q(experience_months__lt=min_experience_months),
+        ))
+    if min_education_level:
+        rules.append(Rule(
+            EDUCATION, f"Below {dict(EDUCATION_LEVELS)[min_education_level]}",
+            lambda application: application.education_level is not None
+            and application.education_level < min_education_level,
+            Q(education_level__lt=min_education_level),
+        ))
+    if salary_ceiling is not None:
+        rules.append(Rule(
+            SALARY, f"Expects more than {salary_ceiling:,}",
+            lambda application: application.expected_salary is not None
+            and application.expected_salary > salary_ceiling,
+            Q(expected_salary__gt=salary_ceiling),
+        ))
+    return tuple(rules)
+
+
+def rules_key(job):
+    """
+    The values a posting's rules are compiled from; equal keys, equal rules.
+    """
+    ceiling = job.max_salary if job.screen_salary else None
+    return (job.min_experience_months, job.min_education_level, ceiling)
+
+
+def compiled_rules(job):
+    return _compile(*rules_key(job))
+
+
+def screen(application, job):
+    flags = 0
+    for rule in compiled_rules(job):
+        if rule.fails(application):
+            flags |= rule.flag
+    return flags
+
+
+def failure_labels(job, flags):
+    return [rule.label for rule in compiled_rules(job) if flags & rule.flag]
+
+
+def rescreen(job):
+    """
+    Re-evaluate every applicant of `job` after its rules changed: one UPDATE
+    to clear the flags, then one per rule for the applicants it knocks out.
+    """
+    applications = JobApplication.objects.filter(job=job)
+    with transaction.atomic():
+        applications.exclude(screening_flags=0).update(screening_flags=0)
+        for rule in compiled_rules(job):
+            applications.filter(rule.failing).update(screening_flags=F('screening_flags').bitor(rule.flag))
+
+
+def backfill(batch_size=500, reparse=False):
+    """
+    Parse `experience` and `education` for applications saved before the
+    structured fields existed (every application with `reparse`, after the
+    parser changed). Returns how many were updated.
+    """
+    updated = 0
+    last_id = 0
+    pending = JobApplication.objects.all() if reparse else JobApplication.objects.filter(
+        experience_months=None, education_level=None,
+    )
+    while True:
+        batch = list(
+            pending.filter(id__gt=last_id)
+            .exclude(experience='', education='')
+            .order_by('id').only('id', 'experience', 'education')[:batch_size]
+        )
+        if not batch:
+            return updated
+        for application in batch:
+            application.experience_months = parse_experience(application.experience)
+            application.education_level = education_level(application.education)
+        JobApplication.objects.bulk_update(batch, ['experience_months', 'education_level'])
+        updated += len(batch)
+        last_id = batch[-1].id
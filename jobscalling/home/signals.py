@@ -0,0 +1,175 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .autocomplete import log_changes
+from .cache import invalidate_company, invalidate_job
+from .events import candidate_channel, company_channel, publish
+from .facets import apply_delta, apply_deltas, company_industry, facet_values, normalize_industry
+from .feeds import FEED_NAME, mark_dirty, mark_job_dirty
+from .models import ApplicationStatusEvent, CandidateResume, CompanyProfile, JobApplication, JobPosting
+from .previews import queue_preview
+from .screening import rescreen, rules_key
+
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def drop_job_snapshot(sender, instance, **kwargs):
+    # Covers post_job edits and admin changes alike. Invalidate again after
+    # commit so a reader that refilled the cache mid-transaction is discarded.
+    pk = instance.pk
+    invalidate_job(pk)
+    transaction.on_commit(lambda: invalidate_job(pk))
+
+
+@receiver([post_save, post_delete], sender=CompanyProfile)
+def drop_company_job_snapshots(sender, instance, **kwargs):
+    pk = instance.pk
+    invalidate_company(pk)
+    transaction.on_commit(lambda: invalidate_company(pk))
+
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def dirty_job_feeds(sender, instance, signal, raw=False, **kwargs):
+    # Inactive postings are in no feed file, so deleting one (archival) changes nothing
+    if raw or (signal is post_delete and not instance.is_active):
+        return
+    mark_job_dirty(instance.pk)
+
+
+@receiver(post_save, sender=CompanyProfile)
+def dirty_company_feeds(sender, instance, created, raw=False, **kwargs):
+    # Feed titles carry the company name; sitemaps only list job URLs
+    if not raw and not created:
+        mark_dirty([FEED_NAME])
+
+
+def _job_facets(job, industry):
+    location_key = job.normalized_location.key if job.normalized_location_id else ''
+    return facet_values(job.is_active, job.job_type, location_key, job.is_remote, job.salary_band, industry)
+
+
+@receiver(pre_save, sender=JobPosting)
+def remember_job_facets(sender, instance, **kwargs):
+    instance._old_facets = []
+    if instance.pk:
+        old = JobPosting.objects.filter(pk=instance.pk).select_related('company', 'normalized_location').first()
+        if old is not None:
+            instance._old_facets = _job_facets(old, old.company.industry)
+            # The same old row tells rescreen_applicants whether the knockout rules changed
+            instance._old_rules = rules_key(old)
+
+
+@receiver(post_save, sender=JobPosting)
+def update_job_facets(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    new = _job_facets(instance, company_industry(instance.company_id))
+    apply_delta(getattr(instance, '_old_facets', []), new)
+
+
+@receiver(post_save, sender=JobPosting)
+def rescreen_applicants(sender, instance, created, raw=False, **kwargs):
+    # Knockout rules changed: re-evaluate the existing applicants in bulk
+    old_rules = getattr(instance, '_old_rules', None)
+    if not raw and not created and old_rules is not None and old_rules != rules_key(instance):
+        rescreen(instance)
+
+
+@receiver(post_delete, sender=JobPosting)
+def remove_job_facets(sender, instance, **kwargs):
+    # Inactive postings contribute no facets; skip the industry lookup (archival deletes many)
+    if instance.is_active:
+        apply_delta(_job_facets(instance, company_industry(instance.company_id)), [])
+
+
+@receiver(pre_save, sender=CompanyProfile)
+def remember_company_industry(sender, instance, **kwargs):
+    instance._old_industry = company_industry(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=CompanyProfile)
+def move_company_industry_facet(sender, instance, raw=False, **kwargs):
+    old = normalize_industry(getattr(instance, '_old_industry', None))
+    new = normalize_industry(instance.industry)
+    if raw or old == new:
+        return
+    # The drill-down counts within the industry move too, so each posting's pairs are needed
+    jobs = JobPosting.objects.filter(company=instance, is_active=True).select_related('normalized_location')
+    apply_deltas([(_job_facets(job, old), _job_facets(job, new)) for job in jobs])
+
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def reindex_job_suggestions(sender, instance, signal, raw=False, **kwargs):
+    # Typeahead index (home.autocomplete), logged in the same transaction;
+    # inactive postings were never in it
+    if raw or (signal is post_delete and not instance.is_active):
+        return
+    log_changes([instance.pk])
+
+
+@receiver(pre_save, sender=CompanyProfile)
+def remember_company_name(sender, instance, **kwargs):
+    instance._old_company_name = None
+    if instance.pk:
+        instance._old_company_name = CompanyProfile.objects.filter(pk=instance.pk).values_list('company_name', flat=True).first()
+
+
+@receiver(post_save, sender=CompanyProfile)
+def reindex_company_suggestions(sender, instance, created, raw=False, **kwargs):
+    if raw or created or getattr(instance, '_old_company_name', None) == instance.company_name:
+        return
+    job_ids = list(JobPosting.objects.filter(company=instance, is_active=True).values_list('pk', flat=True))
+    if job_ids:
+        log_changes(job_ids)
+
+
+@receiver(pre_save, sender=JobApplication)
+def remember_application_status(sender, instance, **kwargs):
+    instance._old_status = None
+    if instance.pk:
+        instance._old_status = JobApplication.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+
+
+@receiver(post_save, sender=JobApplication)
+def record_status_event(sender, instance, created, raw=False, **kwargs):
+    # Feeds the analytics rollup (home.analytics)
+    if raw:
+        return
+    old_status = '' if created else getattr(instance, '_old_status', None)
+    if created or (old_status and old_status != instance.status):
+        ApplicationStatusEvent.objects.create(
+            application=instance, job_id=instance.job_id,
+            from_status=old_status or '', to_status=instance.status,
+        )
+
+
+@receiver(post_save, sender=JobApplication)
+def push_application_events(sender, instance, created, raw=False, **kwargs):
+    # Live updates for open dashboards (home.events), sent once the row is committed
+    if raw:
+        return
+    old_status = getattr(instance, '_old_status', None)
+    job = instance.job
+    data = {'application_id': instance.pk, 'job_id': job.pk, 'job_title': job.title}
+    if created:
+        channels = [company_channel(job.company_id)]
+        event = 'application.new'
+        data['candidate_name'] = instance.full_name
+    elif old_status and old_status != instance.status:
+        channels = [company_channel(job.company_id), candidate_channel(instance.candidate_id)]
+        event = 'application.status'
+        data.update(status=instance.status, status_display=instance.get_status_display())
+    else:
+        return
+    transaction.on_commit(lambda: publish(channels, event, data))
+
+
+@receiver(post_save, sender=CandidateResume)
+@receiver(post_save, sender=JobApplication)
+def render_resume_preview(sender, instance, raw=False, **kwargs):
+    # Thumbnail and text excerpt (home.previews), once the file's row is visible
+    field_file = instance.file if sender is CandidateResume else instance.resume
+    if raw or not field_file:
+        return
+    name = field_file.name
+    transaction.on_commit(lambda: queue_preview(name))
@@ -0,0 +1,106 @@
+import gzip
+import hashlib
+import os
+import tempfile
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.storage import FileSystemStorage, storages
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are written without it
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.txt', '.xml', '.json', '.html', '.map')
+MIN_COMPRESS_SIZE = 256
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also writes `.gz` (and `.br` when brotli is
+    installed) next to every text asset during collectstatic, so the front
+    server or StaticFilesMiddleware can serve pre-compressed bytes.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for name in set(paths) | set(self.hashed_files.values()):
+            self._compress(name)
+
+    def _compress(self, name):
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+        path = self.path(name)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as source:
+            data = source.read()
+        if len(data) < MIN_COMPRESS_SIZE:
+            return
+        self._write_if_smaller(path + '.gz', data, gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            self._write_if_smaller(path + '.br', data, brotli.compress(data))
+
+    def _write_if_smaller(self, path, original, compressed):
+        if len(compressed) < len(original):
+            with open(path, 'wb') as target:
+                target.write(compressed)
+
+
+class ShardedContentStorage(FileSystemStorage):
+    """
+    Content-addressed file storage for uploads.
+
+    A file is stored as `<upload_to>/<h0h1>/<h2h3>/<sha256><ext>`, so names
+    never collide (no `_S8BL24Z` suffix probing), directories stay small,
+    and identical uploads share one file. Writes go to a temp file in the
+    target directory and are renamed into place, so readers never see a
+    partial file. Files are never deleted on row delete; the `gc_media`
+    command removes files no row references any more.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save()
+        return name
+
+    def _save(self, name, content):
+        directory, basename = os.path.split(name)
+        ext = os.path.splitext(basename)[1].lower()
+        root = self.path(directory)
+        os.makedirs(root, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            hexdigest = digest.hexdigest()
+            final_name = '/'.join(filter(None, [directory, hexdigest[:2], hexdigest[2:4], hexdigest + ext]))
+            final_path = self.path(final_name)
+            if os.path.exists(final_path):
+                # Same content already stored: share it, and refresh its mtime so
+                # gc_media's grace period covers the row about to reference it
+                os.unlink(tmp_path)
+                os.utime(final_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                # mkstemp creates 0600 files; give them the usual upload mode
+                os.chmod(tmp_path, self.file_permissions_mode or 0o644)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return final_name
+
+
+def resume_storage():
+    """Storage for resume uploads, configured as STORAGES['resumes']."""
+    return storages['resumes']
@@ -1,3 +1,1282 @@
-from django.test import TestCase
+import asyncio
+import importlib
+import io
+import itertools
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime, time as clock, timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection, connections
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .admin import ReviewAdmin
+from .alerts import match_new_jobs
+from .analytics import GAP_SECONDS, rollup
+from .archive import archive_jobs
+from .autocomplete import PrefixIndex, log_changes
+from .cache import deserialize_job, get_job_snapshot, invalidate_job, job_key, serialize_job
+from .contention import MAX_ATTEMPTS, reset, retry_on_contention, stats
+from .dbcopy import copy_database, copyable_models, read_checkpoints
+from .events import LocalBroker, candidate_channel, channels_for_user, company_channel, format_sse
+from .facets import facet_counts, filter_jobs, selected_filters
+from .feeds import FEED_NAME, build_dirty, chunk_name
+from .geo import ParsedLocation, parse_location
+from .idempotency import FIELD
+from .interviews import IntervalIndex, SlotUnavailable, book_slot, generate_slots
+from .management.commands.gc_media import Command as GCMediaCommand
+from .middleware import StaticFilesMiddleware
+from .moderation import moderate_pending_reviews, review_fingerprint
+from .models import (
+    ArchivedJobApplication, ArchivedJobPosting, CandidateProfile, CandidateResume, CompanyProfile, FeedFile,
+    IdempotencyKey, InterviewSlot, JobAlert, JobApplication, JobFunnelStats, JobPosting, Location, ResumePreview,
+    RequestProfile, Review, ReviewStats, RollupCheckpoint, SavedSearch, SlowQuery, SuggestionChange,
+)
+from .previews import record_preview, thumbnail_name
+from .screening import EDUCATION, EXPERIENCE, SALARY, education_level, parse_experience
+from .storage import resume_storage
+from .warmup import warm_up_enabled
+from .websocket import _origin_allowed
+
+
+# The manifest needs collectstatic; templates under test only need plain URLs
+plain_static = override_settings(STORAGES={
+    **settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+
+# A second database for the dbcopy tests; the test runner creates and migrates it like 'default'
+COPY_TARGET = 'copy_target'
+settings.DATABASES.setdefault(COPY_TARGET, {
+    **connections['default'].settings_dict, 'NAME': ':memory:',
+    'TEST': {**connections['default'].settings_dict['TEST'], 'NAME': None},
+})
+
+
+def make_company(username='acme'):
+    user = User.objects.create_user(username, password='pw')
+    return CompanyProfile.objects.create(user=user, company_name='Acme', industry='Software')
+
+
+def make_candidate(username='cand'):
+    user = User.objects.create_user(username, password='pw')
+    return CandidateProfile.objects.create(user=user, full_name=username.title())
+
+
+def make_job(company, **fields):
+    fields = {'title': 'Python Developer', 'description': 'd', 'requirements': 'Python', 'location': 'Dhaka', **fields}
+    return JobPosting.objects.create(company=company, **fields)
+
+
+class ParseApplicantFieldsTests(SimpleTestCase):
+    def test_experience_in_months(self):
+        cases = {
+            '2 years, 6 months': 30, '1.5 yrs': 18, '3+': 36, '18 months': 18,
+            '2-4 years': 24, '6 mos': 6, 'fresher': 0, 'N/A': None, '': None,
+            'Worked at Acme since 2019': None, 'Developer at Foo (2018-2022)': None,
+            '2 years at 3 companies': 24, 'Studying 12th grade': None, '5': None, '3 years since 2020': 36,
+        }
+        for text, months in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_experience(text), months)
+
+    def test_education_level_takes_the_highest_mentioned(self):
+        cases = {
+            'BSc in CSE': 4, 'MSc after BSc': 5, 'HSC': 2, 'Ph.D.': 6,
+            'Diploma in Engineering': 3, 'Mathematics club': None,
+        }
+        for text, level in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(education_level(text), level)
+
+
+class PasswordHasherSettingsTests(SimpleTestCase):
+    def test_argon2_work_factors_come_from_the_environment(self):
+        env = {
+            'PASSWORD_HASHER_POLICY': 'argon2', 'PASSWORD_ARGON2_TIME_COST': '3',
+            'PASSWORD_ARGON2_MEMORY_COST': '65536', 'PASSWORD_ARGON2_PARALLELISM': '2',
+        }
+        with mock.patch.dict(os.environ, env):
+            values = runpy.run_module('jobscalling.settings.base')
+        self.assertEqual(values['PASSWORD_HASHERS'][0], 'home.hashers.TunedArgon2PasswordHasher')
+        self.assertEqual(
+            (values['PASSWORD_ARGON2_TIME_COST'], values['PASSWORD_ARGON2_MEMORY_COST'], values['PASSWORD_ARGON2_PARALLELISM']),
+            (3, 65536, 2),
+        )
+
+
+class SettingsProfileTests(SimpleTestCase):
+    def load(self, **env):
+        """
+        Import the settings package afresh under `env`; the modules already
+        loaded are put back afterwards.
+        """
+        with mock.patch.dict(sys.modules), mock.patch.dict(os.environ):
+            for name in [name for name in sys.modules if name.startswith('jobscalling.settings')]:
+                del sys.modules[name]
+            for name, value in env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            return importlib.import_module('jobscalling.settings')
+
+    def test_dev_is_the_default(self):
+        profile = self.load(DJANGO_ENV=None)
+        self.assertEqual(profile.DJANGO_ENV, 'dev')
+        self.assertTrue(profile.DEBUG)
+
+    def test_prod_profile(self):
+        profile = self.load(DJANGO_ENV='prod', SECRET_KEY='s3cret', ALLOWED_HOSTS='jobs.example.com, www.jobs.example.com')
+        self.assertFalse(profile.DEBUG)
+        self.assertEqual(profile.ALLOWED_HOSTS, ['jobs.example.com', 'www.jobs.example.com'])
+        self.assertEqual(profile.TEMPLATES[0]['OPTIONS']['loaders'][0][0], 'django.template.loaders.cached.Loader')
+
+    def test_prod_refuses_an_empty_secret_key(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'SECRET_KEY'):
+            self.load(DJANGO_ENV='prod', SECRET_KEY='')
+
+    def test_unknown_profile(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'staging'):
+            self.load(DJANGO_ENV='staging')
+
+
+# Runs warm-up in a fresh process against its own database file, as wsgi.py would
+WARMUP_SCRIPT = """
+import json
+import django
+django.setup()
+from django.db import connections
+from home.warmup import warm_up
+timings = warm_up()
+print(json.dumps({'steps': list(timings), 'open': [alias for alias in connections if connections[alias].connection]}))
+"""
+
+
+class WarmUpTests(SimpleTestCase):
+    def test_debug_skips_warm_up_unless_forced(self):
+        cases = [(True, None, False), (False, None, True), (True, '1', True), (False, '0', False)]
+        for debug, flag, enabled in cases:
+            with self.subTest(debug=debug, flag=flag), override_settings(DEBUG=debug), mock.patch.dict(os.environ):
+                os.environ.pop('DJANGO_WARMUP', None)
+                if flag is not None:
+                    os.environ['DJANGO_WARMUP'] = flag
+                self.assertEqual(warm_up_enabled(), enabled)
+
+    def test_warm_up_closes_its_database_connections(self):
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        with open(os.path.join(workdir.name, 'warmup_settings.py'), 'w') as handle:
+            handle.write(
+                f"from {settings.SETTINGS_MODULE} import *\n"
+                f"DATABASES = {{'default': {{'ENGINE': 'django.db.backends.sqlite3', "
+                f"'NAME': {os.path.join(workdir.name, 'db.sqlite3')!r}}}}}\n"
+            )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='warmup_settings',
+                   PYTHONPATH=os.pathsep.join([workdir.name, str(settings.BASE_DIR)] + sys.path))
+        result = subprocess.run([sys.executable, '-c', WARMUP_SCRIPT], cwd=settings.BASE_DIR, env=env,
+                                capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        outcome = json.loads(result.stdout.strip().splitlines()[-1])
+        self.assertIn('database', outcome['steps'])
+        self.assertEqual(outcome['open'], [])
+
+
+class SessionTests(TestCase):
+    def test_session_backend_selects_the_engine(self):
+        for backend in ('db', 'cached_db', 'signed_cookies'):
+            with self.subTest(backend=backend), mock.patch.dict(os.environ, {'SESSION_BACKEND': backend}):
+                values = runpy.run_module('jobscalling.settings.base')
+                self.assertEqual(values['SESSION_ENGINE'], f'django.contrib.sessions.backends.{backend}')
+
+    @mock.patch('home.management.commands.purge_sessions.time.sleep')
+    def test_purge_deletes_expired_sessions_in_batches(self, sleep):
+        now = timezone.now()
+        expired = [(f'old{number}', now - timedelta(days=1)) for number in range(5)]
+        live = [(f'live{number}', now + timedelta(days=1)) for number in range(2)]
+        Session.objects.bulk_create(
+            [Session(session_key=key, session_data='', expire_date=expire_date) for key, expire_date in expired + live]
+        )
+        out = io.StringIO()
+        call_command('purge_sessions', '--batch-size', '2', '--sleep', '0.5', stdout=out)
+        self.assertIn('Purged 5 expired session(s).', out.getvalue())
+        self.assertEqual(sorted(Session.objects.values_list('session_key', flat=True)), ['live0', 'live1'])
+        self.assertEqual(sleep.call_count, 3)
+
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies')
+    def test_purge_is_a_no_op_for_cookie_sessions(self):
+        Session.objects.create(session_key='old', session_data='', expire_date=timezone.now() - timedelta(days=1))
+        out = io.StringIO()
+        call_command('purge_sessions', stdout=out)
+        self.assertIn('no session rows', out.getvalue())
+        self.assertTrue(Session.objects.exists())
+
+
+class RegistrationTests(TestCase):
+    def test_a_taken_email_is_a_form_error(self):
+        forms = {
+            'candidate_register': ('ana@example.com', {'full_name': 'Ana', 'email': 'ana@example.com'}),
+            'company_register': ('hr@acme.test', {
+                'companyName': 'Acme', 'industry': 'Software', 'companySize': '1-10', 'companyEmail': 'hr@acme.test',
+                'contactPerson': 'Rahim', 'phoneNumber': '01700000000',
+            }),
+        }
+        for url_name, (email, fields) in forms.items():
+            with self.subTest(url_name=url_name):
+                data = {**fields, 'password': 'pw', 'confirm_password': 'pw'}
+                self.client.post(reverse(url_name), data)
+                self.assertTrue(User.objects.filter(username=email).exists())
+                response = self.client.post(reverse(url_name), data)
+                self.assertRedirects(response, reverse(url_name), fetch_redirect_response=False)
+                self.assertIn('Email already registered.', [str(m) for m in get_messages(response.wsgi_request)])
+                self.assertEqual(User.objects.filter(username=email).count(), 1)
+
+
+class ReviewVisibilityTests(TestCase):
+    def test_a_pending_review_is_hidden_however_it_was_created(self):
+        review = Review.objects.create(name='Ana', review='Found my first job here.')
+        self.assertFalse(review.is_active)
+        review.is_active = True  # e.g. ticked in the admin while still pending
+        review.save()
+        self.assertFalse(Review.objects.get(pk=review.pk).is_active)
+        review.status = 'APPROVED'
+        review.is_active = True
+        review.save()
+        self.assertTrue(Review.objects.get(pk=review.pk).is_active)
+
+
+class ReviewModerationTests(TestCase):
+    def submit(self, text, ip='10.0.0.1', minutes_ago=0, **fields):
+        review = Review.objects.create(
+            name='Ana', review=text, fingerprint=review_fingerprint(text), submitter_ip=ip, **fields,
+        )
+        Review.objects.filter(pk=review.pk).update(created_at=timezone.now() - timedelta(minutes=minutes_ago))
+        return review
+
+    def outcome(self):
+        return list(Review.objects.order_by('created_at', 'id').values_list('status', 'rejection_reason'))
+
+    def test_rate_limit_counts_a_sliding_window_per_review(self):
+        # A shared NAT address posting a review every half day, moderated days later in one batch
+        for day in range(5):
+            self.submit(f'Review number {day} about this site.', minutes_ago=(5 - day) * 12 * 60)
+        self.assertEqual(moderate_pending_reviews(), (5, 0))
+
+    def test_rate_limit_rejects_a_burst(self):
+        for n in range(5):
+            self.submit(f'Burst review number {n} here.', ip='10.0.0.2', minutes_ago=10 - n)
+        self.assertEqual(moderate_pending_reviews(), (3, 2))
+        self.assertEqual([reason for _status, reason in self.outcome()], ['', '', '', 'rate limited', 'rate limited'])
+
+    @override_settings(REVIEW_MODERATION={'MIN_LENGTH': 10, 'MAX_LENGTH': 50})
+    def test_length_and_duplicate_screening(self):
+        self.submit('Great site, got hired!', ip='10.0.0.3', minutes_ago=30, status='APPROVED')
+        self.submit('Too short', ip='10.0.0.4', minutes_ago=5)
+        self.submit('x' * 51, ip='10.0.0.5', minutes_ago=4)
+        self.submit('great SITE -- got hired', ip='10.0.0.6', minutes_ago=3)  # repost of a published one
+        self.submit('A brand new opinion.', ip='10.0.0.7', minutes_ago=2)
+        self.submit('a brand new opinion!!', ip='10.0.0.8', minutes_ago=1)  # repost within the batch
+        moderate_pending_reviews()
+        self.assertEqual([reason for _status, reason in self.outcome()][1:],
+                         ['too short', 'too long', 'duplicate', '', 'duplicate'])
+
+    def test_batches_publish_and_keep_the_stats_current(self):
+        for n in range(5):
+            self.submit(f'Student review {n} is long enough.', ip=f'10.1.0.{n}', rating=n + 1)
+        self.submit('Company review long enough.', ip='10.1.1.1', reviewer_type='company', rating=5)
+        self.submit('no', ip='10.1.1.2')
+        self.assertFalse(Review.objects.filter(is_active=True).exists())  # nothing shown before moderation
+        call_command('moderate_reviews', '--batch-size', '2', stdout=io.StringIO())
+
+        self.assertEqual(Review.objects.filter(status='PENDING').count(), 0)
+        stats = ReviewStats.load()
+        self.assertEqual((stats.total_count, stats.student_count, stats.company_count), (6, 5, 1))
+        self.assertEqual(stats.average_rating, Decimal('3.33'))
+
+        # Admin actions keep the aggregate in step too
+        model_admin = ReviewAdmin(Review, admin.site)
+        with mock.patch.object(model_admin, 'message_user'):
+            model_admin.reject_reviews(None, Review.objects.filter(reviewer_type='company'))
+        self.assertEqual(ReviewStats.load().total_count, 5)
+
+
+@plain_static
+class ScreeningTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.job = make_job(self.company, max_salary=50000, screen_salary=True, min_experience_months=24)
+        self.candidate = make_candidate()
+
+    def apply(self, **post):
+        self.client.force_login(self.candidate.user)
+        data = {'full_name': 'Cand', 'email': 'c@example.com', 'experience': '3 years', 'education': 'BSc'}
+        data.update(post)
+        return self.client.post(reverse('apply_job', args=[self.job.id]), data)
+
+    def test_apply_to_salary_screened_posting(self):
+        response = self.apply(expected_salary='90000')
+        self.assertRedirects(response, reverse('candidate_dashboard'), fetch_redirect_response=False)
+        application = JobApplication.objects.get(job=self.job)
+        self.assertEqual(application.expected_salary, Decimal('90000'))
+        self.assertEqual(application.experience_months, 36)
+        self.assertEqual(application.screening_flags, SALARY)
+
+    def test_invalid_salary_is_rejected_not_a_crash(self):
+        response = self.apply(expected_salary='lots')
+        self.assertRedirects(response, reverse('apply_job', args=[self.job.id]), fetch_redirect_response=False)
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_rule_change_rescreens_existing_applicants(self):
+        self.apply(experience='1 year', expected_salary='40000')
+        application = JobApplication.objects.get(job=self.job)
+        self.assertEqual(application.screening_flags, EXPERIENCE)
+
+        self.job.min_experience_months = None
+        self.job.min_education_level = 5
+        self.job.save()
+        application.refresh_from_db()
+        self.assertEqual(application.screening_flags, EDUCATION)
+
+    def test_status_change_does_not_rescreen(self):
+        self.apply(experience='1 year', expected_salary='40000')
+        application = JobApplication.objects.get(job=self.job)
+        with mock.patch('home.screening.screen') as screen:
+            application.status = 'REVIEWED'
+            application.save(update_fields=['status'])
+            application.status = 'INTERVIEW'
+            application.save()
+        screen.assert_not_called()
+        self.assertEqual(application.screening_flags, EXPERIENCE)
+
+    def test_answer_change_rescreens(self):
+        self.apply(experience='1 year', expected_salary='40000')
+        application = JobApplication.objects.get(job=self.job)
+        application.experience = '4 years'
+        application.save()
+        self.assertEqual((application.experience_months, application.screening_flags), (48, 0))
+
+    def test_reparse_fixes_values_from_an_older_parser(self):
+        self.apply(experience='Worked at Acme since 2019', expected_salary='40000')
+        JobApplication.objects.update(experience_months=24228)
+        call_command('screen_applications', '--reparse', stdout=io.StringIO())
+        application = JobApplication.objects.get(job=self.job)
+        self.assertEqual((application.experience_months, application.screening_flags), (None, 0))
+
+    def test_applicant_filters(self):
+        self.apply(experience='1 year', expected_salary='40000')
+        self.client.force_login(self.company.user)
+        url = reverse('view_applicants', args=[self.job.id])
+        self.assertEqual(len(self.client.get(url, {'screening': 'flagged'}).context['applicants']), 1)
+        self.assertEqual(len(self.client.get(url, {'screening': 'passed'}).context['applicants']), 0)
+        for value in ('inf', 'nan', '-1', 'abc', '1e400'):
+            with self.subTest(min_experience=value):
+                response = self.client.get(url, {'min_experience': value})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.context['applicants']), 1)
+
+
+class AdminSearchTests(TestCase):
+    def search(self, model, term):
+        model_admin = admin.site._registry[model]
+        queryset, _duplicates = model_admin.get_search_results(None, model.objects.all(), term)
+        return set(queryset.values_list('pk', flat=True))
+
+    def test_prefix_search_on_own_and_related_columns(self):
+        company = make_company()
+        python = make_job(company, title='Python Developer')
+        rust = make_job(company, title='Rust Engineer')
+        other = make_job(make_company('globex'), title='Designer')
+        CompanyProfile.objects.filter(user__username='globex').update(company_name='Globex')
+        self.assertEqual(self.search(JobPosting, 'python d'), {python.pk})
+        self.assertEqual(self.search(JobPosting, 'ACM'), {python.pk, rust.pk})
+        self.assertEqual(self.search(JobPosting, 'glob'), {other.pk})
+        self.assertEqual(self.search(JobPosting, 'developer'), set())
+
+    def test_text_search_is_opt_in(self):
+        job = make_job(make_company(), title='Backend Engineer')
+        JobPosting.objects.filter(pk=job.pk).update(description='Work on our Django APIs')
+        self.assertEqual(self.search(JobPosting, 'django'), set())
+        self.assertEqual(self.search(JobPosting, 'text: django'), {job.pk})
+
+    @plain_static
+    def test_location_filter_lists_only_locations_in_use(self):
+        make_job(make_company(), location='Dhaka, Bangladesh')
+        Location.objects.create(key='nowhere-town', name='Nowhere Town')
+        self.client.force_login(User.objects.create_superuser('root', password='pw'))
+        response = self.client.get(reverse('admin:home_jobposting_changelist'))
+        self.assertContains(response, 'normalized_location__id__exact=')
+        self.assertNotContains(response, 'Nowhere Town')
+
+
+class LocationParsingTests(SimpleTestCase):
+    def test_gazetteer_matching(self):
+        cases = {
+            'Dhaka, Bangladesh': 'dhaka', 'dacca': 'dhaka', 'Onsite - Chittagong': 'chattogram',
+            'Gulshan 2, Dhaka': 'gulshan', "Cox's Bazar": 'coxs-bazar', 'Hybrid (New Delhi)': 'delhi',
+        }
+        for text, key in cases.items():
+            with self.subTest(text=text):
+                parsed = parse_location(text)
+                self.assertEqual(parsed.key, key)
+                self.assertIsNotNone(parsed.latitude)
+
+    def test_remote_detection(self):
+        self.assertEqual(parse_location('Remote'), ParsedLocation(None, '', '', None, None, True))
+        remote_in_dhaka = parse_location('Dhaka (Remote)')
+        self.assertEqual((remote_in_dhaka.key, remote_in_dhaka.is_remote), ('dhaka', True))
+        self.assertFalse(parse_location('Remotely Park').is_remote)
+
+    def test_unknown_places_keep_a_key_without_coordinates(self):
+        parsed = parse_location('Springfield,  USA')
+        self.assertEqual(parsed, ParsedLocation('springfield', 'Springfield', '', None, None, False))
+        self.assertEqual(parse_location('SPRINGFIELD, usa').key, parsed.key)
+
+
+class NormalizeLocationsTests(TestCase):
+    def test_bulk_update_resolves_and_flags_postings(self):
+        company = make_company()
+        for text in ('Dhaka, Bangladesh', 'Remote', 'Springfield'):
+            make_job(company, location=text)
+        JobPosting.objects.update(normalized_location=None, is_remote=False)
+        Location.objects.all().delete()
+        out = io.StringIO()
+        call_command('normalize_locations', '--batch-size', '2', stdout=out)
+        self.assertIn('Scanned 3 posting(s), updated 3; 2 distinct location(s).', out.getvalue())
+
+        rows = {
+            job.location: (job.normalized_location and job.normalized_location.key, job.is_remote)
+            for job in JobPosting.objects.select_related('normalized_location')
+        }
+        self.assertEqual(rows, {
+            'Dhaka, Bangladesh': ('dhaka', False), 'Remote': (None, True), 'Springfield': ('springfield', False),
+        })
+        dhaka = Location.objects.get(key='dhaka')
+        self.assertEqual((dhaka.name, dhaka.country, (dhaka.grid_lat, dhaka.grid_lon)), ('Dhaka', 'BD', (47, 180)))
+        self.assertIsNone(Location.objects.get(key='springfield').latitude)
+
+
+class IntervalIndexTests(SimpleTestCase):
+    def test_conflict_finds_the_overlapping_neighbour(self):
+        index = IntervalIndex([(10, 20), (30, 40), (0, 5)])
+        self.assertEqual(index.conflict(15, 35), (30, 40))
+        self.assertEqual(index.conflict(12, 14), (10, 20))
+        self.assertEqual(index.conflict(0, 100), (30, 40))
+        # Half-open: touching ends are not a clash
+        self.assertIsNone(index.conflict(20, 30))
+        self.assertIsNone(index.conflict(5, 10))
+        self.assertIsNone(index.conflict(40, 50))
+
+    def test_add_keeps_intervals_disjoint(self):
+        index = IntervalIndex()
+        index.add(30, 40)
+        index.add(10, 20)
+        with self.assertRaises(ValueError):
+            index.add(35, 45)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.conflict(19, 31), (30, 40))
+
+
+class InterviewSchedulingTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.job = make_job(self.company)
+        self.day = timezone.localdate() + timedelta(days=7)
+
+    def at(self, hour, minute=0):
+        return timezone.make_aware(datetime.combine(self.day, clock(hour, minute)))
+
+    def shortlist(self, username, job=None):
+        return JobApplication.objects.create(job=job or self.job, candidate=make_candidate(username), status='INTERVIEW')
+
+    def slot(self, job, start, minutes=30, interviewer=''):
+        return InterviewSlot.objects.create(job=job, company_id=job.company_id, interviewer=interviewer,
+                                            start=start, end=start + timedelta(minutes=minutes))
+
+    def test_generate_skips_the_interviewers_busy_time(self):
+        other_job = make_job(self.company, title='Tester')
+        self.slot(other_job, self.at(9, 30), minutes=45, interviewer='rahim')
+        slots = generate_slots(self.job, self.day, clock(9), clock(12), duration=30, interviewer='rahim', count=4)
+        self.assertEqual([slot.start for slot in slots], [self.at(9), self.at(10, 15), self.at(10, 45), self.at(11, 15)])
+        # Another interviewer's calendar is independent
+        slots = generate_slots(self.job, self.day, clock(9), clock(10), duration=30, interviewer='karim', count=2)
+        self.assertEqual([slot.start for slot in slots], [self.at(9), self.at(9, 30)])
+
+    def test_generate_starts_a_begun_window_on_its_next_slot_boundary(self):
+        now = self.at(9, 7) + timedelta(seconds=42, microseconds=123)
+        with mock.patch('home.interviews.timezone.now', return_value=now):
+            slots = generate_slots(self.job, self.day, clock(9), clock(11), duration=25, gap=5, count=3)
+        self.assertEqual([slot.start for slot in slots], [self.at(9, 30), self.at(10), self.at(10, 30)])
+
+    def test_generate_defaults_to_shortlisted_without_a_slot(self):
+        for username in ('ana', 'bob', 'cy'):
+            self.shortlist(username)
+        self.slot(self.job, self.at(8))
+        slots = generate_slots(self.job, self.day, clock(9), clock(17), duration=30)
+        self.assertEqual(len(slots), 2)
+
+    def test_booking_claims_releases_and_refuses(self):
+        application = self.shortlist('ana')
+        first, second = self.slot(self.job, self.at(9)), self.slot(self.job, self.at(10))
+        book_slot(application, first.pk)
+        book_slot(application, second.pk)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertIsNone(first.application_id)
+        self.assertEqual(second.application_id, application.pk)
+
+        with self.assertRaises(SlotUnavailable):
+            book_slot(self.shortlist('bob'), second.pk)
+        past = self.slot(self.job, timezone.now() - timedelta(hours=1))
+        with self.assertRaises(SlotUnavailable):
+            book_slot(application, past.pk)
+
+    def test_booking_refuses_a_clash_with_the_candidates_other_interview(self):
+        other_job = make_job(make_company('globex'), title='Tester')
+        application = self.shortlist('ana')
+        other = JobApplication.objects.create(job=other_job, candidate=application.candidate, status='INTERVIEW')
+        book_slot(other, self.slot(other_job, self.at(9, 15)).pk)
+        with self.assertRaises(SlotUnavailable):
+            book_slot(application, self.slot(self.job, self.at(9)).pk)
+        self.assertEqual(book_slot(application, self.slot(self.job, self.at(9, 45)).pk).application, application)
+
+
+class SavedSearchAlertTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.now = timezone.now()
+        self.search = SavedSearch.objects.create(
+            candidate=make_candidate(), name='Part-time', filters={'job_type': 'PT'},
+            last_posted_date=self.now - timedelta(hours=1),
+        )
+
+    def posted(self, minutes_ago, **fields):
+        job = make_job(self.company, **fields)
+        JobPosting.objects.filter(pk=job.pk).update(posted_date=self.now - timedelta(minutes=minutes_ago))
+        return job
+
+    def alerted(self):
+        return [set(alert.jobs.values_list('pk', flat=True)) for alert in JobAlert.objects.order_by('pk')]
+
+    def test_alerts_on_matching_postings_past_the_mark_once(self):
+        same_time = [self.posted(30, job_type='PT'), self.posted(30, job_type='PT')]
+        self.posted(30, job_type='FT')
+        self.posted(120, job_type='PT')  # before the search was saved
+        # Keyset pages of one row must not skip postings sharing a posted_date
+        self.assertEqual(match_new_jobs(batch_size=1), (3, 1))
+        self.assertEqual(self.alerted(), [{job.pk for job in same_time}])
+        self.assertEqual(match_new_jobs(), (0, 0))
+
+    def test_postings_inside_the_lag_wait_for_the_next_run(self):
+        early = self.posted(30, job_type='PT')
+        recent = self.posted(0, job_type='PT')
+        match_new_jobs()
+        JobPosting.objects.filter(pk=recent.pk).update(posted_date=self.now - timedelta(minutes=5))
+        match_new_jobs()
+        self.assertEqual(self.alerted(), [{early.pk}, {recent.pk}])
+
+
+class AnalyticsRollupTests(TestCase):
+    def setUp(self):
+        self.job = make_job(make_company())
+
+    def apply(self, username, **fields):
+        return JobApplication.objects.create(job=self.job, candidate=make_candidate(username), **fields)
+
+    def funnel(self):
+        return JobFunnelStats.objects.get(job=self.job)
+
+    def test_lower_id_committed_after_a_higher_one_is_counted(self):
+        self.apply('ana')
+        late = self.apply('bob')
+        self.apply('cy')
+        late_id, bob = late.pk, late.candidate
+        late.delete()  # as if its transaction had not committed yet
+        rollup()
+        self.assertEqual(self.funnel().total, 2)
+
+        JobApplication.objects.create(id=late_id, job=self.job, candidate=bob)
+        rollup()
+        rollup()
+        self.assertEqual(self.funnel().total, 3)
+        self.assertEqual(RollupCheckpoint.objects.get(name='applications').gaps, {})
+
+    def test_gaps_that_never_fill_expire(self):
+        self.apply('ana')
+        self.apply('bob').delete()
+        self.apply('cy')
+        rollup()
+        self.assertEqual(len(RollupCheckpoint.objects.get(name='applications').gaps), 1)
+        with mock.patch('home.analytics.time.time', return_value=time.time() + GAP_SECONDS + 1):
+            rollup()
+        self.assertEqual(RollupCheckpoint.objects.get(name='applications').gaps, {})
+
+    def test_funnel_counts_each_application_once_per_stage(self):
+        application = self.apply('ana')
+        for status in ('REVIEWED', 'PENDING', 'REVIEWED', 'REJECTED', 'INTERVIEW', 'REJECTED'):
+            application.status = status
+            application.save()
+        rollup()
+        funnel = self.funnel()
+        self.assertEqual(
+            (funnel.reached_reviewed, funnel.reached_interview, funnel.rejected, funnel.reviewed_count), (1, 1, 1, 1),
+        )
+
+        application.status = 'HIRED'  # skipping OFFER still counts it
+        application.save()
+        rollup()
+        funnel = self.funnel()
+        self.assertEqual((funnel.reached_reviewed, funnel.reached_offer, funnel.hired), (1, 1, 1))
+
+
+@plain_static
+class FacetTests(TestCase):
+    def setUp(self):
+        self.acme = make_company()
+        self.globex = make_company('globex')
+        CompanyProfile.objects.filter(pk=self.globex.pk).update(industry='Finance')
+        make_job(self.acme, job_type='FT')
+        make_job(self.acme, job_type='PT')
+        make_job(self.globex, job_type='FT')
+
+    def counts(self, **selected):
+        return {
+            facet: {option['value']: option['count'] for option in options}
+            for facet, options in facet_counts(selected).items()
+        }
+
+    def test_industry_is_spelled_the_same_in_the_table_and_the_filter(self):
+        self.acme.industry = '  Software   Engineering '
+        self.acme.save()
+        self.assertEqual(self.counts()['industry'], {'Software Engineering': 2, 'Finance': 1})
+        selected = selected_filters({'industry': 'Software  Engineering'})
+        self.assertEqual(filter_jobs(JobPosting.objects.all(), selected).count(), 2)
+
+    def test_counts_follow_the_other_selections(self):
+        self.assertEqual(self.counts()['job_type'], {'FT': 2, 'PT': 1})
+        counts = self.counts(industry='Finance')
+        self.assertEqual(counts['job_type'], {'FT': 1})
+        # The selected facet keeps its alternatives' counts
+        self.assertEqual(counts['industry'], {'Software': 2, 'Finance': 1})
+        self.assertEqual(self.counts(industry='Finance', job_type='PT')['job_type'], {'FT': 1, 'PT': 0})
+
+    def test_drilldown_counts_come_from_the_summary_table(self):
+        with self.assertNumQueries(2):  # the counts, then the location names
+            facet_counts({'industry': 'Finance', 'job_type': 'FT'})
+        self.acme.industry = 'Retail'
+        self.acme.save()
+        self.assertEqual(self.counts(industry='Retail')['job_type'], {'FT': 1, 'PT': 1})
+        self.assertEqual(self.counts(job_type='PT')['industry'], {'Retail': 1})
+        before = self.counts(industry='Retail', salary_band='none')
+        call_command('refresh_facets', stdout=io.StringIO())
+        self.assertEqual(self.counts(industry='Retail', salary_band='none'), before)
+
+    def test_dashboard_lists_and_counts_the_selection(self):
+        self.client.force_login(make_candidate().user)
+        response = self.client.get(reverse('candidate_dashboard'), {'industry': 'Finance'})
+        self.assertEqual(len(response.context['jobs']), 1)
+        self.assertEqual({option['value']: option['count'] for option in response.context['facets']['job_type']},
+                         {'FT': 1})
+
+
+@plain_static
+class CandidateDashboardTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.candidate = make_candidate()
+        self.client.login(username='cand', password='pw')
+
+    def add_jobs(self, count):
+        jobs = [make_job(self.company, title=f'Role {number}') for number in range(count)]
+        for job in jobs[::2]:
+            JobApplication.objects.create(job=job, candidate=self.candidate, full_name='Cand')
+        SavedSearch.objects.create(candidate=self.candidate, name=f'Search {count}', filters={'type': 'FT'})
+        return jobs
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        # User, page count, profile, applications, archived applications,
+        # page of jobs, saved searches, alerts, facet counts, location names
+        for total in (2, 12):
+            self.add_jobs(total - JobPosting.objects.count())
+            with self.subTest(jobs=total), self.assertNumQueries(10):
+                response = self.client.get(reverse('candidate_dashboard'))
+            self.assertEqual(len(response.context['jobs']), min(total, 10))
+
+    def test_jobs_already_applied_for_are_marked(self):
+        jobs = self.add_jobs(3)
+        response = self.client.get(reverse('candidate_dashboard'))
+        applied = {job.pk: job.has_applied for job in response.context['jobs']}
+        self.assertEqual(applied, {jobs[0].pk: True, jobs[1].pk: False, jobs[2].pk: True})
+
+
+class JobSnapshotTests(TestCase):
+    def test_snapshot_from_before_a_field_was_added_still_loads(self):
+        job = make_job(make_company(), min_experience_months=12)
+        job = JobPosting.objects.select_related('company').get(pk=job.pk)
+        snapshot = serialize_job(job)
+        del snapshot['job']['min_experience_months']
+
+        restored = deserialize_job(snapshot)
+        self.assertEqual((restored.pk, restored.title, restored.company.company_name), (job.pk, job.title, 'Acme'))
+        with self.assertNumQueries(1):  # the missing field is loaded on access
+            self.assertEqual(restored.min_experience_months, 12)
+
+    @override_settings(JOB_CACHE={'LOCK_WAIT': 0.1})
+    def test_fill_does_not_release_a_lock_held_elsewhere(self):
+        job = make_job(make_company())
+        lock_key = f'{job_key(job.pk)}:lock'
+        caches['default'].add(lock_key, 'other-process', 10)
+        try:
+            self.assertEqual(get_job_snapshot(job.pk).pk, job.pk)
+            self.assertEqual(caches['default'].get(lock_key), 'other-process')
+        finally:
+            caches['default'].delete(lock_key)
+            invalidate_job(job.pk)
+
+
+class ResumeStorageGCTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        self.storage = resume_storage()
+
+    def age(self, name, hours=48):
+        old = time.time() - hours * 3600
+        os.utime(self.storage.path(name), (old, old))
+
+    def test_duplicate_upload_refreshes_the_shared_file(self):
+        name = self.storage.save('resumes/cv.pdf', ContentFile(b'%PDF same bytes'))
+        self.age(name)
+        self.assertEqual(self.storage.save('resumes/other.pdf', ContentFile(b'%PDF same bytes')), name)
+        self.assertGreater(os.path.getmtime(self.storage.path(name)), time.time() - 60)
+
+    def test_gc_keeps_a_file_referenced_after_its_snapshot(self):
+        name = self.storage.save('resumes/cv.pdf', ContentFile(b'%PDF referenced late'))
+        orphan = self.storage.save('resumes/old.pdf', ContentFile(b'%PDF orphan'))
+        self.age(name)
+        self.age(orphan)
+        CandidateResume.objects.create(candidate=make_candidate(), file=name)
+        # A snapshot taken before that row committed
+        with mock.patch.object(GCMediaCommand, 'reference_counts', return_value={}):
+            call_command('gc_media', stdout=io.StringIO())
+        self.assertTrue(self.storage.exists(name))
+        self.assertFalse(self.storage.exists(orphan))
+
+
+class ResumePreviewTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        self.storage = resume_storage()
+
+    def thumbnail(self, digest, hours=48):
+        name = thumbnail_name(digest)
+        path = os.path.join(settings.MEDIA_ROOT, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(b'\x89PNG')
+        old = time.time() - hours * 3600
+        os.utime(path, (old, old))
+        return name
+
+    def test_saving_a_resume_queues_its_preview(self):
+        name = self.storage.save('resumes/cv.docx', ContentFile(b'docx'))
+        with mock.patch('home.signals.queue_preview') as queue, self.captureOnCommitCallbacks(execute=True):
+            CandidateResume.objects.create(candidate=make_candidate(), file=name)
+        queue.assert_called_once_with(name)
+
+    def test_record_preview_stores_one_row_per_file(self):
+        document = io.BytesIO()
+        with zipfile.ZipFile(document, 'w') as archive:
+            archive.writestr('word/document.xml', '<w:p><w:t>Jane Doe</w:t></w:p><w:p><w:t>Python</w:t></w:p>')
+        name = self.storage.save('resumes/cv.docx', ContentFile(document.getvalue()))
+        record_preview(name)
+        record_preview(name)
+        preview = ResumePreview.objects.get()
+        self.assertEqual((preview.source_name, preview.text, preview.thumbnail), (name, 'Jane Doe Python', ''))
+
+    def test_gc_removes_orphaned_previews_and_their_thumbnails(self):
+        kept = self.storage.save('resumes/kept.pdf', ContentFile(b'%PDF kept'))
+        CandidateResume.objects.create(candidate=make_candidate(), file=kept)
+        shared = self.thumbnail('a' * 64)
+        orphaned = self.thumbnail('b' * 64)
+        stray = self.thumbnail('c' * 64)
+        rendering = self.thumbnail('d' * 64, hours=0)
+        ResumePreview.objects.bulk_create([
+            ResumePreview(source_name=kept, content_hash='a' * 64, thumbnail=shared),
+            # An identical upload whose resume row is gone shares the thumbnail
+            ResumePreview(source_name='resumes/gone-copy.pdf', content_hash='a' * 64, thumbnail=shared),
+            ResumePreview(source_name='resumes/gone.pdf', content_hash='b' * 64, thumbnail=orphaned),
+        ])
+        out = io.StringIO()
+        call_command('gc_media', stdout=out)
+        self.assertIn('2 preview(s) and 2 thumbnail(s)', out.getvalue())
+        self.assertEqual(list(ResumePreview.objects.values_list('source_name', flat=True)), [kept])
+        media = settings.MEDIA_ROOT
+        self.assertTrue(os.path.exists(os.path.join(media, shared)))
+        self.assertTrue(os.path.exists(os.path.join(media, rendering)))
+        self.assertFalse(os.path.exists(os.path.join(media, orphaned)))
+        self.assertFalse(os.path.exists(os.path.join(media, stray)))
+
+
+class ResumeDownloadTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name, MEDIA_SERVE_METHOD='django'))
+        storage = resume_storage()
+        self.candidate = make_candidate()
+        self.company = make_company()
+        self.other_company = make_company('globex')
+        submitted = storage.save('resumes/cv.pdf', ContentFile(b'%PDF submitted'))
+        self.submitted = CandidateResume.objects.create(candidate=self.candidate, file=submitted)
+        self.private = CandidateResume.objects.create(
+            candidate=self.candidate, file=storage.save('resumes/draft.pdf', ContentFile(b'%PDF never sent')),
+        )
+        self.application = JobApplication.objects.create(
+            job=make_job(self.company), candidate=self.candidate, resume=submitted,
+        )
+
+    def get(self, user, resume, **headers):
+        self.client.logout()
+        if user is not None:
+            self.client.force_login(user)
+        return self.client.get(reverse('download_candidate_resume', args=[resume.pk]), headers=headers)
+
+    def test_access(self):
+        cases = [
+            (self.candidate.user, self.submitted, 200),
+            (self.candidate.user, self.private, 200),
+            (self.company.user, self.submitted, 200),
+            (self.company.user, self.private, 404),  # in the library, never sent to this company
+            (self.other_company.user, self.submitted, 404),
+            (None, self.submitted, 302),
+        ]
+        for user, resume, status in cases:
+            with self.subTest(user=user, resume=resume.file.name):
+                self.assertEqual(self.get(user, resume).status_code, status)
+        self.client.force_login(self.other_company.user)
+        response = self.client.get(reverse('download_application_resume', args=[self.application.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_range_and_conditional_requests(self):
+        response = self.get(self.candidate.user, self.submitted, range='bytes=0-3')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF')
+        self.assertEqual(response['Content-Range'], f'bytes 0-3/{len(b"%PDF submitted")}')
+
+        self.assertEqual(self.get(self.candidate.user, self.submitted, range='bytes=100-').status_code, 416)
+
+        etag = self.get(self.candidate.user, self.submitted)['ETag']
+        self.assertEqual(self.get(self.candidate.user, self.submitted, if_none_match=etag).status_code, 304)
+
+    @override_settings(MEDIA_SERVE_METHOD='x-accel')
+    def test_front_server_offload(self):
+        response = self.get(self.company.user, self.submitted)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.submitted.file.name}')
+        self.assertEqual(response.content, b'')
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.jobs = [
+            make_job(self.company, title='Python Developer', requirements='Python, Django'),
+            make_job(self.company, title='Python Developer', requirements='Python; SQL'),
+            make_job(self.company, title='Senior Python Engineer', requirements='Go'),
+        ]
+
+    def built_index(self):
+        index = PrefixIndex()
+        index.build()
+        return index
+
+    def test_search_matches_word_starts_and_ranks_by_use(self):
+        index = self.built_index()
+        self.assertEqual(index.search('py'), [
+            ('skill', 'Python', 2), ('title', 'Python Developer', 2), ('title', 'Senior Python Engineer', 1),
+        ])
+        self.assertEqual(index.search('  ENG ', ('title',)), [('title', 'Senior Python Engineer', 1)])
+        self.assertEqual(index.search('acm', ('company',)), [('company', 'Acme', 3)])
+        self.assertEqual(index.search('thon'), [])
+
+    def test_apply_jobs_reindexes_from_the_current_rows(self):
+        index = self.built_index()
+        JobPosting.objects.filter(pk=self.jobs[0].pk).update(title='Data Analyst')
+        JobPosting.objects.filter(pk=self.jobs[2].pk).update(is_active=False)
+        index.apply_jobs({self.jobs[0].pk, self.jobs[2].pk})
+        self.assertEqual(index.search('py', ('title',)), [('title', 'Python Developer', 1)])
+        self.assertEqual(index.search('data'), [('title', 'Data Analyst', 1)])
+        self.assertEqual(index.search('go'), [])
+
+    def test_sync_replays_changes_logged_by_another_process(self):
+        index = self.built_index()
+        make_job(self.company, title='Rust Developer', requirements='Rust')
+        self.jobs[1].delete()
+        index.next_sync = 0.0
+        index.sync()
+        self.assertEqual(index.search('rust', ('title',)), [('title', 'Rust Developer', 1)])
+        self.assertEqual(index.search('sql'), [])
+        # Rows still inside the overlap are not applied a second time
+        index.next_sync = 0.0
+        with mock.patch.object(index, 'apply_jobs') as apply_jobs:
+            index.sync()
+        apply_jobs.assert_not_called()
+
+    def test_sync_picks_up_a_change_that_committed_after_the_last_sync(self):
+        index = self.built_index()
+        job = make_job(self.company, title='Go Developer', requirements='Go')
+        # Stamped before the sync started, visible only after it
+        SuggestionChange.objects.filter(job_id=job.pk).update(changed_at=index.synced_at - timedelta(seconds=5))
+        index.next_sync = 0.0
+        index.sync()
+        self.assertEqual(index.search('go', ('title',)), [('title', 'Go Developer', 1)])
+
+    def test_sync_rebuilds_after_falling_behind_the_pruned_log(self):
+        index = self.built_index()
+        index.synced_at -= timedelta(hours=2)
+        index.next_sync = 0.0
+        with mock.patch.object(index, 'build') as build:
+            index.sync()
+        build.assert_called_once()
+
+    def test_log_changes_restamps_one_row_per_posting_and_prunes_old_ones(self):
+        SuggestionChange.objects.update(changed_at=timezone.now() - timedelta(hours=2))
+        log_changes([self.jobs[0].pk])
+        log_changes([self.jobs[0].pk])
+        self.assertEqual(list(SuggestionChange.objects.values_list('job_id', flat=True)), [self.jobs[0].pk])
+
+
+# Real commits: a failed INSERT must not poison the test's own transaction
+class ContentionTests(TransactionTestCase):
+    def setUp(self):
+        reset()
+        self.job = make_job(make_company())
+        make_candidate()
+        self.client.login(username='cand', password='pw')
+
+    def apply(self, key):
+        return self.client.post(reverse('apply_job', args=[self.job.pk]), {'full_name': 'Cand', FIELD: key})
+
+    def test_a_replayed_key_redirects_without_inserting_again(self):
+        self.assertRedirects(self.apply('k1'), reverse('candidate_dashboard'), fetch_redirect_response=False)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.apply('k1')
+        self.assertRedirects(response, reverse('candidate_dashboard'), fetch_redirect_response=False)
+        self.assertFalse([query for query in queries if query['sql'].startswith('INSERT')])
+        self.assertEqual(JobApplication.objects.count(), 1)
+        self.assertEqual(IdempotencyKey.objects.get().redirect_url, reverse('candidate_dashboard'))
+
+    def test_a_second_application_hits_the_unique_constraint(self):
+        self.apply('k1')
+        response = self.apply('k2')
+        self.assertRedirects(response, reverse('job_detail', args=[self.job.pk]), fetch_redirect_response=False)
+        self.assertEqual(JobApplication.objects.count(), 1)
+        # The losing submission's key rolled back with its INSERT
+        self.assertFalse(IdempotencyKey.objects.filter(key='k2').exists())
+        self.assertEqual(stats(['apply'])['apply']['duplicates'], 1)
+
+    @mock.patch('home.contention.time.sleep')
+    def test_lock_errors_are_retried_then_given_up(self, sleep):
+        func = mock.Mock(side_effect=[OperationalError('database is locked'), 'saved'])
+        self.assertEqual(retry_on_contention('apply', func), 'saved')
+        self.assertEqual(func.call_count, 2)
+
+        reset()
+        sleep.reset_mock()
+        func = mock.Mock(side_effect=OperationalError('database is locked'))
+        with self.assertRaises(OperationalError), self.assertLogs('home.contention', 'WARNING'):
+            retry_on_contention('apply', func)
+        self.assertEqual(func.call_count, MAX_ATTEMPTS)
+        self.assertEqual(sleep.call_count, MAX_ATTEMPTS - 1)
+        self.assertEqual(stats(['apply'])['apply'], {
+            'calls': 1, 'retries': MAX_ATTEMPTS - 1, 'exhausted': 1, 'duplicates': 0,
+        })
+
+    def test_other_operational_errors_are_not_retried(self):
+        func = mock.Mock(side_effect=OperationalError('no such table: home_jobposting'))
+        with self.assertRaises(OperationalError):
+            retry_on_contention('apply', func)
+        func.assert_called_once()
+
+
+class LiveEventsTests(TestCase):
+    def test_channels_for_user_covers_both_profiles(self):
+        company = make_company()
+        candidate = CandidateProfile.objects.create(user=company.user, full_name='Acme Owner')
+        self.assertEqual(channels_for_user(company.user), [company_channel(company.pk), candidate_channel(candidate.pk)])
+        self.assertEqual(channels_for_user(User.objects.create_user('nobody')), [])
+
+    def test_event_stream_answers_204_without_a_stream(self):
+        make_company()
+        self.assertEqual(self.client.get(reverse('event_stream')).status_code, 204)
+        # The test client is WSGI, where a stream would be buffered forever
+        self.client.login(username='acme', password='pw')
+        self.assertEqual(self.client.get(reverse('event_stream')).status_code, 204)
+
+    def test_format_sse(self):
+        message = {'event': 'status', 'data': {'id': 3, 'status': 'Hired'}}
+        self.assertEqual(format_sse(message, 7), 'id: 7\nevent: status\ndata: {"id": 3, "status": "Hired"}\n\n')
+
+    @override_settings(ALLOWED_HOSTS=['jobs.example.com'])
+    def test_websocket_origin_must_be_an_allowed_host(self):
+        self.assertTrue(_origin_allowed({'origin': 'https://jobs.example.com'}))
+        self.assertTrue(_origin_allowed({}))
+        self.assertFalse(_origin_allowed({'origin': 'https://evil.example.net'}))
+        self.assertFalse(_origin_allowed({'origin': 'null'}))
+
+    async def test_local_broker_fans_out_to_each_channel_subscriber(self):
+        local = LocalBroker(QUEUE_SIZE=2)
+        async with local.subscribe(['company-1']) as first, local.subscribe(['company-1', 'candidate-2']) as second:
+            async with local.subscribe(['candidate-2']) as other:
+                local.publish('company-1', {'event': 'new', 'data': 1})
+                self.assertEqual(await asyncio.wait_for(first.get(), 1), {'event': 'new', 'data': 1})
+                self.assertEqual(await asyncio.wait_for(second.get(), 1), {'event': 'new', 'data': 1})
+                self.assertTrue(other.empty())
+                # A subscriber that stops reading keeps only the newest QUEUE_SIZE events
+                for number in range(3):
+                    local.publish('candidate-2', {'event': 'new', 'data': number})
+                await asyncio.sleep(0)
+                self.assertEqual([other.get_nowait()['data'] for _ in range(other.qsize())], [1, 2])
+        self.assertEqual(local._subscribers, {})
+
+
+@plain_static
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.company = make_company()
+        self.old = make_job(self.company, title='Old Role', is_active=False)
+        self.live = make_job(self.company, title='Open Role')
+        JobPosting.objects.filter(pk__in=[self.old.pk, self.live.pk]).update(posted_date=timezone.now() - timedelta(days=400))
+        self.candidate = make_candidate()
+        JobApplication.objects.create(job=self.old, candidate=self.candidate, full_name='Cand', status='HIRED')
+        JobApplication.objects.create(job=self.live, candidate=self.candidate, full_name='Cand')
+
+    def test_archiving_moves_closed_postings_and_their_applications(self):
+        self.assertEqual(archive_jobs(), (1, 1))
+        self.assertFalse(JobPosting.objects.filter(pk=self.old.pk).exists())
+        self.assertFalse(JobApplication.objects.filter(job_id=self.old.pk).exists())
+        archived = ArchivedJobPosting.objects.get()
+        self.assertEqual((archived.pk, archived.title, archived.application_count, archived.hired_count),
+                         (self.old.pk, 'Old Role', 1, 1))
+        self.assertEqual(ArchivedJobApplication.objects.get().job_id, self.old.pk)
+        # Active postings stay, however old
+        self.assertTrue(JobApplication.objects.filter(job=self.live).exists())
+        self.assertEqual(archive_jobs(), (0, 0))
+
+    def test_archived_views_are_read_only_and_company_scoped(self):
+        archive_jobs()
+        self.client.login(username='acme', password='pw')
+        self.assertContains(self.client.get(reverse('company_archived_jobs')), 'Old Role')
+        self.assertContains(self.client.get(reverse('archived_job_applicants', args=[self.old.pk])), 'Cand')
+
+        make_company('rival')
+        self.client.login(username='rival', password='pw')
+        self.assertNotContains(self.client.get(reverse('company_archived_jobs')), 'Old Role')
+        self.assertEqual(self.client.get(reverse('archived_job_applicants', args=[self.old.pk])).status_code, 404)
+
+        request = mock.Mock(user=User.objects.create_superuser('root', password='pw'))
+        for model in (ArchivedJobPosting, ArchivedJobApplication):
+            model_admin = admin.site._registry[model]
+            self.assertFalse(model_admin.has_add_permission(request))
+            self.assertFalse(model_admin.has_change_permission(request, model.objects.first()))
+
+
+class Interrupted(Exception):
+    pass
+
+
+class DatabaseCopyTests(TestCase):
+    databases = {'default', COPY_TARGET}
+
+    def setUp(self):
+        company = make_company()
+        self.jobs = [make_job(company, title=f'Role {number}') for number in range(3)]
+        JobApplication.objects.create(job=self.jobs[0], candidate=make_candidate(), full_name='Cand')
+
+    def migrate_database(self, *args):
+        out = io.StringIO()
+        call_command('migrate_database', '--target', COPY_TARGET, *args, stdout=out, stderr=io.StringIO())
+        return out.getvalue()
+
+    def test_copies_every_table_and_verifies_it(self):
+        self.assertIn('row counts and checksums match', self.migrate_database())
+        self.assertEqual(
+            list(JobPosting.objects.using(COPY_TARGET).order_by('pk').values_list('pk', 'title', 'posted_date')),
+            list(JobPosting.objects.order_by('pk').values_list('pk', 'title', 'posted_date')),
+        )
+        self.assertEqual(JobApplication.objects.using(COPY_TARGET).get().full_name, 'Cand')
+        self.assertIn('row counts and checksums match', self.migrate_database('--verify-only'))
+
+    def test_resumes_after_the_last_checkpoint(self):
+        def stop_after_two_postings(model, copied):
+            if model is JobPosting and copied == 2:
+                raise Interrupted
+
+        with self.assertRaises(Interrupted):
+            copy_database(copyable_models(), 'default', COPY_TARGET, 1, stop_after_two_postings)
+        checkpoint = read_checkpoints(COPY_TARGET)['home.jobposting']
+        self.assertEqual((checkpoint['last_pk'], checkpoint['copied'], checkpoint['done']), (self.jobs[1].pk, 2, False))
+
+        # A second copy of rows already there would fail on their primary keys
+        self.assertIn('row counts and checksums match', self.migrate_database('--batch-size', '1'))
+        self.assertEqual(JobPosting.objects.using(COPY_TARGET).count(), 3)
+
+    def test_refuses_a_target_with_data_of_its_own(self):
+        User.objects.db_manager(COPY_TARGET).create_user('stray')
+        with self.assertRaisesMessage(CommandError, 'auth_user'):
+            self.migrate_database()
+        self.assertFalse(JobPosting.objects.using(COPY_TARGET).exists())
+
+
+class StaticFilesMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        for name, body in (('app.css', b'plain'), ('app.css.br', b'brotli'), ('app.css.gz', b'gzip')):
+            with open(os.path.join(root.name, name), 'wb') as handle:
+                handle.write(body)
+        self.enterContext(override_settings(STATIC_ROOT=root.name, STATIC_URL='/static/', SERVE_STATIC=True))
+        self.middleware = StaticFilesMiddleware(lambda request: None)
+
+    def get(self, accept=None, **headers):
+        if accept is not None:
+            headers['HTTP_ACCEPT_ENCODING'] = accept
+        response = self.middleware(RequestFactory().get('/static/app.css', **headers))
+        self.addCleanup(response.close)
+        return response
+
+    def test_picks_the_best_acceptable_variant(self):
+        cases = {
+            None: None, '': None, 'identity': None,
+            'gzip, deflate, br': 'br', 'gzip': 'gzip', 'br;q=0, gzip': 'gzip', 'gzip;q=0, br;q=0': None,
+            'br;q=0.5, gzip;q=0.8': 'gzip', 'BR': 'br', '*': 'br', '*;q=0.1, br;q=0': 'gzip', 'gzip;q=zero': None,
+        }
+        bodies = {None: b'plain', 'br': b'brotli', 'gzip': b'gzip'}
+        for accept, encoding in cases.items():
+            with self.subTest(accept=accept):
+                response = self.get(accept)
+                self.assertEqual(response.get('Content-Encoding'), encoding)
+                self.assertEqual(b''.join(response.streaming_content), bodies[encoding])
+                self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_not_modified_is_per_variant(self):
+        etag = self.get('br')['ETag']
+        response = self.get('br', HTTP_IF_NONE_MATCH=f'"other", {etag}')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual((response['ETag'], response['Vary']), (etag, 'Accept-Encoding'))
+        self.assertEqual(self.get('br;q=0', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@plain_static
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.url = reverse('job_detail', args=[make_job(make_company()).pk])
+
+    def login(self, is_staff):
+        self.client.force_login(User.objects.create_user('viewer', password='pw', is_staff=is_staff))
+
+    @override_settings(PROFILING={'SLOW_QUERY_MS': 0})
+    def test_non_staff_cannot_turn_profiling_on(self):
+        self.login(is_staff=False)
+        response = self.client.get(self.url, {'_profile': '1'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response.headers)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    @override_settings(PROFILING={'SLOW_QUERY_MS': 0})
+    def test_staff_request_is_profiled(self):
+        self.login(is_staff=True)
+        for flag, mode in (('1', 'cprofile'), ('sample', 'sample')):
+            with self.subTest(flag=flag):
+                response = self.client.get(self.url, {'_profile': flag})
+                profile = RequestProfile.objects.get(pk=response.headers['X-Profile-Id'])
+                self.assertEqual(profile.mode, mode)
+                self.assertEqual(profile.view, 'home.views.job_detail')
+                self.assertEqual(profile.status_code, 200)
+                self.assertGreater(profile.query_count, 0)
+
+    def test_query_over_threshold_is_saved(self):
+        self.login(is_staff=False)  # the session and user lookups always reach the database
+        # Every statement appears to take a second to the query timer only
+        clock = mock.Mock(perf_counter=mock.Mock(side_effect=itertools.count()))
+        with override_settings(PROFILING={'SLOW_QUERY_MS': 500}), mock.patch('home.profiling.time', clock):
+            self.client.get(self.url)
+        slow = SlowQuery.objects.filter(view='home.views.job_detail')
+        self.assertTrue(slow.exists())
+        self.assertTrue(all(query.duration_ms >= 500 and query.path == self.url for query in slow))
+        self.assertTrue(slow.filter(sql__startswith='SELECT').exclude(plan='').exists())
+
+        SlowQuery.objects.all().delete()
+        with override_settings(PROFILING={'SLOW_QUERY_MS': 500}):
+            self.client.get(self.url)
+        self.assertFalse(SlowQuery.objects.exists())
+
+
+@override_settings(SITE_URL='https://jobs.example.com')
+class FeedTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.enterContext(override_settings(FEEDS_ROOT=root.name))
+        # One posting per sitemap chunk, so a dozen postings make a dozen chunks
+        self.enterContext(mock.patch('home.feeds.CHUNK_SIZE', 1))
+        self.company = make_company()
+
+    def read(self, name):
+        with open(os.path.join(settings.FEEDS_ROOT, name)) as handle:
+            return handle.read()
+
+    def dirty(self):
+        return set(FeedFile.objects.filter(dirty=True).values_list('name', flat=True))
+
+    def test_changes_mark_only_the_affected_files(self):
+        job = make_job(self.company)
+        self.assertEqual(self.dirty(), {chunk_name(job.pk), FEED_NAME})
+        build_dirty()
+        self.assertEqual(self.dirty(), set())
+
+        self.company.company_name = 'Acme Ltd'
+        self.company.save()
+        self.assertEqual(self.dirty(), {FEED_NAME})
+        build_dirty()
+        closed = make_job(self.company, is_active=False)
+        FeedFile.objects.update(dirty=False)
+        closed.delete()
+        self.assertEqual(self.dirty(), set())
+
+    def test_build_writes_sitemaps_and_feeds(self):
+        jobs = [make_job(self.company, title=f'Role {number}') for number in range(12)]
+        make_job(self.company, title='Closed', is_active=False)
+        build_dirty(rebuild_all=True)
+
+        index = self.read('sitemap.xml')
+        numbers = [int(number) for number in re.findall(r'/sitemaps/sitemap-(\d+)\.xml', index)]
+        self.assertEqual(numbers, sorted(job.pk for job in jobs))
+        chunk = self.read(f'sitemaps/{chunk_name(jobs[10].pk)}.xml')
+        self.assertIn(f'<loc>https://jobs.example.com/jobs/{jobs[10].pk}/</loc>', chunk)
+
+        feed = json.loads(self.read('feeds/jobs.json'))
+        self.assertEqual(len(feed['items']), 12)
+        self.assertEqual(feed['items'][0]['title'], 'Role 11 at Acme')
+        self.assertNotIn('Closed', self.read('feeds/jobs.rss'))
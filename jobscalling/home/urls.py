@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import path, re_path
 from . import views
 
 urlpatterns = [
@@ -9,17 +9,37 @@ urlpatterns = [
     path("candidate/login/", views.candidate_login, name="candidate_login"),
     path("company/login/", views.company_login, name="company_login"),
    path('candidate/dashboard/', views.candidate_dashboard, name='candidate_dashboard'),
+    path('candidate/saved-searches/', views.save_search, name='save_search'),
+    path('candidate/saved-searches/<int:search_id>/delete/', views.delete_saved_search, name='delete_saved_search'),
+    path('candidate/alerts/read/', views.mark_alerts_read, name='mark_alerts_read'),
     path('candidate/upload-cv/', views.candidate_cv, name='candidate_cv'),
     path('candidate/profile/', views.candidate_profile, name='candidate_profile'),
     path('company/dashboard/', views.company_dashboard, name='company_dashboard'),
     # Job posting and management
     path('company/post-job/', views.post_job, name='post_job'),
     path('company/jobs/', views.company_job_list, name='company_job_list'),
+    path('company/jobs/archived/', views.company_archived_jobs, name='company_archived_jobs'),
+    path('company/jobs/archived/<int:job_id>/applicants/', views.archived_job_applicants, name='archived_job_applicants'),
+    path('jobs/autocomplete/', views.autocomplete, name='autocomplete'),
     path('jobs/<int:pk>/', views.job_detail, name='job_detail'),
     path('jobs/<int:job_id>/apply/', views.apply_for_job, name='apply_job'),
     path('submit-review/', views.submit_review, name='submit_review'),
     path('company/jobs/<int:job_id>/applicants/', views.view_applicants, name='view_applicants'),
     path('company/application/<int:application_id>/', views.application_detail, name='application_detail'),
-
-
+    # Interview scheduling
+    path('company/jobs/<int:job_id>/interviews/', views.interview_slots, name='interview_slots'),
+    path('company/interviews/<int:slot_id>/delete/', views.delete_interview_slot, name='delete_interview_slot'),
+    path('candidate/applications/<int:application_id>/interview/', views.book_interview, name='book_interview'),
+    path('candidate/applications/<int:application_id>/interview/cancel/', views.cancel_interview, name='cancel_interview'),
+    # Authorization-checked resume downloads (media is not publicly served)
+    path('resumes/<int:resume_id>/', views.download_candidate_resume, name='download_candidate_resume'),
+    path('applications/<int:application_id>/resume/', views.download_application_resume, name='download_application_resume'),
+    path('archived-applications/<int:application_id>/resume/', views.download_archived_application_resume, name='download_archived_application_resume'),
+    path('applications/<int:application_id>/resume/preview.png', views.application_resume_preview, name='application_resume_preview'),
+    # Live updates (home.events); the WebSocket variant is routed in asgi.py
+    path('events/', views.event_stream, name='event_stream'),
+    # Crawler files generated by `manage.py build_feeds`
+    path('sitemap.xml', views.serve_feed_file, {'path': 'sitemap.xml'}, name='sitemap'),
+    re_path(r'^(?P<path>sitemaps/sitemap-\d+\.xml)$', views.serve_feed_file, name='sitemap_chunk'),
+    re_path(r'^(?P<path>feeds/jobs\.(?:rss|json))$', views.serve_feed_file, name='job_feed'),
 ]    
@@ -1,18 +1,45 @@
+import math
+import os
+import time
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.static import serve as static_serve
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
 from django.contrib import messages
 from .models import CandidateProfile, CompanyProfile
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.decorators import login_required
-from django.db import IntegrityError # Needed for unique_together constraint
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, OperationalError, transaction # Needed for unique_together constraint
 from django.utils import timezone
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Count
+from django.db.models import Count, Prefetch, Q
 
 # Import models and form
-from .models import CandidateProfile, CompanyProfile, JobPosting, JobApplication, CandidateResume, Review
-from .forms import JobPostingForm # Assumes you have created this form
+from .models import CandidateProfile, CompanyProfile, JobPosting, JobApplication, CandidateResume, Review, ReviewStats, ResumePreview
+from .models import ArchivedJobApplication, ArchivedJobPosting, EDUCATION_LEVELS, InterviewSlot, JobAlert, SavedSearch
+from .forms import InterviewSlotForm, JobPostingForm # Assumes you have created this form
+from .moderation import review_fingerprint
+from .cache import get_job_snapshot
+from .media import protected_file_response, protected_path_response
+from .previews import attach_previews
+from .facets import facet_counts, filter_jobs, selected_filters
+from .analytics import company_analytics
+from .autocomplete import KINDS, LIMIT, get_index
+from .geo import DEFAULT_RADIUS, RADIUS_CHOICES, filter_near
+from .alerts import MAX_SAVED_SEARCHES, describe, search_filters
+from .events import channels_for_user, sse_messages
+from .contention import count, retry_on_contention
+from .idempotency import completed_url, new_key, remember, request_key
+from .interviews import SHORTLISTED, SlotUnavailable, book_slot, cancel_booking, generate_slots, open_slots, shortlisted_without_slot
 
 
 # Candidate Registration
@@ -29,26 +56,28 @@ def candidate_register(request):
             messages.error(request, "Passwords do not match.")
             return redirect("candidate_register")
 
-        # Check if email already exists
-        if User.objects.filter(username=email).exists():
+        # Hash outside the transaction so the write lock is held only for the inserts
+        password_hash = make_password(password)
+
+        # Create user and candidate profile atomically; the unique username
+        # constraint rejects duplicate emails without a separate lookup.
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    username=email ,
+                    first_name=full_name ,
+                    email=email,
+                    password=password_hash,
+                )
+                CandidateProfile.objects.create(
+                    user=user,
+                    full_name=full_name,
+                    agree_terms=True if terms else False,
+                )
+        except IntegrityError:
             messages.error(request, "Email already registered.")
             return redirect("candidate_register")
 
-        # Create user
-        user = User.objects.create(
-            username=email ,
-            first_name=full_name ,
-            email=email,
-            password=make_password(password),
-        )
-
-        # Create candidate profile
-        CandidateProfile.objects.create(
-            user=user,
-            full_name=full_name,
-            agree_terms=True if terms else False,
-        )
-
         # after successful creation:
         messages.success(request, "Registered successfully. Please sign in.")
         return redirect('/candidate/login/')
@@ -75,31 +104,32 @@ def company_register(request):
             messages.error(request, "Passwords do not match.")
             return redirect("company_register")
 
-        # Check if email already exists
-        if User.objects.filter(username=email).exists():
+        # Hash outside the transaction so the write lock is held only for the inserts
+        password_hash = make_password(password)
+
+        # Create user and company profile atomically (see candidate_register)
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    username=email,
+                    email=email,
+                    first_name=company_name, 
+                    password=password_hash,
+                )
+                CompanyProfile.objects.create(
+                    user=user,
+                    company_name=company_name,
+                    industry=industry,
+                    company_size=company_size,
+                    contact_person=contact_person,
+                    phone_number=phone_number,
+                    website=website,
+                    agree_terms=True if terms else False,
+                )
+        except IntegrityError:
             messages.error(request, "Email already registered.")
             return redirect("company_register")
 
-        # Create user
-        user = User.objects.create(
-            username=email,
-            email=email,
-            first_name=company_name, 
-            password=make_password(password),
-        )
-
-        # Create company profile
-        CompanyProfile.objects.create(
-            user=user,
-            company_name=company_name,
-            industry=industry,
-            company_size=company_size,
-            contact_person=contact_person,
-            phone_number=phone_number,
-            website=website,
-            agree_terms=True if terms else False,
-        )
-
         messages.success(request, "Company registered! Please login.")
         return redirect('/company/login/')  # explicit path; preserves existing UI
 
@@ -166,6 +196,7 @@ def landing_page(request):
     context = {
         'student_reviews': student_reviews,
         'company_reviews': company_reviews,
+        'review_stats': ReviewStats.load(),  # precomputed by the moderate_reviews command
         'user_reviewer_type': user_reviewer_type,
     }
     return render(request, "landing.html", context)
@@ -192,17 +223,21 @@ def submit_review(request):
             messages.error(request, 'Please provide a short review text before submitting.')
             return redirect('landing_page')
 
-        # Create review; mark active True so it appears immediately in success stories
+        # Queue the review for moderation; the moderate_reviews command publishes it
+        # in a batch so spam bursts never touch the landing page read path.
         Review.objects.create(
             name=name,
             company=company,
             rating=max(1, min(5, rating)),
             review=review_text,
             reviewer_type=reviewer_type,
-            is_active=True
+            is_active=False,
+            status='PENDING',
+            fingerprint=review_fingerprint(review_text),
+            submitter_ip=request.META.get('REMOTE_ADDR') or None,
         )
         from django.contrib import messages
-        messages.success(request, 'Thank you for your review! It is now shown on the site under Success Stories.')
+        messages.success(request, 'Thank you for your review! It will appear under Success Stories once approved.')
         return redirect('landing_page')
     # Non-POST - redirect to landing
     return redirect('landing_page')
@@ -218,7 +253,24 @@ def common_signup(request):
 def candidate_dashboard(request):
     # Provide active job postings to the candidate dashboard so real jobs are shown
     from .models import JobPosting
-    job_qs = JobPosting.objects.filter(is_active=True).select_related('company').annotate(app_count=Count('applications')).order_by('-posted_date')
+    active_jobs = JobPosting.objects.filter(is_active=True)
+
+    # "Within N km of <place>", resolved against the offline gazetteer
+    query = search_filters(request.GET)
+    near = query.get('near', '')
+    radius = query.get('radius', DEFAULT_RADIUS)
+    near_place = None
+    if near:
+        active_jobs, near_place = filter_near(active_jobs, near, radius)
+
+    # Facet filters (job type, location, salary band, industry); the counts
+    # shown next to each option come from the precomputed summary table
+    # (narrowed by the other selected facets, not by "near").
+    selected = selected_filters(request.GET)
+    job_qs = (
+        filter_jobs(active_jobs, selected).select_related('company')
+        .annotate(app_count=Count('applications')).order_by('-posted_date')
+    )
 
     # Paginate candidate dashboard jobs (10 per page)
     paginator = Paginator(job_qs, 10)
@@ -230,13 +282,97 @@ def candidate_dashboard(request):
     except EmptyPage:
         jobs_page = paginator.page(paginator.num_pages)
 
+    # "My applications": one query with the job and company joined in; the same
+    # rows give the set used to flag already-applied jobs on this page.
+    my_applications = []
+    candidate_profile = CandidateProfile.objects.filter(user=request.user).first()
+    if candidate_profile is not None:
+        my_applications = list(
+            JobApplication.objects.filter(candidate=candidate_profile)
+            .select_related('job__company', 'interview_slot')
+            .order_by('-application_date')
+        )
+    applied_job_ids = {application.job_id for application in my_applications}
+    # Applications to postings that have since been archived (read-only history)
+    archived_applications = []
+    if candidate_profile is not None:
+        archived_applications = list(
+            candidate_profile.archived_applications.select_related('job__company').order_by('-application_date')[:20]
+        )
+    for job in jobs_page:
+        job.has_applied = job.id in applied_job_ids
+
+    # Saved searches and the unread alerts the matcher has batched for them
+    saved_searches = []
+    alerts = []
+    if candidate_profile is not None:
+        saved_searches = list(candidate_profile.saved_searches.all())
+        alerts = list(
+            candidate_profile.job_alerts.filter(is_read=False)
+            .select_related('saved_search')
+            .prefetch_related(Prefetch('jobs', queryset=JobPosting.objects.select_related('company')))[:5]
+        )
+        for search in saved_searches:
+            search.query = urlencode(search.filters)
+
     context = {
         'jobs': jobs_page,  # Page object usable like an iterable in templates
         'paginator': paginator,
         'page_obj': jobs_page,
+        'my_applications': my_applications,
+        'archived_applications': archived_applications,
+        'facets': facet_counts(selected),
+        'selected_filters': query,
+        'filter_query': urlencode(query),
+        'near': near,
+        'radius': radius,
+        'near_place': near_place,
+        'radius_choices': RADIUS_CHOICES,
+        'saved_searches': saved_searches,
+        'alerts': alerts,
+        'can_save_search': (bool(query) and len(saved_searches) < MAX_SAVED_SEARCHES
+                            and all(search.filters != query for search in saved_searches)),
     }
     return render(request, "CandidateDashboard.html", context)
 
+
+@login_required
+def save_search(request):
+    """
+    Save the dashboard's current filters; new matches arrive as alerts.
+    """
+    if request.method != 'POST':
+        return redirect('candidate_dashboard')
+    candidate_profile = get_object_or_404(CandidateProfile, user=request.user)
+    filters = search_filters(request.POST)
+    if not filters:
+        messages.error(request, "Choose at least one filter before saving a search.")
+        return redirect('candidate_dashboard')
+    existing = list(candidate_profile.saved_searches.values_list('filters', flat=True))
+    if filters in existing:
+        messages.info(request, "You have already saved this search.")
+    elif len(existing) >= MAX_SAVED_SEARCHES:
+        messages.error(request, f"You can keep up to {MAX_SAVED_SEARCHES} saved searches.")
+    else:
+        name = request.POST.get('name', '').strip()[:100] or describe(filters)
+        SavedSearch.objects.create(candidate=candidate_profile, name=name, filters=filters)
+        messages.success(request, "Search saved. We'll let you know when new jobs match it.")
+    return redirect(f"{reverse('candidate_dashboard')}?{urlencode(filters)}")
+
+
+@login_required
+def delete_saved_search(request, search_id):
+    if request.method == 'POST':
+        SavedSearch.objects.filter(pk=search_id, candidate__user=request.user).delete()
+    return redirect('candidate_dashboard')
+
+
+@login_required
+def mark_alerts_read(request):
+    if request.method == 'POST':
+        JobAlert.objects.filter(candidate__user=request.user, is_read=False).update(is_read=True)
+    return redirect('candidate_dashboard')
+
 # Candidate Profile (view)
 @login_required
 def candidate_profile(request):
@@ -245,7 +381,8 @@ def candidate_profile(request):
         profile = CandidateProfile.objects.get(user=request.user)
     except CandidateProfile.DoesNotExist:
         profile = None
-    return render(request, "CandidateProfile.html", {"profile": profile})
+    latest_resume = profile.resumes.first() if profile else None
+    return render(request, "CandidateProfile.html", {"profile": profile, "latest_resume": latest_resume})
 
 @login_required
 def candidate_cv(request):
@@ -257,6 +394,11 @@ def candidate_cv(request):
         return redirect('candidate_dashboard')
 
     if request.method == 'POST':
+        key = request_key(request)
+        previous = completed_url(request.user, 'upload-cv', key)
+        if previous:
+            return redirect(previous)
+
         uploaded_file = request.FILES.get('cvFile')
         if not uploaded_file:
             messages.error(request, "Please select a file to upload.")
@@ -277,30 +419,51 @@ def candidate_cv(request):
             messages.error(request, "Invalid file type. Only PDF and DOCX are allowed.")
             return redirect('candidate_cv')
 
-        # Save resume record
-        resume = CandidateResume.objects.create(
-            candidate=candidate_profile,
-            file=uploaded_file,
-            original_filename=getattr(uploaded_file, 'name', ''),
-            content_type=getattr(uploaded_file, 'content_type', ''),
-            file_size=getattr(uploaded_file, 'size', None)
-        )
+        def save_resume():
+            CandidateResume.objects.create(
+                candidate=candidate_profile,
+                file=uploaded_file,
+                original_filename=getattr(uploaded_file, 'name', ''),
+                content_type=getattr(uploaded_file, 'content_type', ''),
+                file_size=getattr(uploaded_file, 'size', None)
+            )
+            remember(request.user, 'upload-cv', key, reverse('candidate_profile'))
+
+        try:
+            retry_on_contention('upload-cv', save_resume)
+        except IntegrityError:
+            # The same form was submitted twice at once and the other copy was saved
+            count('upload-cv', 'duplicates')
+            return redirect('candidate_profile')
+        except OperationalError:
+            messages.error(request, "We are very busy right now and could not save your CV. Please try again in a minute.")
+            return redirect('candidate_cv')
         messages.success(request, "Your CV was uploaded successfully.")
         return redirect('candidate_profile')
 
-    return render(request, "UploadCV.html")
+    return render(request, "UploadCV.html", {'idempotency_key': new_key()})
 # Company Dashboard (login required)
 @login_required
 def company_dashboard(request):
     # Try to load company profile and recent jobs for display on the dashboard
     recent_jobs = []
+    analytics = None
+    jobs_posted = 0
     try:
         company_profile = CompanyProfile.objects.get(user=request.user)
-        recent_jobs = JobPosting.objects.filter(company=company_profile).order_by('-posted_date')[:5]
+        recent_jobs = JobPosting.objects.filter(company=company_profile).select_related('funnel').order_by('-posted_date')[:5]
+        jobs_posted = JobPosting.objects.filter(company=company_profile).count()
+        # Charts read the daily/funnel rollups maintained by `rollup_analytics`
+        analytics = company_analytics(company_profile)
     except CompanyProfile.DoesNotExist:
         company_profile = None
 
-    return render(request, "CompanyDashboard.html", {"recent_jobs": recent_jobs})
+    context = {
+        "recent_jobs": recent_jobs,
+        "jobs_posted": jobs_posted,
+        "analytics": analytics,
+    }
+    return render(request, "CompanyDashboard.html", context)
 
 
 @login_required
@@ -333,12 +496,16 @@ def post_job(request):
                     existing.title = job.title
                     existing.description = job.description
                     existing.location = job.location
+                    existing.is_remote = job.is_remote
                     existing.job_type = job.job_type
                     existing.min_salary = job.min_salary
                     existing.max_salary = job.max_salary
                     existing.requirements = job.requirements
                     existing.application_deadline = job.application_deadline
                     existing.is_active = job.is_active
+                    existing.min_experience_months = job.min_experience_months
+                    existing.min_education_level = job.min_education_level
+                    existing.screen_salary = job.screen_salary
                     existing.save()
                     messages.success(request, f"Job '{existing.title}' updated successfully!")
                     return redirect('company_job_list')
@@ -412,7 +579,10 @@ def job_detail(request, pk):
     Displays the details of a specific job posting.
     Accessible by both candidates (to apply) and companies (to review).
     """
-    job = get_object_or_404(JobPosting, pk=pk)
+    # Served from the snapshot cache (job plus company), see home/cache.py
+    job = get_job_snapshot(pk)
+    if job is None:
+        raise Http404("No JobPosting matches the given query.")
     
     # Determine user role
     is_candidate = CandidateProfile.objects.filter(user=request.user).exists()
@@ -458,25 +628,27 @@ def apply_for_job(request, job_id):
 
     # Handle form submission
     if request.method == 'POST':
+        # A resent form (double-click, reload, client retry) replays the first outcome
+        key = request_key(request)
+        previous = completed_url(request.user, 'apply', key)
+        if previous:
+            return redirect(previous)
+
         full_name = request.POST.get('full_name', '')
         email = request.POST.get('email', '')
         phone = request.POST.get('phone', '')
-        dob = request.POST.get('dob', None)
+        dob = request.POST.get('dob') or None
         education = request.POST.get('education', '')
         experience = request.POST.get('experience', '')
-        expected_salary = request.POST.get('expected_salary', '')
+        expected_salary = request.POST.get('expected_salary') or None
         skills = request.POST.get('skills', '')
         portfolio = request.POST.get('portfolio', '')
         cover_letter = request.POST.get('cover_letter', '')
 
         resume = request.FILES.get('resume', None)  # Handle uploaded file
 
-        try:
-            # Prevent duplicate applications
-            if JobApplication.objects.filter(job=job, candidate=candidate_profile).exists():
-                messages.warning(request, f"You have already applied for '{job.title}'.")
-                return redirect('job_detail', pk=job_id)
-
+        def submit():
+            # One INSERT; the (job, candidate) unique constraint rejects a second application
             JobApplication.objects.create(
                 job=job,
                 candidate=candidate_profile,
@@ -492,19 +664,30 @@ def apply_for_job(request, job_id):
                 cover_letter=cover_letter,
                 resume=resume
             )
+            remember(request.user, 'apply', key, reverse('candidate_dashboard'))
 
-            messages.success(request, f"Successfully applied for '{job.title}'!")
-            return redirect('candidate_dashboard')
-
+        try:
+            retry_on_contention('apply', submit)
         except IntegrityError:
+            count('apply', 'duplicates')
+            # A concurrent copy of this same submission may have won the race
+            previous = completed_url(request.user, 'apply', key)
+            if previous:
+                return redirect(previous)
             messages.warning(request, f"You have already applied for '{job.title}'.")
             return redirect('job_detail', pk=job_id)
-        except Exception as e:
-            messages.error(request, f"An error occurred: {e}")
+        except ValidationError:
+            messages.error(request, "Please check the date of birth and expected salary and try again.")
+            return redirect('apply_job', job_id=job_id)
+        except OperationalError:
+            messages.error(request, "We are very busy right now and could not save your application. Please try again in a minute.")
             return redirect('job_detail', pk=job_id)
 
+        messages.success(request, f"Successfully applied for '{job.title}'!")
+        return redirect('candidate_dashboard')
+
     # If GET → show the form
-    return render(request, 'ApplyJob.html', {'job': job})
+    return render(request, 'ApplyJob.html', {'job': job, 'idempotency_key': new_key()})
 
 @login_required
 def view_applicants(request, job_id):
@@ -519,14 +702,45 @@ def view_applicants(request, job_id):
         return redirect('home')
 
     job = get_object_or_404(JobPosting, id=job_id, company=company_profile)
-    applicants = JobApplication.objects.filter(job=job).select_related('candidate')
+    applications = JobApplication.objects.filter(job=job)
+    # Knockout screening and parsed fields (home.screening), each backed by a (job, ...) index
+    screening = request.GET.get('screening', '')
+    min_years = request.GET.get('min_experience', '').strip()
+    min_education = request.GET.get('education', '')
+    applicants = applications
+    if screening == 'passed':
+        applicants = applicants.filter(screening_flags=0)
+    elif screening == 'flagged':
+        applicants = applicants.filter(screening_flags__gt=0)
+    if min_years:
+        try:
+            months = float(min_years) * 12
+            if not math.isfinite(months) or months < 0:
+                raise ValueError(min_years)
+            applicants = applicants.filter(experience_months__gte=round(months))
+        except (ValueError, OverflowError):
+            min_years = ''
+    if min_education.isdigit():
+        applicants = applicants.filter(education_level__gte=int(min_education))
+    counts = applications.aggregate(
+        total=Count('id'), flagged=Count('id', filter=Q(screening_flags__gt=0)),
+    )
+    counts['passed'] = counts['total'] - counts['flagged']
+    applicants = applicants.select_related('candidate', 'interview_slot')
+    # Inline resume previews for triage without downloading each file
+    applicants = attach_previews(list(applicants), 'resume')
+    for application in applicants:
+        application.job = job  # screening_failures reads the rules off the posting
 
     context = {
         'company': company_profile,
         'job': job,
         'applicants': applicants,
+        'screening_counts': counts,
+        'education_levels': EDUCATION_LEVELS,
+        'filters': {'screening': screening, 'min_experience': min_years, 'education': min_education},
     }
-    return render(request, 'view_applicants.html', context)
+    return render(request, 'view_applications.html', context)
 
 @login_required
 def application_detail(request, application_id):
@@ -546,8 +760,237 @@ def application_detail(request, application_id):
         job__company=company_profile
     )
 
+    attach_previews([application], 'resume')
+
     context = {
         'application': application,
         'job': application.job,
     }
     return render(request, 'application_detail.html', context)
+
+
+@login_required
+def interview_slots(request, job_id):
+    """
+    A job's interview slots, and bulk generation of new ones for its
+    shortlisted applicants.
+    """
+    job = get_object_or_404(JobPosting, id=job_id, company__user=request.user)
+    if request.method == 'POST':
+        form = InterviewSlotForm(request.POST)
+        if form.is_valid():
+            data = form.cleaned_data
+            created = generate_slots(job, data['day'], data['start_time'], data['end_time'], data['duration'],
+                                     data['gap'], data['interviewer'], data['count'])
+            if created:
+                messages.success(request, f"Added {len(created)} interview slot(s).")
+            else:
+                messages.info(request, "No slots added: the window is full, already past, or every shortlisted applicant has a slot.")
+            return redirect('interview_slots', job_id=job.id)
+    else:
+        form = InterviewSlotForm()
+
+    context = {
+        'job': job,
+        'form': form,
+        'slots': job.interview_slots.filter(end__gt=timezone.now()).select_related('application'),
+        'waiting': shortlisted_without_slot(job).count(),
+    }
+    return render(request, 'interview_slots.html', context)
+
+
+@login_required
+def delete_interview_slot(request, slot_id):
+    slot = get_object_or_404(InterviewSlot, pk=slot_id, company__user=request.user)
+    if request.method == 'POST':
+        if slot.is_booked:
+            messages.error(request, "A booked slot cannot be removed.")
+        else:
+            slot.delete()
+    return redirect('interview_slots', job_id=slot.job_id)
+
+
+@login_required
+def book_interview(request, application_id):
+    """
+    Let a shortlisted candidate pick (or change) their interview time.
+    """
+    application = get_object_or_404(
+        JobApplication.objects.select_related('job__company'),
+        pk=application_id, candidate__user=request.user,
+    )
+    if application.status != SHORTLISTED:
+        messages.error(request, "Interviews can only be booked once the company shortlists your application.")
+        return redirect('candidate_dashboard')
+    if request.method == 'POST':
+        slot_id = request.POST.get('slot_id', '')
+        try:
+            if not slot_id.isdigit():
+                raise SlotUnavailable("Choose an interview time.")
+            slot = book_slot(application, int(slot_id))
+        except SlotUnavailable as exc:
+            messages.error(request, str(exc))
+            return redirect('book_interview', application_id=application.id)
+        messages.success(request, f"Interview booked for {slot.start:%b %d, %Y %H:%M}.")
+        return redirect('candidate_dashboard')
+
+    context = {
+        'application': application,
+        'job': application.job,
+        'booked': InterviewSlot.objects.filter(application=application).first(),
+        'slots': open_slots(application),
+    }
+    return render(request, 'book_interview.html', context)
+
+
+@login_required
+def cancel_interview(request, application_id):
+    application = get_object_or_404(JobApplication, pk=application_id, candidate__user=request.user)
+    if request.method == 'POST' and cancel_booking(application):
+        messages.success(request, "Your interview booking was cancelled.")
+    return redirect('candidate_dashboard')
+
+
+@login_required
+def download_candidate_resume(request, resume_id):
+    """
+    Stream a CandidateResume to its owner, or to a company only when this
+    very file is attached to an application for one of its jobs (companies
+    normally use download_application_resume). The file itself is handed
+    off by home.media.
+    """
+    resume = get_object_or_404(CandidateResume.objects.select_related('candidate'), pk=resume_id)
+    allowed = resume.candidate.user_id == request.user.id or JobApplication.objects.filter(
+        candidate=resume.candidate, job__company__user=request.user, resume=resume.file.name,
+    ).exists()
+    if not allowed:
+        raise Http404("No CandidateResume matches the given query.")
+    return protected_file_response(request, resume.file, filename=resume.original_filename or None)
+
+
+@login_required
+def download_application_resume(request, application_id):
+    """
+    Stream the resume attached to a JobApplication. Only the applicant and
+    the company that owns the job can reach it.
+    """
+    application = get_object_or_404(
+        JobApplication.objects.filter(
+            Q(candidate__user=request.user) | Q(job__company__user=request.user)
+        ),
+        pk=application_id,
+    )
+    return protected_file_response(request, application.resume)
+
+
+@login_required
+def application_resume_preview(request, application_id):
+    """
+    First-page thumbnail of an application's resume (same access rules as
+    download_application_resume). Rendered by `generate_previews`.
+    """
+    application = get_object_or_404(
+        JobApplication.objects.filter(
+            Q(candidate__user=request.user) | Q(job__company__user=request.user)
+        ),
+        pk=application_id,
+    )
+    preview = ResumePreview.objects.filter(source_name=application.resume.name).exclude(thumbnail='').first()
+    if not application.resume or preview is None:
+        raise Http404("No preview available.")
+    path = os.path.join(settings.MEDIA_ROOT, preview.thumbnail)
+    return protected_path_response(request, path, preview.thumbnail)
+
+
+@login_required
+def company_archived_jobs(request):
+    """
+    Read-only list of the company's archived (closed and aged-out) postings.
+    """
+    company_profile = get_object_or_404(CompanyProfile, user=request.user)
+    paginator = Paginator(ArchivedJobPosting.objects.filter(company=company_profile), 20)
+    page = request.GET.get('page', 1)
+    try:
+        jobs_page = paginator.page(page)
+    except PageNotAnInteger:
+        jobs_page = paginator.page(1)
+    except EmptyPage:
+        jobs_page = paginator.page(paginator.num_pages)
+    context = {
+        'company_name': company_profile.company_name,
+        'jobs': jobs_page,
+        'page_obj': jobs_page,
+    }
+    return render(request, 'archived_jobs.html', context)
+
+
+@login_required
+def archived_job_applicants(request, job_id):
+    """
+    Read-only applicant list of an archived posting, for its company.
+    """
+    job = get_object_or_404(ArchivedJobPosting, id=job_id, company__user=request.user)
+    applicants = job.applications.all()
+    return render(request, 'archived_applications.html', {'job': job, 'applicants': applicants})
+
+
+@login_required
+def download_archived_application_resume(request, application_id):
+    """
+    Same access rule as download_application_resume, for archived applications.
+    """
+    application = get_object_or_404(
+        ArchivedJobApplication.objects.filter(
+            Q(candidate__user=request.user) | Q(job__company__user=request.user)
+        ),
+        pk=application_id,
+    )
+    return protected_file_response(request, application.resume)
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events stream of the user's live updates (home.events),
+    replacing page refreshes on the dashboards and applicant list.
+    """
+    user = await request.auser()
+    # Under WSGI the stream would be buffered forever; 204 stops EventSource retrying
+    if not user.is_authenticated or not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    channels = await sync_to_async(channels_for_user)(user)
+    if not channels:
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(sse_messages(channels), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: pass events through unbuffered
+    return response
+
+
+def autocomplete(request):
+    """
+    Typeahead suggestions for the job search box, answered from the
+    in-memory prefix index (home.autocomplete). `kind` narrows them to
+    titles, companies or skills.
+    """
+    start = time.perf_counter()
+    query = request.GET.get('q', '')[:100]
+    kinds = tuple(kind for kind in request.GET.get('kind', '').split(',') if kind in KINDS) or KINDS
+    results = get_index().search(query, kinds, LIMIT)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    response = JsonResponse({
+        'query': query,
+        'results': [{'label': label, 'kind': kind, 'count': count} for kind, label, count in results],
+    })
+    response['Cache-Control'] = 'private, max-age=60'
+    response['Server-Timing'] = f'autocomplete;dur={elapsed_ms:.3f}'
+    return response
+
+
+def serve_feed_file(request, path):
+    """
+    Serve a generated sitemap/feed file from FEEDS_ROOT. A front server
+    normally answers these URLs itself (see home/feeds.py).
+    """
+    response = static_serve(request, path, document_root=settings.FEEDS_ROOT)
+    response['Cache-Control'] = 'public, max-age=3600'
+    return response
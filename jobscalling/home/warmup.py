@@ -0,0 +1,179 @@
+"""
+Worker warm-up: pay import, URL, template and database start-up costs
+before the first request instead of during it.
+
+`wsgi.py`/`asgi.py` call `warm_up()` right after building the application,
+unless DEBUG is on (DJANGO_WARMUP=1/0 forces it either way). Under a
+pre-forking server that loads the app in the master (gunicorn --preload),
+that happens once before the fork and every worker inherits the imported modules, compiled URL patterns and
+parsed templates (with the prod profile's cached loader). Database
+connections are opened to check the database and warm per-process caches,
+then closed again, because a socket must not be shared by forked workers;
+each worker reconnects through `connect_databases()`, e.g. in gunicorn.conf.py:
+
+    def post_fork(server, worker):
+        from home.warmup import connect_databases
+        connect_databases()
+
+`manage.py benchmark_startup` measures the effect.
+"""
+import asyncio
+import importlib
+import logging
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist, engines
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+HOT_TEMPLATES = [
+    'landing.html',
+    'CandidateDashboard.html',
+    'CompanyDashboard.html',
+    'JobDetail.html',
+    'CandidateLogin.html',
+    'CompanyLogin.html',
+]
+# App submodules imported lazily by URLconf, admin or signals on first use
+APP_MODULES = ['views', 'admin', 'forms', 'middleware']
+
+
+def import_app_modules():
+    for app_config in apps.get_app_configs():
+        for name in APP_MODULES:
+            try:
+                importlib.import_module(f'{app_config.name}.{name}')
+            except ModuleNotFoundError as exc:
+                if exc.name != f'{app_config.name}.{name}':
+                    raise
+
+
+def _compile_patterns(patterns):
+    count = 0
+    for pattern in patterns:
+        pattern.pattern.regex  # compiled lazily on first access
+        count += 1
+        if isinstance(pattern, URLResolver):
+            count += _compile_patterns(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            pattern.lookup_str
+    return count
+
+
+def resolve_urls():
+    """
+    Import the URLconf (and so every view module), compile each pattern
+    and build the reverse() lookup tables.
+    """
+    resolver = get_resolver()
+    count = _compile_patterns(resolver.url_patterns)
+    reverse('landing_page')
+    return count
+
+
+def compile_templates(names=None):
+    """
+    Load the hot templates through every engine. With the cached loader the
+    parsed Template objects stay in memory for the life of the process.
+    """
+    loaded = 0
+    for engine in engines.all():
+        for name in names or HOT_TEMPLATES:
+            try:
+                engine.get_template(name)
+                loaded += 1
+            except TemplateDoesNotExist:
+                logger.warning("warm-up: template %s not found", name)
+    return loaded
+
+
+def connect_databases():
+    """
+    Open (and health-check) a connection per database alias; call this in
+    each worker after the fork.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def warm_database():
+    """
+    Check the database and fill per-process caches that read from it, then
+    close every connection so none is inherited across a fork.
+    """
+    try:
+        connect_databases()
+        # ContentType rows are read by admin and permission checks on first use
+        if apps.is_installed('django.contrib.contenttypes'):
+            from django.contrib.contenttypes.models import ContentType
+
+            ContentType.objects.get_for_models(*apps.get_models())
+        # Typeahead prefix index; built once here, workers inherit it across the fork
+        from .autocomplete import get_index
+
+        get_index()
+    finally:
+        connections.close_all()
+
+
+def load_static_manifest():
+    # Read the staticfiles manifest now rather than on the first {% static %}
+    if apps.is_installed('django.contrib.staticfiles') and not settings.DEBUG:
+        from django.contrib.staticfiles.storage import staticfiles_storage
+
+        getattr(staticfiles_storage, 'hashed_files', None)
+
+
+def _in_event_loop():
+    # ASGI servers may import the app inside their loop, where sync DB access is refused
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def warm_up_enabled():
+    """
+    DJANGO_WARMUP=1/0 if set; otherwise on unless DEBUG, where the
+    autoreloader would pay for it again on every code change.
+    """
+    flag = os.environ.get('DJANGO_WARMUP')
+    if flag is not None:
+        return flag == '1'
+    return not settings.DEBUG
+
+
+def warm_up(templates=None, connect_db=True):
+    """
+    Run every warm-up step, logging how long each took. A failing step is
+    logged and skipped: warm-up must never stop the server from starting.
+    Returns {step: seconds}.
+    """
+    steps = [
+        ('imports', import_app_modules),
+        ('urls', resolve_urls),
+        ('static manifest', load_static_manifest),
+        ('templates', lambda: compile_templates(templates)),
+    ]
+    if connect_db and not _in_event_loop():
+        steps.append(('database', warm_database))
+
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.exception("warm-up step %s failed", name)
+        timings[name] = time.perf_counter() - start
+    logger.info("warm-up done: %s", ', '.join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in timings.items()))
+    return timings
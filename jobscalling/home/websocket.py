@@ -0,0 +1,91 @@
+"""
+WebSocket transport for `home.events`, for clients that prefer it to SSE.
+
+Django does not handle WebSocket scopes, so `route_websockets()` wraps the
+ASGI application (see jobscalling/asgi.py): connections to WEBSOCKET_PATH
+get this handler and everything else goes to Django. The socket is
+receive-only from the client's point of view. Each message is the JSON
+{"event": ..., "data": ...} that SSE clients receive as separate fields.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.http import parse_cookie
+from django.http.request import split_domain_port, validate_host
+from django.utils.module_loading import import_string
+
+from .events import broker, channels_for_user
+
+WEBSOCKET_PATH = '/events/ws/'
+
+
+def _headers(scope):
+    return {name.decode('latin-1'): value.decode('latin-1') for name, value in scope.get('headers', [])}
+
+
+def _origin_allowed(headers):
+    # Browsers always send Origin; refusing foreign ones stops cross-site
+    # pages from opening a socket with the visitor's session cookie.
+    origin = headers.get('origin')
+    if not origin:
+        return True
+    host, _port = split_domain_port(urlsplit(origin).netloc)
+    allowed = settings.ALLOWED_HOSTS or (['.localhost', '127.0.0.1', '[::1]'] if settings.DEBUG else [])
+    return bool(host) and validate_host(host, allowed)
+
+
+def _session_user(headers):
+    cookies = parse_cookie(headers.get('cookie', ''))
+    store = import_string(settings.SESSION_ENGINE + '.SessionStore')
+    return get_user(SimpleNamespace(session=store(cookies.get(settings.SESSION_COOKIE_NAME))))
+
+
+async def websocket_events(scope, receive, send):
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    headers = _headers(scope)
+    channels = []
+    if _origin_allowed(headers):
+        user = await sync_to_async(_session_user)(headers)
+        if user.is_authenticated:
+            channels = await sync_to_async(channels_for_user)(user)
+    if not channels:
+        # Closing before accepting makes the server answer 403
+        await send({'type': 'websocket.close', 'code': 4403})
+        return
+
+    await send({'type': 'websocket.accept'})
+    async with broker().subscribe(channels) as queue:
+        incoming = asyncio.ensure_future(receive())
+        outgoing = asyncio.ensure_future(queue.get())
+        try:
+            while True:
+                done, _pending = await asyncio.wait({incoming, outgoing}, return_when=asyncio.FIRST_COMPLETED)
+                if incoming in done:
+                    if incoming.result()['type'] == 'websocket.disconnect':
+                        break
+                    incoming = asyncio.ensure_future(receive())  # client messages are ignored
+                if outgoing in done:
+                    await send({'type': 'websocket.send', 'text': json.dumps(outgoing.result())})
+                    outgoing = asyncio.ensure_future(queue.get())
+        finally:
+            incoming.cancel()
+            outgoing.cancel()
+
+
+def route_websockets(django_application):
+    async def application(scope, receive, send):
+        if scope['type'] == 'websocket':
+            if scope['path'] == WEBSOCKET_PATH:
+                return await websocket_events(scope, receive, send)
+            await receive()
+            return await send({'type': 'websocket.close', 'code': 4404})
+        return await django_application(scope, receive, send)
+
+    return application
@@ -13,4 +13,16 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobscalling.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# WebSocket connections to /events/ws/ get live updates; everything else is Django
+from home.websocket import route_websockets  # noqa: E402
+
+application = route_websockets(django_application)
+
+# Import views, compile URL patterns and hot templates and check the database
+# now, before the fork under a preloading server (see home/warmup.py)
+from home.warmup import warm_up, warm_up_enabled  # noqa: E402
+
+if warm_up_enabled():
+    warm_up()
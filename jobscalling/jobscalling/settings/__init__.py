@@ -0,0 +1,23 @@
+"""
+Settings package. DJANGO_ENV picks the profile loaded by
+DJANGO_SETTINGS_MODULE=jobscalling.settings:
+
+    DJANGO_ENV=dev  (default)  local development, DEBUG on
+    DJANGO_ENV=prod            cached templates, persistent DB connections,
+                               shared cache, structured logging
+
+A profile can also be named directly, e.g.
+DJANGO_SETTINGS_MODULE=jobscalling.settings.prod.
+"""
+import os
+
+DJANGO_ENV = os.environ.get('DJANGO_ENV', 'dev')
+
+if DJANGO_ENV == 'prod':
+    from .prod import *  # noqa: F401,F403
+elif DJANGO_ENV == 'dev':
+    from .dev import *  # noqa: F401,F403
+else:
+    from django.core.exceptions import ImproperlyConfigured
+
+    raise ImproperlyConfigured(f"Unknown DJANGO_ENV {DJANGO_ENV!r}; expected 'dev' or 'prod'.")
@@ -0,0 +1,258 @@
+"""
+Settings shared by every profile; `dev` and `prod` build on this module.
+
+Generated by 'django-admin startproject' using Django 5.1.2.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.1/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.1/ref/settings/
+"""
+
+import os
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# SECRET_KEY, DEBUG and ALLOWED_HOSTS are set by the profile (dev.py / prod.py)
+# See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
+DEBUG = False
+
+ALLOWED_HOSTS = []
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'django.contrib.humanize',
+    'home'
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'home.middleware.StaticFilesMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'home.middleware.ProfilingMiddleware',
+]
+
+ROOT_URLCONF = 'jobscalling.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'jobscalling.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Take the write lock at BEGIN and wait for it: a deferred transaction
+            # that reads first and then writes fails at once instead of waiting
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 10,
+        },
+    }
+}
+
+
+# Cache (process-local by default; also backs the cached_db session engine)
+# 'default' is the shared L2 (point it at Redis/Memcached when running more
+# than one process); 'local' is always an in-process L1.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'jobscalling-default',
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'jobscalling-local',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+# Job detail snapshot cache (home/cache.py); TTLs in seconds
+JOB_CACHE = {
+    'L1_ALIAS': 'local',
+    'L2_ALIAS': 'default',
+    'L1_TTL': 5,
+    'L2_TTL': 300,
+    'LOCK_TTL': 10,
+    'LOCK_WAIT': 1.0,
+}
+
+
+# Sessions and messages
+# SESSION_BACKEND selects where session data lives:
+#   'db'             - a session-table read on every authenticated request
+#   'cached_db'      - read through the cache, write-through to the database
+#   'signed_cookies' - no server-side storage at all
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'cached_db')
+
+SESSION_ENGINE = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}[SESSION_BACKEND]
+
+# Flash messages travel in a cookie so messages.success()/error() never write the session
+MESSAGE_STORAGE = os.environ.get('MESSAGE_STORAGE', 'django.contrib.messages.storage.cookie.CookieStorage')
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+# Password hashing policy: 'pbkdf2' (default), 'scrypt' or 'argon2' (needs argon2-cffi).
+# Stored hashes are upgraded to the preferred hasher on the next successful login.
+PASSWORD_HASHER_POLICY = os.environ.get('PASSWORD_HASHER_POLICY', 'pbkdf2')
+
+_PASSWORD_HASHER_PATHS = {
+    'pbkdf2': 'home.hashers.TunedPBKDF2PasswordHasher',
+    'scrypt': 'home.hashers.TunedScryptPasswordHasher',
+    'argon2': 'home.hashers.TunedArgon2PasswordHasher',
+}
+
+PASSWORD_HASHERS = [_PASSWORD_HASHER_PATHS[PASSWORD_HASHER_POLICY]] + [
+    path for name, path in _PASSWORD_HASHER_PATHS.items() if name != PASSWORD_HASHER_POLICY
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+# Work factors (unset = Django defaults). Benchmark with `manage.py benchmark_hashers`.
+if os.environ.get('PASSWORD_PBKDF2_ITERATIONS'):
+    PASSWORD_PBKDF2_ITERATIONS = int(os.environ['PASSWORD_PBKDF2_ITERATIONS'])
+if os.environ.get('PASSWORD_SCRYPT_WORK_FACTOR'):
+    PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ['PASSWORD_SCRYPT_WORK_FACTOR'])
+if os.environ.get('PASSWORD_ARGON2_TIME_COST'):
+    PASSWORD_ARGON2_TIME_COST = int(os.environ['PASSWORD_ARGON2_TIME_COST'])
+if os.environ.get('PASSWORD_ARGON2_MEMORY_COST'):
+    PASSWORD_ARGON2_MEMORY_COST = int(os.environ['PASSWORD_ARGON2_MEMORY_COST'])  # KiB
+if os.environ.get('PASSWORD_ARGON2_PARALLELISM'):
+    PASSWORD_ARGON2_PARALLELISM = int(os.environ['PASSWORD_ARGON2_PARALLELISM'])
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.1/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.1/howto/static-files/
+
+STATIC_URL = 'static/'
+
+# Tell Django where to find your static folder
+STATICFILES_DIRS = [
+    BASE_DIR / "static",
+]
+
+# `manage.py collectstatic` writes hashed names plus .gz/.br variants here
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'home.storage.CompressedManifestStaticFilesStorage',
+    },
+    # Resumes: hash-sharded, content-addressed, atomic writes (see home/storage.py)
+    'resumes': {
+        'BACKEND': 'home.storage.ShardedContentStorage',
+    },
+}
+
+# In-process static serving (home.middleware.StaticFilesMiddleware) for
+# single-box deployments; hashed files are cached for a year. On by default
+# in prod, off in dev (runserver serves static files itself).
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '1') == '1'
+STATIC_MAX_AGE = 60
+# Media files (user uploads)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# How protected media (resumes) leaves the server, see home/media.py:
+# 'x-accel' (nginx), 'x-sendfile' (Apache/lighttpd) or 'django' (fallback)
+MEDIA_SERVE_METHOD = os.environ.get('MEDIA_SERVE_METHOD', 'django')
+# nginx `internal` location aliased to MEDIA_ROOT, used with 'x-accel'
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# Sitemaps and job feeds are written here by `manage.py build_feeds` and
+# served as plain files (see home/feeds.py); SITE_URL makes links absolute.
+FEEDS_ROOT = BASE_DIR / 'feeds'
+SITE_URL = os.environ.get('SITE_URL', 'http://localhost:8000')
+
+# Closed postings older than this many days are moved to the archive tables
+# by `manage.py archive_jobs` (see home/archive.py)
+ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', 365))
+
+# Pub/sub behind the live update streams (see home/events.py). LocalBroker
+# only reaches subscribers in the same process; prod switches to Redis.
+LIVE_EVENTS = {
+    'BACKEND': 'home.events.LocalBroker',
+}
+
+# Slow-query capture and staff-only request profiling (see home/profiling.py).
+# Statements slower than SLOW_QUERY_MS are stored with their plan; 0 turns
+# capture off. Staff profile a request with ?_profile=1 or ?_profile=sample.
+PROFILING = {
+    'SLOW_QUERY_MS': int(os.environ.get('SLOW_QUERY_MS', 200)),
+    'SAMPLE_INTERVAL_MS': 5,
+}
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
+
+LOGIN_URL = '/candidate/login/'
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
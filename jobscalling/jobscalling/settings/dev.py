@@ -0,0 +1,18 @@
+"""
+Development profile: DEBUG on, templates re-read when they change, and a
+throwaway secret key.
+"""
+from .base import *  # noqa: F401,F403
+from .base import os
+
+# SECURITY WARNING: this key is only for local development
+SECRET_KEY = os.environ.get(
+    'SECRET_KEY', 'django-insecure-0@$v&(&h!beeohtj-#k@e2j@$%#w$p-ipe@(s=4o%7(_(^c83o'
+)
+
+DEBUG = True
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1', '[::1]']
+
+# runserver serves static files itself
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '0') == '1'
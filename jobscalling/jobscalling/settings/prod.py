@@ -0,0 +1,128 @@
+"""
+Production profile. Configured from the environment:
+
+    SECRET_KEY            required
+    ALLOWED_HOSTS         comma-separated host names
+    DB_ENGINE, DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT
+                          database (defaults to the SQLite file)
+    DB_CONN_MAX_AGE       seconds to keep DB connections open (default 60)
+    REDIS_URL             shared cache and live-update broker; without it a
+                          file-based cache under CACHE_DIR is shared by the
+                          processes on one host and live updates stay in-process
+    LOG_LEVEL             root log level (default INFO)
+    MEDIA_SERVE_METHOD    'x-accel' (nginx, default) or 'x-sendfile'
+                          (Apache/lighttpd); the front server sends resume
+                          downloads, see home/media.py
+"""
+import copy
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR, CACHES, DATABASES, TEMPLATES, os
+
+# Copies, so adjusting them here never changes what base/dev see
+TEMPLATES = copy.deepcopy(TEMPLATES)
+DATABASES = copy.deepcopy(DATABASES)
+CACHES = copy.deepcopy(CACHES)
+
+DEBUG = False
+
+SECRET_KEY = os.environ.get('SECRET_KEY', '')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("SECRET_KEY must be set when DJANGO_ENV=prod.")
+
+ALLOWED_HOSTS = [host.strip() for host in os.environ.get('ALLOWED_HOSTS', '').split(',') if host.strip()]
+
+
+# Templates: parse each template once per process instead of on every render
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+TEMPLATES[0]['OPTIONS']['context_processors'] = [
+    processor for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+    if processor != 'django.template.context_processors.debug'
+]
+
+
+# Database: reuse connections across requests instead of reconnecting each time
+if os.environ.get('DB_ENGINE'):
+    DATABASES['default'] = {
+        'ENGINE': os.environ['DB_ENGINE'],
+        'NAME': os.environ.get('DB_NAME', ''),
+        'USER': os.environ.get('DB_USER', ''),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', ''),
+        'PORT': os.environ.get('DB_PORT', ''),
+    }
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+
+# Cache: 'default' is the shared L2 for job snapshots and cached_db sessions
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+        'KEY_PREFIX': 'jobscalling',
+    }
+    # Live updates must reach subscribers held by every worker process
+    LIVE_EVENTS = {
+        'BACKEND': 'home.events.RedisBroker',
+        'OPTIONS': {'URL': os.environ['REDIS_URL']},
+    }
+else:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    }
+
+
+# Protected media: the worker checks permissions and the front server sends
+# the bytes. The 'django' fallback would tie up a worker for every download.
+MEDIA_SERVE_METHOD = os.environ.get('MEDIA_SERVE_METHOD', 'x-accel')
+if MEDIA_SERVE_METHOD not in ('x-accel', 'x-sendfile'):
+    raise ImproperlyConfigured(
+        "MEDIA_SERVE_METHOD must be 'x-accel' (nginx) or 'x-sendfile' (Apache/lighttpd) when DJANGO_ENV=prod, "
+        f"not {MEDIA_SERVE_METHOD!r}."
+    )
+
+
+# Cookies only over HTTPS unless explicitly disabled (e.g. behind a TLS-terminating proxy on plain HTTP)
+SESSION_COOKIE_SECURE = CSRF_COOKIE_SECURE = os.environ.get('SECURE_COOKIES', '1') == '1'
+
+
+# Logging: one line per record to stderr for the process manager to collect;
+# request errors and slow-path warnings surface, per-query SQL logging does not.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'line': {
+            'format': '%(asctime)s %(levelname)s %(process)d %(name)s: %(message)s',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'line',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': LOG_LEVEL,
+    },
+    'loggers': {
+        'django.request': {'level': 'WARNING'},
+        'django.security': {'level': 'WARNING'},
+        'django.db.backends': {'level': 'WARNING'},
+        'django.template': {'level': 'WARNING'},
+    },
+}
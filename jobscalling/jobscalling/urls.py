@@ -16,13 +16,10 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include   
-from django.conf import settings
-from django.conf.urls.static import static
 
+# Uploaded media (resumes) is intentionally not routed here: files are only
+# reachable through the permission-checked download views in home.urls.
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('home.urls'))
 ]
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
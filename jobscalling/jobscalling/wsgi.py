@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobscalling.settings')
 
 application = get_wsgi_application()
+
+# Import views, compile URL patterns and hot templates and check the database
+# now, before the fork under a preloading server (see home/warmup.py)
+from home.warmup import warm_up, warm_up_enabled  # noqa: E402
+
+if warm_up_enabled():
+    warm_up()
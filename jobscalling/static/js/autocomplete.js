@@ -0,0 +1,42 @@
+// Typeahead for inputs carrying data-autocomplete-url (home/autocomplete.py).
+// Suggestions fill the input's <datalist>; picking one fires "input" as usual,
+// so page filters listening on the box keep working.
+(function () {
+  document.querySelectorAll("input[data-autocomplete-url]").forEach(function (input) {
+    const list = input.list;
+    if (!list || !window.fetch) return;
+
+    const kindLabels = { title: "Job title", company: "Company", skill: "Skill" };
+    let timer = null;
+    let pending = null;
+    let lastQuery = "";
+
+    function render(results) {
+      list.replaceChildren(...results.map(function (item) {
+        const option = document.createElement("option");
+        option.value = item.label;
+        option.label = `${kindLabels[item.kind] || item.kind} · ${item.count}`;
+        return option;
+      }));
+    }
+
+    function lookup() {
+      const query = input.value.trim();
+      if (query === lastQuery) return;
+      lastQuery = query;
+      if (pending) pending.abort();
+      if (!query) return render([]);
+      pending = new AbortController();
+      const url = `${input.dataset.autocompleteUrl}?q=${encodeURIComponent(query)}`;
+      fetch(url, { signal: pending.signal, headers: { Accept: "application/json" } })
+        .then(function (response) { return response.ok ? response.json() : { results: [] }; })
+        .then(function (data) { if (data.query.trim() === input.value.trim()) render(data.results); })
+        .catch(function () {});  // aborted by a newer keystroke or offline
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(lookup, 120);
+    });
+  });
+})();
@@ -0,0 +1,136 @@
+// Keyword filter over the jobs on this page (facets are filtered server-side)
+function filterJobs() {
+  const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+
+  const jobCards = document.querySelectorAll('.job-card');
+  let visibleCount = 0;
+
+  jobCards.forEach(card => {
+    const keywords = (card.getAttribute('data-keywords') || '').toLowerCase();
+
+    const matchesSearch = !searchTerm || keywords.includes(searchTerm);
+
+    if (matchesSearch) {
+      card.style.display = 'block';
+      visibleCount++;
+    } else {
+      card.style.display = 'none';
+    }
+  });
+
+  // Update jobs count
+  document.getElementById('jobsCount').innerHTML = `Showing <strong>${visibleCount}</strong> jobs available`;
+
+  // Show/hide no jobs message
+  const noJobsMessage = document.getElementById('noJobsMessage');
+  if (visibleCount === 0) {
+    noJobsMessage.style.display = 'block';
+  } else {
+    noJobsMessage.style.display = 'none';
+  }
+}
+
+// Apply for job functionality
+function applyJob(jobTitle) {
+  // Show success message
+  const toast = document.createElement('div');
+  toast.className = 'toast align-items-center text-white bg-success border-0 position-fixed';
+  toast.style.cssText = 'top: 20px; right: 20px; z-index: 9999;';
+  toast.innerHTML = `
+    <div class="d-flex">
+      <div class="toast-body">
+        <i class="bi bi-check-circle me-2"></i>
+        Successfully applied for ${jobTitle}!
+      </div>
+      <button type="button" class="btn-close btn-close-white me-2 m-auto" data-bs-dismiss="toast"></button>
+    </div>
+  `;
+
+  document.body.appendChild(toast);
+  const bsToast = new bootstrap.Toast(toast);
+  bsToast.show();
+
+  // Remove toast after it's hidden
+  toast.addEventListener('hidden.bs.toast', () => {
+    document.body.removeChild(toast);
+  });
+}
+
+// Save job functionality
+function saveJob(button) {
+  const icon = button.querySelector('i');
+
+  if (icon.classList.contains('bi-bookmark')) {
+    icon.classList.remove('bi-bookmark');
+    icon.classList.add('bi-bookmark-fill');
+    button.classList.remove('btn-outline-primary');
+    button.classList.add('btn-primary');
+
+    // Show saved message
+    showToast('Job saved to your bookmarks!', 'success');
+  } else {
+    icon.classList.remove('bi-bookmark-fill');
+    icon.classList.add('bi-bookmark');
+    button.classList.remove('btn-primary');
+    button.classList.add('btn-outline-primary');
+
+    // Show removed message
+    showToast('Job removed from bookmarks', 'info');
+  }
+}
+
+// Helper function to show toast messages
+function showToast(message, type) {
+  const bgClass = type === 'success' ? 'bg-success' : 'bg-info';
+  const toast = document.createElement('div');
+  toast.className = `toast align-items-center text-white ${bgClass} border-0 position-fixed`;
+  toast.style.cssText = 'top: 20px; right: 20px; z-index: 9999;';
+  toast.innerHTML = `
+    <div class="d-flex">
+      <div class="toast-body">
+        <i class="bi bi-info-circle me-2"></i>
+        ${message}
+      </div>
+      <button type="button" class="btn-close btn-close-white me-2 m-auto" data-bs-dismiss="toast"></button>
+    </div>
+  `;
+
+  document.body.appendChild(toast);
+  const bsToast = new bootstrap.Toast(toast);
+  bsToast.show();
+
+  toast.addEventListener('hidden.bs.toast', () => {
+    document.body.removeChild(toast);
+  });
+}
+
+// Real-time search functionality
+document.getElementById('searchInput').addEventListener('input', filterJobs);
+
+// Sidebar navigation
+document.querySelectorAll('.sidebar a').forEach(link => {
+  link.addEventListener('click', function(e) {
+    // Only intercept placeholder links (href === '#') to keep visual feedback
+    const href = this.getAttribute('href');
+    if (href === '#' || !href) {
+      e.preventDefault();
+
+      // Remove active class from all links
+      document.querySelectorAll('.sidebar a').forEach(l => l.classList.remove('active'));
+
+      // Add active class to clicked link
+      this.classList.add('active');
+
+      // Show navigation message
+      const pageName = this.textContent.trim();
+      if (pageName !== 'Dashboard') {
+        showToast(`Navigating to ${pageName}...`, 'info');
+      }
+    } else {
+      // For real links, allow normal navigation: add active class briefly
+      document.querySelectorAll('.sidebar a').forEach(l => l.classList.remove('active'));
+      this.classList.add('active');
+      // Let the browser follow the link (no preventDefault)
+    }
+  });
+});
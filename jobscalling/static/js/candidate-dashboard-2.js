@@ -0,0 +1,11 @@
+function saveJob(button) {
+  button.classList.toggle("btn-outline-primary");
+  button.classList.toggle("btn-success");
+  button.innerHTML = button.classList.contains("btn-success")
+    ? '<i class="bi bi-bookmark-check"></i>'
+    : '<i class="bi bi-bookmark"></i>';
+}
+
+function applyJob(title) {
+  alert(`You have applied for: ${title}`);
+}
@@ -0,0 +1,130 @@
+// Particle System
+function createParticles() {
+  const particlesContainer = document.getElementById('particles');
+
+  function createParticle() {
+   const particle = document.createElement('div');
+   particle.className = 'particle';
+
+     Random size between 2-6px
+  const size = Math.random() * 4 + 2;
+    particle.style.width = size + 'px';
+    particle.style.height = size + 'px';
+
+     Random horizontal position
+    particle.style.left = Math.random() * 100 + '%';
+
+     Random animation duration
+    particle.style.animationDuration = (Math.random() * 10 + 10) + 's';
+
+     Random delay
+    particle.style.animationDelay = Math.random() * 5 + 's';
+
+    particlesContainer.appendChild(particle);
+
+     Remove particle after animation
+    setTimeout(() => {
+      if (particle.parentNode) {
+       particle.parentNode.removeChild(particle);
+      }
+    }, 20000);
+cdn.jsdelivr.net/npm/bootstrap  }
+
+   Create initial particles
+  for (let i = 0; i < 15; i++) {
+   setTimeout(createParticle, i * 200);
+  }
+
+   Continue creating particles
+  setInterval(createParticle, 800);
+}
+
+// Form Validation and Submission
+document.getElementById('signupForm').addEventListener('submit', function(e) {
+  // perform client-side validation and only submit if valid
+  const submitBtn = document.getElementById('submitBtn');
+  const btnText = document.getElementById('btnText');
+
+  // Get form values
+  const fullName = document.getElementById('fullName').value.trim();
+  const email = document.getElementById('email').value.trim();
+  const password = document.getElementById('password').value;
+  const confirmPassword = document.getElementById('confirmPassword').value;
+  const terms = document.getElementById('terms').checked;
+
+  // Basic Validation
+  if (!fullName || !email || !password || !confirmPassword) {
+    e.preventDefault();
+    showNotification('Please fill in all fields', 'error');
+    return;
+  }
+
+  if (password !== confirmPassword) {
+    e.preventDefault();
+    showNotification('Passwords do not match', 'error');
+    return;
+  }
+
+  if (password.length < 6) {
+    e.preventDefault();
+    showNotification('Password must be at least 6 characters', 'error');
+    return;
+  }
+
+  if (!terms) {
+    e.preventDefault();
+    showNotification('Please accept the terms and conditions', 'error');
+    return;
+  }
+
+  // If we reach here, allow the form to submit to the backend
+  // Show loading state while the request is in-flight
+  btnText.innerHTML = '<div class="loading-spinner"></div>Processing...';
+  submitBtn.disabled = true;
+
+  // Note: don't call e.preventDefault(); we want the browser to submit the form
+});
+
+// Notification System
+function showNotification(message, type = 'info') {
+  const notification = document.createElement('div');
+  notification.className = `fixed top-4 right-4 p-4 rounded-xl z-50 transition-all duration-300 transform translate-x-full`;
+
+  if (type === 'error') {
+    notification.className += ' bg-red-500/20 border border-red-400/30 text-red-300';
+  } else {
+    notification.className += ' bg-blue-500/20 border border-blue-400/30 text-blue-300';
+  }
+
+  notification.textContent = message;
+  document.body.appendChild(notification);
+
+  // Animate in
+  setTimeout(() => {
+    notification.classList.remove('translate-x-full');
+  }, 100);
+
+  // Remove after 3 seconds
+  setTimeout(() => {
+    notification.classList.add('translate-x-full');
+    setTimeout(() => {
+      if (notification.parentNode) {
+        notification.parentNode.removeChild(notification);
+      }
+    }, 300);
+  }, 3000);
+}
+
+// Input Focus Effects
+document.querySelectorAll('.modern-input').forEach(input => {
+  input.addEventListener('focus', function() {
+    this.parentElement.style.transform = 'scale(1.02)';
+  });
+
+  input.addEventListener('blur', function() {
+    this.parentElement.style.transform = 'scale(1)';
+  });
+});
+
+// Initialize particles when page loads
+document.addEventListener('DOMContentLoaded', createParticles);
@@ -0,0 +1,12 @@
+const particlesContainer = document.getElementById('particles');
+const colors = ['#0ff','#f0f','#ff0','#0f0','#fff'];
+for(let i=0;i<50;i++){
+  const p=document.createElement('div');
+  p.classList.add('particle');
+  p.style.width=p.style.height=(Math.random()*4+2)+'px';
+  p.style.top=Math.random()*100+'%';
+  p.style.left=Math.random()*100+'%';
+  p.style.background=colors[Math.floor(Math.random()*colors.length)];
+  p.style.animationDuration=(Math.random()*10+5)+'s';
+  particlesContainer.appendChild(p);
+}
@@ -0,0 +1,40 @@
+// Client-side filtering for quick UX
+(function(){
+    const searchInput = document.getElementById('jobSearch');
+    const typeSelect = document.getElementById('filterType');
+    const statusSelect = document.getElementById('filterStatus');
+    const jobs = Array.from(document.querySelectorAll('#jobsContainer > div'));
+
+    function filter() {
+        const q = searchInput.value.trim().toLowerCase();
+        const type = typeSelect.value;
+        const status = statusSelect.value;
+
+        let visible = 0;
+        jobs.forEach(card => {
+            const title = card.dataset.title || '';
+            const location = card.dataset.location || '';
+            const cardType = card.dataset.type || '';
+            const cardStatus = card.dataset.status || '';
+
+            const matchesQuery = !q || title.includes(q) || location.includes(q);
+            const matchesType = !type || cardType === type;
+            const matchesStatus = !status || cardStatus === status;
+
+            if (matchesQuery && matchesType && matchesStatus) {
+                card.style.display = '';
+                visible++;
+            } else {
+                card.style.display = 'none';
+            }
+        });
+
+        // Show empty state if none
+        const empty = document.getElementById('jobsEmptyState');
+        if (empty) empty.style.display = visible === 0 ? 'block' : 'none';
+    }
+
+    searchInput.addEventListener('input', filter);
+    typeSelect.addEventListener('change', filter);
+    statusSelect.addEventListener('change', filter);
+})();
@@ -0,0 +1,2 @@
+// Initialize lucide icons
+lucide.createIcons();
@@ -0,0 +1,86 @@
+// Password toggle functionality
+document.getElementById('togglePassword').addEventListener('click', function() {
+  const passwordInput = document.getElementById('password');
+  const eyeIcon = document.getElementById('eyeIcon');
+
+  if (passwordInput.type === 'password') {
+    passwordInput.type = 'text';
+    eyeIcon.innerHTML = `
+      <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.875 18.825A10.05 10.05 0 0112 19c-4.478 0-8.268-2.943-9.543-7a9.97 9.97 0 011.563-3.029m5.858.908a3 3 0 114.243 4.243M9.878 9.878l4.242 4.242M9.878 9.878L3 3m6.878 6.878L21 21"></path>
+    `;
+  } else {
+    passwordInput.type = 'password';
+    eyeIcon.innerHTML = `
+      <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 12a3 3 0 11-6 0 3 3 0 016 0z"></path>
+      <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"></path>
+    `;
+  }
+});
+
+// Form submission handler: validate then allow normal POST so backend redirects
+document.getElementById('signinForm').addEventListener('submit', function(e) {
+  const submitButton = e.target.querySelector('button[type="submit"]');
+  const email = document.getElementById('email').value.trim();
+  const password = document.getElementById('password').value;
+
+  // Basic validation
+  if (!email || !password) {
+    e.preventDefault();
+    // show a lightweight inline message using the existing UI
+    alert('Please fill in both email and password');
+    return;
+  }
+
+  // Show a loading state and allow the browser to submit the form
+  submitButton.innerHTML = 'Signing In...';
+  submitButton.disabled = true;
+  // do not call e.preventDefault() here — let the form POST to the server
+});
+
+// Enhanced floating label behavior
+document.querySelectorAll('.input-group input').forEach(input => {
+  input.addEventListener('focus', function() {
+    this.parentElement.classList.add('focused');
+  });
+
+  input.addEventListener('blur', function() {
+    if (!this.value) {
+      this.parentElement.classList.remove('focused');
+    }
+  });
+});
+
+// Form validation feedback
+document.querySelectorAll('input[required]').forEach(field => {
+  field.addEventListener('blur', function() {
+    if (this.value.trim() === '') {
+      this.classList.add('border-red-300');
+      this.classList.remove('border-gray-200');
+    } else {
+      this.classList.remove('border-red-300');
+      this.classList.add('border-green-300');
+    }
+  });
+});
+
+// Social login handlers
+document.querySelectorAll('.social-btn').forEach(btn => {
+  btn.addEventListener('click', function() {
+    const provider = this.textContent.trim();
+    console.log(`Initiating ${provider} login...`);
+
+    // Simulate social login
+    this.innerHTML = `
+      <svg class="animate-spin h-4 w-4 mr-2" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
+        <circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle>
+        <path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
+      </svg>
+      Connecting...
+    `;
+
+    setTimeout(() => {
+      this.innerHTML = `${provider} - Connected!`;
+      this.classList.add('bg-green-50', 'border-green-300', 'text-green-700');
+    }, 1500);
+  });
+});
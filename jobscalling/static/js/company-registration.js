@@ -0,0 +1,21 @@
+document.getElementById('companyForm').addEventListener('submit', function (e) {
+  const form = e.target;
+  if (!form.checkValidity()) return;
+
+  const submitButton = form.querySelector('button[type="submit"]');
+  submitButton.textContent = 'Creating Account...';
+  submitButton.disabled = true;
+});
+
+// Input feedback colors
+document.querySelectorAll('input[required], select[required]').forEach(field => {
+  field.addEventListener('blur', function () {
+    if (this.value.trim() === '') {
+      this.classList.add('border-red-300');
+      this.classList.remove('border-gray-200');
+    } else {
+      this.classList.remove('border-red-300');
+      this.classList.add('border-green-300');
+    }
+  });
+});
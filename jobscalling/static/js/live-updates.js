@@ -0,0 +1,39 @@
+// Live updates pushed by the server (home/events.py) instead of page refreshes.
+// The page opts in with an element carrying data-events-url; optional
+// data-job-id limits new-application notices to one job.
+(function () {
+  const banner = document.getElementById("live-updates");
+  if (!banner || !window.EventSource) return;
+
+  const jobId = banner.dataset.jobId ? Number(banner.dataset.jobId) : null;
+  const source = new EventSource(banner.dataset.eventsUrl);
+  let newApplications = 0;
+
+  function notify(text) {
+    banner.querySelector("[data-live-text]").textContent = text;
+    banner.hidden = false;
+  }
+
+  source.addEventListener("application.new", function (event) {
+    const data = JSON.parse(event.data);
+    if (jobId !== null && data.job_id !== jobId) return;
+    newApplications += 1;
+    const counter = document.getElementById("stat-applications");
+    if (counter) counter.textContent = Number(counter.textContent) + 1;
+    notify(newApplications === 1
+      ? `New application from ${data.candidate_name} for ${data.job_title}.`
+      : `${newApplications} new applications.`);
+  });
+
+  source.addEventListener("application.status", function (event) {
+    const data = JSON.parse(event.data);
+    const badge = document.querySelector(`[data-application-status="${data.application_id}"]`);
+    if (badge) {
+      badge.textContent = data.status_display;
+      badge.className = "badge bg-info";
+    }
+    if (badge || jobId === null || data.job_id === jobId) {
+      notify(`${data.job_title}: application is now "${data.status_display}".`);
+    }
+  });
+})();
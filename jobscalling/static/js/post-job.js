@@ -0,0 +1,19 @@
+// Simple client-side validation example (optional)
+const jobForm = document.getElementById('jobPostingForm');
+const postBtn = document.getElementById('postJobBtn');
+jobForm.addEventListener('submit', function(event) {
+    const minSalary = document.getElementById('id_min_salary').value;
+    const maxSalary = document.getElementById('id_max_salary').value;
+
+    if (minSalary && maxSalary && parseInt(minSalary) > parseInt(maxSalary)) {
+        event.preventDefault();
+        alert("The Minimum Salary cannot be greater than the Maximum Salary.");
+    }
+    // prevent double submit
+    if (postBtn) {
+        postBtn.disabled = true;
+        postBtn.innerText = 'Posting...';
+    }
+
+    // Note: Django handles actual form validation on the server side
+});
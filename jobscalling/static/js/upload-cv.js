@@ -0,0 +1,139 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('cvUploadForm');
+    const fileInput = document.getElementById('cvFile');
+    const dropArea = document.getElementById('dropArea');
+    const fileNameDisplay = document.getElementById('fileNameDisplay');
+    const alertMessage = document.getElementById('alertMessage');
+
+    const MAX_FILE_SIZE = 5 * 1024 * 1024; // 5MB in bytes
+
+    // --- 1. Handle File Selection Click ---
+    dropArea.addEventListener('click', () => {
+        fileInput.click();
+    });
+
+    // --- 2. Validation & Display Logic ---
+    fileInput.addEventListener('change', function() {
+        const file = this.files[0];
+        alertMessage.classList.add('hidden'); // Hide previous alerts
+        dropArea.style.borderColor = '#0d6efd'; // Reset border
+
+        if (file) {
+            // File Size Validation
+            if (file.size > MAX_FILE_SIZE) {
+                alertMessage.textContent = `❌ Error: File size (${(file.size / 1024 / 1024).toFixed(2)} MB) exceeds the 5MB limit.`;
+                alertMessage.className = 'mt-4 p-3 rounded text-center bg-danger-subtle text-danger';
+                alertMessage.classList.remove('hidden');
+                this.value = ''; // Clear the input
+                fileNameDisplay.classList.add('hidden');
+                dropArea.style.borderColor = 'red';
+                return;
+            }
+
+            // File Type Validation (Optional, done by 'accept' attribute too)
+            const allowedTypes = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'];
+            if (!allowedTypes.includes(file.type)) {
+                alertMessage.textContent = `❌ Error: Invalid file type. Only PDF and DOCX are allowed.`;
+                alertMessage.className = 'mt-4 p-3 rounded text-center bg-danger-subtle text-danger';
+                alertMessage.classList.remove('hidden');
+                this.value = ''; // Clear the input
+                fileNameDisplay.classList.add('hidden');
+                dropArea.style.borderColor = 'red';
+                return;
+            }
+
+            // Success: Display file name
+            fileNameDisplay.innerHTML = `Selected file: <strong>${file.name}</strong>`;
+            fileNameDisplay.classList.remove('hidden');
+            dropArea.style.borderColor = 'green';
+
+        } else {
+            // No file selected (e.g., user opened and closed the dialog)
+            fileNameDisplay.classList.add('hidden');
+        }
+    });
+
+    // --- 3. Drag and Drop Events ---
+
+    ['dragenter', 'dragover', 'dragleave', 'drop'].forEach(eventName => {
+        dropArea.addEventListener(eventName, preventDefaults, false);
+    });
+
+    function preventDefaults(e) {
+        e.preventDefault();
+        e.stopPropagation();
+    }
+
+    // Highlight drop area
+    ['dragenter', 'dragover'].forEach(eventName => {
+        dropArea.addEventListener(eventName, () => dropArea.classList.add('bg-light'), false);
+    });
+
+    // Remove highlight
+    ['dragleave', 'drop'].forEach(eventName => {
+        dropArea.addEventListener(eventName, () => dropArea.classList.remove('bg-light'), false);
+    });
+
+    // Handle file drop
+    dropArea.addEventListener('drop', handleDrop, false);
+
+    function handleDrop(e) {
+        let dt = e.dataTransfer;
+        let files = dt.files;
+
+        // Assign the dropped file to the hidden input
+        fileInput.files = files; 
+
+        // Manually trigger the 'change' event to run validation/display logic
+        fileInput.dispatchEvent(new Event('change'));
+    }
+
+    // --- 4. Form Submission ---
+    // Validate client-side then allow normal form POST to the Django view
+    form.addEventListener('submit', function(e) {
+        // Clear previous alerts
+        alertMessage.classList.add('hidden');
+
+        if (fileInput.files.length === 0) {
+            e.preventDefault();
+            alertMessage.textContent = '⚠️ Please select a CV file to upload.';
+            alertMessage.className = 'mt-4 p-3 rounded text-center bg-warning-subtle text-warning';
+            alertMessage.classList.remove('hidden');
+            return false;
+        }
+
+        const file = fileInput.files[0];
+        if (!file) {
+            e.preventDefault();
+            alertMessage.textContent = '⚠️ Please select a CV file to upload.';
+            alertMessage.className = 'mt-4 p-3 rounded text-center bg-warning-subtle text-warning';
+            alertMessage.classList.remove('hidden');
+            return false;
+        }
+
+        // Re-validate size and type before submit
+        if (file.size > MAX_FILE_SIZE) {
+            e.preventDefault();
+            alertMessage.textContent = `❌ Error: File size (${(file.size / 1024 / 1024).toFixed(2)} MB) exceeds the 5MB limit.`;
+            alertMessage.className = 'mt-4 p-3 rounded text-center bg-danger-subtle text-danger';
+            alertMessage.classList.remove('hidden');
+            return false;
+        }
+
+        const allowedTypes = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'];
+        if (!allowedTypes.includes(file.type)) {
+            e.preventDefault();
+            alertMessage.textContent = `❌ Error: Invalid file type. Only PDF and DOCX are allowed.`;
+            alertMessage.className = 'mt-4 p-3 rounded text-center bg-danger-subtle text-danger';
+            alertMessage.classList.remove('hidden');
+            return false;
+        }
+
+        // If we reach here, client-side validation passed and the browser will perform the POST
+        // Optionally, show a simple uploading indicator (non-simulated)
+        alertMessage.textContent = 'Uploading... Please wait.';
+        alertMessage.className = 'mt-4 p-3 rounded text-center bg-info-subtle text-info';
+        alertMessage.classList.remove('hidden');
+        return true;
+    });
+});